@@ -0,0 +1,116 @@
+"""Compare TTS decoder backends: first-chunk latency and CPU per second of audio.
+
+Usage (from backend/):
+    python scripts/bench_decoders.py --mp3 path/to/sample.mp3
+    python scripts/bench_decoders.py --text "Hello, tell me about yourself."
+"""
+import argparse
+import asyncio
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.services.audio_decoder import FfmpegDecoderPool, PyAVDecoder  # noqa: E402
+
+
+async def synthesize(text: str, voice: str) -> bytes:
+    import edge_tts
+
+    communicate = edge_tts.Communicate(text, voice)
+    data = bytearray()
+    async for message in communicate.stream():
+        if message.get("type") == "audio":
+            data.extend(message["data"])
+    return bytes(data)
+
+
+async def mp3_source(data: bytes, chunk_bytes: int):
+    for offset in range(0, len(data), chunk_bytes):
+        yield data[offset : offset + chunk_bytes]
+
+
+def cpu_seconds() -> float:
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+async def bench(decoder, data: bytes, runs: int, sample_rate: int, channels: int) -> dict:
+    await decoder.start()
+    first_chunk_ms: list[float] = []
+    pcm_bytes = 0
+    cpu_start = cpu_seconds()
+    wall_start = time.perf_counter()
+    for _ in range(runs):
+        start = time.perf_counter()
+        first = True
+        async for chunk in decoder.decode(mp3_source(data, 4096)):
+            if first:
+                first_chunk_ms.append((time.perf_counter() - start) * 1000)
+                first = False
+            pcm_bytes += len(chunk)
+    await decoder.close()
+    wall = time.perf_counter() - wall_start
+    cpu = cpu_seconds() - cpu_start
+    audio_s = pcm_bytes / (sample_rate * channels * 2)
+    return {
+        "backend": decoder.name,
+        "runs": runs,
+        "first_chunk_ms_p50": round(statistics.median(first_chunk_ms), 2),
+        "first_chunk_ms_max": round(max(first_chunk_ms), 2),
+        "audio_s": round(audio_s, 2),
+        "wall_s": round(wall, 3),
+        "cpu_ms_per_audio_s": round(cpu / audio_s * 1000, 3) if audio_s else None,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mp3", help="mp3 file to decode")
+    parser.add_argument("--text", default="Hi, I'm Amanda. Let's start the interview now.")
+    parser.add_argument("--voice", default="en-US-JennyNeural")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--sample-rate", type=int, default=24000)
+    parser.add_argument("--channels", type=int, default=1)
+    parser.add_argument("--prewarm", type=int, default=2)
+    args = parser.parse_args()
+
+    if args.mp3:
+        with open(args.mp3, "rb") as handle:
+            data = handle.read()
+    else:
+        data = await synthesize(args.text, args.voice)
+        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as handle:
+            handle.write(data)
+            print(f"Synthesized sample: {handle.name} ({len(data)} bytes)")
+
+    from imageio_ffmpeg import get_ffmpeg_exe
+
+    decoders = [
+        FfmpegDecoderPool(
+            get_ffmpeg_exe(),
+            sample_rate=args.sample_rate,
+            num_channels=args.channels,
+            max_workers=1,
+            prewarm=args.prewarm,
+            job_timeout_s=30,
+            chunk_bytes=8192,
+        )
+    ]
+    try:
+        decoders.append(PyAVDecoder(sample_rate=args.sample_rate, num_channels=args.channels))
+    except RuntimeError as exc:
+        print(f"Skipping PyAV backend: {exc}")
+
+    for decoder in decoders:
+        result = await bench(decoder, data, args.runs, args.sample_rate, args.channels)
+        print(result)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -12,6 +12,7 @@ from ..models.job import Job
 from ..models.resume import Resume
 from ..services.resume_matcher import resume_matcher
 from ..services.interview_question_generator import question_generator
+from ..services.question_bank import question_bank_service
 
 logger = logging.getLogger(__name__)
 
@@ -298,6 +299,70 @@ async def get_default_question(
     }
 
 
+@router.post("/question-banks")
+async def build_question_banks(
+    job_ids: Optional[List[str]] = None,
+    force: bool = False,
+    db: Session = Depends(get_db)
+):
+    """Build ranked, pre-synthesized question banks for several jobs (all jobs by default)"""
+    if job_ids:
+        jobs = db.query(Job).filter(Job.id.in_(job_ids)).all()
+    else:
+        jobs = db.query(Job).all()
+
+    if not jobs:
+        raise HTTPException(status_code=404, detail="No jobs found")
+
+    results = await question_bank_service.build_many(
+        [job.to_dict() for job in jobs],
+        force=force
+    )
+
+    logger.info(f"Built question banks for {len(results)} jobs")
+
+    return {
+        "totalJobs": len(results),
+        "results": results
+    }
+
+
+@router.post("/{job_id}/question-bank")
+async def build_question_bank(
+    job_id: str,
+    force: bool = False,
+    db: Session = Depends(get_db)
+):
+    """Generate the ranked question bank for a job and pre-synthesize its audio"""
+    job = db.query(Job).filter(Job.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    try:
+        questions = await question_bank_service.build(job.to_dict(), force=force)
+    except Exception as e:
+        logger.error(f"Failed to build question bank for job {job_id}: {e}")
+        raise HTTPException(status_code=502, detail=str(e))
+
+    return {
+        "jobId": job_id,
+        "questions": questions
+    }
+
+
+@router.get("/{job_id}/question-bank")
+async def get_question_bank(job_id: str):
+    """Get the stored question bank for a job"""
+    questions = await question_bank_service.get(job_id)
+    if not questions:
+        raise HTTPException(status_code=404, detail="No question bank for this job")
+
+    return {
+        "jobId": job_id,
+        "questions": questions
+    }
+
+
 @router.post("/seed")
 async def seed_initial_jobs(db: Session = Depends(get_db)):
     """Clear existing jobs and seed with 3 new T-Mobile job postings"""
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
+import math
 import time
 import logging
 
@@ -10,8 +11,19 @@ from ..models.schemas import (
     StreamStatus,
     HealthResponse,
 )
+from ..services.admission import AdmissionRejected, admission_controller
 from ..services.agent import agent_service
+from ..services.drain import drain_controller
+from ..services.audio_pacing import pacing_metrics
+from ..services.filler_audio import filler_audio
+from ..services.jitter_buffer import jitter_buffers
 from ..services.livekit_service import livekit_service
+from ..services.llm_budget import llm_budget
+from ..services.llm_client import llm_client
+from ..services.openai_tts_service import openai_tts_service
+from ..services.session_reaper import session_reaper
+from ..services.session_store import FORWARDED_HEADER, RoomOwnedError, room_leases
+from ..services.tts_warmup import tts_warmup_service
 from ..config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -19,11 +31,42 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+async def _forward_to_owner(
+    http_request: Request, room_name: str, body: dict | None = None
+) -> Response | None:
+    """Proxy the call to the worker holding the room's lease when that is another worker."""
+    if agent_service.get_session_status(room_name) or http_request.headers.get(FORWARDED_HEADER):
+        return None
+    owner = await room_leases.remote_owner(room_name)
+    if owner is None:
+        return None
+    logger.info(f"Forwarding {http_request.url.path} for room {room_name} to {owner}")
+    upstream = await room_leases.forward(owner, http_request.method, http_request.url.path, body)
+    retry_after = upstream.headers.get("retry-after")
+    return Response(
+        content=upstream.content,
+        status_code=upstream.status_code,
+        media_type=upstream.headers.get("content-type"),
+        headers={"Retry-After": retry_after} if retry_after else None,
+    )
+
+
+def _rejected(e: AdmissionRejected, message: str) -> HTTPException:
+    detail = {"message": message, "reason": e.reason}
+    if e.queue_position is not None:
+        detail["queue_position"] = e.queue_position
+    return HTTPException(
+        status_code=e.status_code,
+        detail=detail,
+        headers={"Retry-After": str(max(1, math.ceil(e.retry_after_s)))},
+    )
+
+
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint"""
     return HealthResponse(
-        status="healthy",
+        status="healthy" if drain_controller.state == "serving" else drain_controller.state,
         version="0.1.0",
         services={
             "livekit": "configured" if livekit_service.api_key else "not_configured",
@@ -35,6 +78,100 @@ async def health_check():
     )
 
 
+@router.get("/tts/cache")
+async def tts_cache_stats():
+    """TTS cache occupancy and hit/miss/eviction counters"""
+    return openai_tts_service.cache_stats()
+
+
+@router.get("/tts/decoder")
+async def tts_decoder_stats():
+    """ffmpeg decoder pool utilisation and queue depth"""
+    return openai_tts_service.decoder_stats()
+
+
+@router.get("/llm/stats")
+async def llm_stats():
+    """LLM client concurrency, queue wait and latency"""
+    return llm_client.stats()
+
+
+@router.get("/llm/budget")
+async def llm_budget_stats():
+    """Turn latency budget: misses, hedges, hedge wins, fallbacks and recent events"""
+    return llm_budget.stats()
+
+
+@router.get("/tts/filler")
+async def tts_filler_stats():
+    """Thinking-filler clips: loaded, played and cut short by the real reply"""
+    return filler_audio.stats()
+
+
+@router.get("/sessions/store")
+async def session_store_stats():
+    """Shared session store: this worker's leases, forwarded calls and known rooms"""
+    return {**room_leases.stats(), "rooms": await room_leases.store.list_sessions()}
+
+
+@router.get("/capacity")
+async def capacity():
+    """Admission headroom: limit/used/free per resource, queue and rejection counts"""
+    return admission_controller.stats()
+
+
+@router.get("/sessions/reaper")
+async def session_reaper_stats():
+    """Idle-session reaper: sweeps, reclaimed sessions, teardowns past the deadline"""
+    return session_reaper.stats()
+
+
+@router.get("/agent/speculation")
+async def speculation_stats():
+    """Speculative next-question prefetch: drafted, used, discarded and failed counts"""
+    return {
+        "enabled": settings.speculative_prefetch_enabled,
+        "max_per_session": settings.speculative_max_per_session,
+        **agent_service.speculation_totals,
+    }
+
+
+@router.post("/admin/tts/warmup", status_code=202)
+async def start_tts_warmup():
+    """Pre-synthesize known phrases (finish message, greetings, job questions) into the TTS cache"""
+    if not tts_warmup_service.start():
+        raise HTTPException(status_code=409, detail="TTS warm-up already running")
+    return tts_warmup_service.status()
+
+
+@router.post("/admin/drain")
+async def drain():
+    """Stop admitting sessions, let running turns finish, end all rooms; returns phase timings"""
+    return await drain_controller.drain()
+
+
+@router.get("/admin/drain")
+async def get_drain_status():
+    """Drain state (serving / draining / drained) and the last drain report"""
+    return drain_controller.status()
+
+
+@router.delete("/admin/drain")
+async def resume_after_drain():
+    """Accept new sessions again after a drain"""
+    try:
+        drain_controller.resume()
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return drain_controller.status()
+
+
+@router.get("/admin/tts/warmup")
+async def get_tts_warmup_status():
+    """Progress of the current or last TTS warm-up run"""
+    return tts_warmup_service.status()
+
+
 @router.post("/rooms/create", response_model=RoomCreateResponse)
 async def create_room(request: RoomCreateRequest):
     """
@@ -42,10 +179,12 @@ async def create_room(request: RoomCreateRequest):
     Returns access token for the client to connect.
     """
     try:
-        session = await agent_service.create_session(
-            room_name=request.room_name,
-            participant_name=request.participant_name,
-        )
+        async with admission_controller.admit_session(request.room_name):
+            session = await agent_service.create_session(
+                room_name=request.room_name,
+                participant_name=request.participant_name,
+                job_id=request.job_id,
+            )
 
         logger.info(
             "Room created via API: room=%s url=%s token_set=%s",
@@ -66,17 +205,27 @@ async def create_room(request: RoomCreateRequest):
             use_tavus=session.get("use_tavus", False),
         )
         
+    except AdmissionRejected as e:
+        raise _rejected(e, str(e))
+    except RoomOwnedError as e:
+        raise HTTPException(status_code=409, detail={"message": str(e), "owner": e.owner})
     except Exception as e:
         logger.error(f"Failed to create room: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/say", response_model=SayResponse)
-async def say_text(request: SayRequest):
+async def say_text(request: SayRequest, http_request: Request):
     """
     Receive text and publish TTS audio into the LiveKit room.
+    Calls for a room owned by another worker are forwarded to it; while draining, new
+    turns are refused with 503 and Retry-After.
     """
     try:
+        forwarded = await _forward_to_owner(http_request, request.room_name, request.model_dump())
+        if forwarded is not None:
+            return forwarded
+        drain_controller.check_turn()
         t0_ms = time.time() * 1000
         logger.info("Say request received room=%s text=%s", request.room_name, request.text)
         result = await agent_service.say_text(
@@ -89,6 +238,8 @@ async def say_text(request: SayRequest):
             response=result.get("response", ""),
             t0_ms=t0_ms,
         )
+    except AdmissionRejected as e:
+        raise _rejected(e, f"Not accepting new turns: {e.reason}")
     except Exception as e:
         logger.error(f"Failed to say text: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -109,6 +260,7 @@ async def get_room_status(room_name: str):
             room_name=room_name,
             status="active",
             participants=room_info.get("num_participants", 0) if room_info else 0,
+            session_state=session.state.value,
         )
 
     except HTTPException:
@@ -118,10 +270,49 @@ async def get_room_status(room_name: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/rooms/{room_name}/audio-stats")
+async def get_room_audio_stats(room_name: str):
+    """Audio pacing telemetry for a room: late frames, underruns, pre-buffer depth"""
+    if not agent_service.get_session_status(room_name):
+        raise HTTPException(status_code=404, detail="Room not found")
+    return {
+        "room_name": room_name,
+        "pacing": pacing_metrics.snapshot(room_name),
+        "jitter": jitter_buffers.snapshot(room_name),
+    }
+
+
+@router.post("/rooms/{room_name}/interrupt")
+async def interrupt_room(room_name: str, http_request: Request):
+    """Barge-in: stop the avatar's current reply and report time to silence"""
+    try:
+        forwarded = await _forward_to_owner(http_request, room_name)
+        if forwarded is not None:
+            return forwarded
+        return await agent_service.interrupt(room_name)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to interrupt room: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/rooms/{room_name}/startup")
+async def get_room_startup_timings(room_name: str):
+    """Per-stage session startup timings (ms since create): room, avatar, publisher, greeting"""
+    session = agent_service.get_session_status(room_name)
+    if not session:
+        raise HTTPException(status_code=404, detail="Room not found")
+    return {"room_name": room_name, "timings": session.startup_timings}
+
+
 @router.delete("/rooms/{room_name}")
-async def end_room(room_name: str):
+async def end_room(room_name: str, http_request: Request):
     """End a room/session"""
     try:
+        forwarded = await _forward_to_owner(http_request, room_name)
+        if forwarded is not None:
+            return forwarded
         success = await agent_service.end_session(room_name)
         
         if not success:
@@ -167,11 +358,22 @@ async def websocket_endpoint(websocket: WebSocket, room_name: str):
         # Listen for messages
         while True:
             data = await websocket.receive_json()
+            session.touch()
             message_type = data.get("type")
             
             if message_type == "message":
                 user_message = data.get("message", "")
                 logger.info("***WebSocket message received for room=%s***", room_name)
+
+                try:
+                    drain_controller.check_turn()
+                except AdmissionRejected as e:
+                    await websocket.send_json({
+                        "type": "error",
+                        "message": f"Not accepting new turns: {e.reason}",
+                        "retry_after_s": e.retry_after_s,
+                    })
+                    continue
                 
                 # Send acknowledgment
                 await websocket.send_json({
@@ -10,6 +10,37 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
     debug: bool = True
+    # Shared session store for multiple workers: "memory" (single worker) | "redis"
+    session_store_backend: str = "memory"
+    session_store_url: str = "redis://localhost:6379/0"
+    session_store_prefix: str = "interview"
+    # URL other workers use to reach this one; rooms are only forwarded when it is set
+    worker_url: str = ""
+    session_lease_ttl_s: float = 30.0
+    session_forward_timeout_s: float = 30.0
+    # WORKERS > 1: run that many worker processes behind a room-sharded front router
+    workers: int = 1
+    worker_host: str = "127.0.0.1"
+    worker_base_port: int = 8100
+    worker_shutdown_timeout_s: float = 30.0
+    # Idle-session reaper (0 disables it)
+    session_idle_ttl_s: float = 300.0
+    session_reaper_interval_s: float = 30.0
+    session_reaper_concurrency: int = 16
+    session_reaper_deadline_s: float = 20.0
+    # Admission control for new sessions (0 = no limit); sessions -> 429, others -> 503
+    admission_max_sessions: int = 50
+    admission_max_decodes: int = 32
+    admission_max_llm_calls: int = 64
+    admission_retry_after_s: float = 5.0
+    # Arrivals may wait this long in a FIFO queue of this size before being rejected
+    admission_queue_max: int = 0
+    admission_queue_timeout_s: float = 10.0
+    admission_queue_poll_s: float = 0.25
+    # Graceful drain (shutdown / POST /api/admin/drain)
+    drain_turn_deadline_s: float = 10.0
+    drain_teardown_deadline_s: float = 20.0
+    drain_concurrency: int = 32
     
     # LiveKit Configuration
     livekit_url: str = "ws://localhost:7880"
@@ -26,6 +57,20 @@ class Settings(BaseSettings):
     openai_tts_channels: int = 1
     openai_tts_frame_ms: int = 20
     openai_tts_chunk_bytes: int = 8192
+    audio_pacing_lead_ms: int = 200
+    # Adaptive pre-buffer before an utterance starts: "low_latency" | "smooth"
+    jitter_policy: str = "low_latency"
+    jitter_min_ms: int = 0
+    jitter_max_ms: int = 600
+    jitter_step_ms: int = 60
+    # "Thinking" filler played while the first reply audio is pending (LiveKit path)
+    filler_enabled: bool = False
+    filler_phrases: list[str] = ["Mm-hm.", "Let me think.", "Okay."]
+    filler_delay_ms: int = 150
+    filler_fade_ms: int = 30
+    # Barge-in
+    interrupt_fade_ms: int = 20
+    interrupt_cancel_timeout_s: float = 1.0
 
     # Edge TTS Configuration
     edge_tts_voice: str = "zh-CN-XiaoxiaoNeural"
@@ -33,9 +78,62 @@ class Settings(BaseSettings):
     edge_tts_volume: str = "+0%"
     edge_tts_pitch: str = "+0Hz"
 
+    # TTS cache
+    tts_memory_cache_bytes: int = 64 * 1024 * 1024
+    tts_memory_cache_max_entry_bytes: int = 4 * 1024 * 1024
+    tts_pcm_cache_enabled: bool = True
+    tts_pcm_cache_max_entry_bytes: int = 16 * 1024 * 1024
+    tts_cache_max_bytes: int = 2 * 1024 * 1024 * 1024
+    tts_cache_max_entries: int = 50000
+    tts_cache_evict_interval_s: float = 60.0
+    # Workers sharing one cache directory must leave eviction to a single process.
+    tts_cache_evict_enabled: bool = True
+    tts_cache_index_path: str = ".cache/tts_cache_index.sqlite3"
+    tts_warmup_on_startup: bool = True
+    tts_warmup_concurrency: int = 4
+    tts_warmup_phrases: list[str] = []
+
+    # TTS decoder ("auto" prefers in-process PyAV, falls back to the ffmpeg pool)
+    tts_decoder_backend: str = "auto"
+    tts_decoder_max_workers: int = 8
+    tts_decoder_prewarm: int = 2
+    tts_decoder_job_timeout_s: float = 60.0
+
     # Anthropic LLM Configuration
     anthropic_api_key: str = ""
     anthropic_model: str = "claude-3-5-haiku-latest"
+    anthropic_hedge_model: str = "claude-3-haiku-20240307"
+    llm_streaming: bool = True
+    llm_pool_size: int = 20
+    llm_max_concurrency: int = 32
+    llm_max_concurrency_per_model: int = 16
+    llm_request_timeout_s: float = 15.0
+    llm_max_retries: int = 2
+    # Time-to-first-token budget per turn: "hedge" | "fallback" | "none"
+    llm_budget_action: str = "hedge"
+    llm_turn_budget_ms: int = 1500
+    llm_hedge_budget_ms: int = 1500
+    # Whole-reply budget for non-streaming requests, which have no first token to time
+    llm_create_budget_ms: int = 4000
+    agent_static_greeting: bool = False
+    greeting_prefetch_enabled: bool = True
+    speculative_prefetch_enabled: bool = True
+    speculative_max_per_session: int = 5
+    speculative_ttl_s: float = 180.0
+    speculative_min_answer_words: int = 4
+    conversation_token_budget: int = 1200
+    conversation_keep_recent_turns: int = 2
+    conversation_summary_model: str = "claude-3-5-haiku-latest"
+    conversation_summary_max_tokens: int = 200
+
+    # Per-job question bank
+    question_bank_path: str = ".cache/question_bank.sqlite3"
+    question_bank_size: int = 8
+    question_bank_model: str = "claude-3-5-haiku-latest"
+    question_bank_build_concurrency: int = 4
+    question_bank_llm_ack: bool = True
+    tts_fragment_min_chars: int = 24
+    tts_fragment_max_chars: int = 160
 
     # Tavus Configuration
     tavus_api_key: str = ""
@@ -9,6 +9,14 @@ from .config.settings import settings
 from .api.routes import router
 from .services.agent import agent_service
 from .services.avatar import tavus_avatar_service
+from .services.drain import drain_controller
+from .services.filler_audio import filler_audio
+from .services.llm_client import llm_client
+from .services.openai_tts_service import openai_tts_service
+from .services.question_bank import question_bank_service
+from .services.session_reaper import session_reaper
+from .services.session_store import room_leases
+from .services.tts_warmup import tts_warmup_service
 
 # Configure logging
 logging.basicConfig(
@@ -64,24 +72,33 @@ async def startup_event():
     # Verify configuration
     if not settings.livekit_api_key:
         logger.warning("LiveKit API key not configured")
+    await room_leases.start(on_lost=agent_service.lease_lost)
+    await openai_tts_service.start()
+    await question_bank_service.start()
+    filler_audio.start()
+    session_reaper.start()
+    if settings.tts_warmup_on_startup:
+        tts_warmup_service.start()
     if settings.use_tavus:
         await tavus_avatar_service.start()
-        await tavus_avatar_service.start()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Application shutdown"""
     logger.info("Shutting down LibaAI Digital Human API")
-    rooms = list(agent_service.active_sessions.keys())
-    for room_name in rooms:
-        try:
-            await agent_service.end_session(room_name)
-        except Exception as e:
-            logger.error("Failed to clean LiveKit room %s on shutdown: %s", room_name, e)
+    try:
+        await drain_controller.drain()
+    except Exception as e:
+        logger.error("Failed to drain sessions on shutdown: %s", e)
     if settings.use_tavus:
         await tavus_avatar_service.stop()
-        await tavus_avatar_service.stop()
+    await tts_warmup_service.stop()
+    await filler_audio.stop()
+    await question_bank_service.stop()
+    await openai_tts_service.stop()
+    await llm_client.aclose()
+    await room_leases.stop()
 
 
 @app.get("/")
@@ -97,6 +114,11 @@ async def root():
 
 def main():
     """Run the application"""
+    if settings.workers > 1:
+        from .shard_router import run
+
+        run()
+        return
     uvicorn.run(
         "src.main:app",
         host=settings.host,
@@ -7,6 +7,7 @@ class RoomCreateRequest(BaseModel):
     """Request to create a LiveKit room"""
     room_name: str = Field(..., description="Unique room identifier")
     participant_name: str = Field(default="User", description="Participant display name")
+    job_id: Optional[str] = Field(default=None, description="Job whose question bank to use")
 
 
 class RoomCreateResponse(BaseModel):
@@ -35,6 +36,7 @@ class StreamStatus(BaseModel):
     room_name: str
     status: Literal["active", "inactive", "error"]
     participants: int = 0
+    session_state: Optional[str] = None
     created_at: Optional[datetime] = None
     error_message: Optional[str] = None
 
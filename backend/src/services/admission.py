@@ -0,0 +1,154 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from .agent import agent_service
+from .llm_client import llm_client
+from .openai_tts_service import openai_tts_service
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionRejected(RuntimeError):
+    """A new session (or, while draining, a new turn) was turned away.
+
+    Carries the HTTP status and Retry-After to send.
+    """
+
+    def __init__(
+        self,
+        reason: str,
+        status_code: int,
+        retry_after_s: float,
+        queue_position: int | None = None,
+    ) -> None:
+        super().__init__(f"Session rejected: {reason}")
+        self.reason = reason
+        self.status_code = status_code
+        self.retry_after_s = retry_after_s
+        self.queue_position = queue_position
+
+
+class AdmissionController:
+    """Capacity accounting for new interview sessions.
+
+    Only session creation is gated, so when the box is saturated new candidates are
+    turned away (or wait in a short FIFO queue) while live interviews keep their
+    resources. The session limit answers 429; a saturated TTS decoder pool or LLM
+    client answers 503. A limit of 0 disables that check.
+    """
+
+    def __init__(self) -> None:
+        self.agent = agent_service
+        self._reserved: list[str] = []
+        self._queue: list[object] = []
+        self.closed_reason: str | None = None
+        self.admitted = 0
+        self.queued = 0
+        self.queue_timeouts = 0
+        self.rejected: dict[str, int] = {}
+
+    def headroom(self) -> dict:
+        """Limit, usage and free capacity per resource."""
+        decoder = openai_tts_service.decoder_stats()
+        llm = llm_client.stats()
+        # A session being created is inserted into active_sessions before its slot is
+        # released; count each room once.
+        sessions = self.agent.active_sessions
+        reserved = sum(1 for room_name in set(self._reserved) if room_name not in sessions)
+        resources = {
+            "sessions": (settings.admission_max_sessions, len(sessions) + reserved),
+            "tts_decodes": (
+                settings.admission_max_decodes,
+                decoder.get("active", 0) + decoder.get("queued", 0),
+            ),
+            "llm_calls": (settings.admission_max_llm_calls, llm["in_flight"] + llm["queued"]),
+        }
+        return {
+            name: {
+                "limit": limit or None,
+                "used": used,
+                "free": max(0, limit - used) if limit else None,
+            }
+            for name, (limit, used) in resources.items()
+        }
+
+    def _blocked(self) -> tuple[str, int] | None:
+        if self.closed_reason is not None:
+            return self.closed_reason, 503
+        headroom = self.headroom()
+        if headroom["sessions"]["free"] == 0:
+            return "sessions", 429
+        for name in ("tts_decodes", "llm_calls"):
+            if headroom[name]["free"] == 0:
+                return name, 503
+        return None
+
+    def _reject(self, reason: str, status_code: int, queue_position: int | None = None):
+        self.rejected[reason] = self.rejected.get(reason, 0) + 1
+        logger.warning("Admission rejected reason=%s status=%s", reason, status_code)
+        return AdmissionRejected(
+            reason, status_code, settings.admission_retry_after_s, queue_position
+        )
+
+    async def _wait_in_queue(self) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.admission_queue_timeout_s
+        ticket = object()
+        self._queue.append(ticket)
+        self.queued += 1
+        try:
+            while True:
+                blocked = self._blocked()
+                if blocked is None and self._queue[0] is ticket:
+                    return
+                if blocked is not None and blocked[0] == self.closed_reason:
+                    raise self._reject(*blocked)
+                if loop.time() >= deadline:
+                    self.queue_timeouts += 1
+                    reason, status_code = blocked or ("queue", 503)
+                    raise self._reject(reason, status_code, self._queue.index(ticket) + 1)
+                await asyncio.sleep(settings.admission_queue_poll_s)
+        finally:
+            self._queue.remove(ticket)
+
+    @asynccontextmanager
+    async def admit_session(self, room_name: str) -> AsyncIterator[None]:
+        """Hold a slot for ``room_name`` while it is created, or raise ``AdmissionRejected``."""
+        blocked = self._blocked()
+        if blocked is not None or self._queue:
+            queue_full = len(self._queue) >= settings.admission_queue_max
+            if blocked is not None and (queue_full or blocked[0] == self.closed_reason):
+                raise self._reject(*blocked, len(self._queue) + 1 if self._queue else None)
+            await self._wait_in_queue()
+        self._reserved.append(room_name)
+        self.admitted += 1
+        try:
+            yield
+        finally:
+            self._reserved.remove(room_name)
+
+    def close(self, reason: str = "draining") -> None:
+        """Stop admitting sessions (e.g. during a drain)."""
+        self.closed_reason = reason
+
+    def open(self) -> None:
+        self.closed_reason = None
+
+    def stats(self) -> dict:
+        return {
+            "accepting": self.closed_reason is None,
+            "closed_reason": self.closed_reason,
+            "headroom": self.headroom(),
+            "queue_length": len(self._queue),
+            "queue_max": settings.admission_queue_max,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "queue_timeouts": self.queue_timeouts,
+            "rejected": dict(self.rejected),
+        }
+
+
+admission_controller = AdmissionController()
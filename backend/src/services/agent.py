@@ -1,44 +1,70 @@
 import asyncio
 import logging
+import random
 import time
-from typing import Optional
-
-from anthropic import Anthropic
+from typing import AsyncIterator, Optional
 
+from .audio_framing import PcmFramer
+from .audio_pacing import AudioPacer, pacing_metrics
 from .avatar import tavus_avatar_service
+from .conversation_memory import ConversationMemory
+from .filler_audio import filler_audio
+from .interview_session import InterviewSession, SessionState
+from .jitter_buffer import jitter_buffers
 from .livekit_service import livekit_service
+from .llm_budget import llm_budget
+from .llm_client import llm_client
 from .openai_tts_service import openai_tts_service
+from .question_bank import question_bank_service
+from .session_store import room_leases
 from ..config.settings import settings
+from ..utils.sentences import iter_sentences
 
 logger = logging.getLogger(__name__)
 
-_llm_client: Anthropic | None = None
+MAX_TURNS = 7
+MAX_QUESTIONS = 5
 FINISH_MESSAGE = "This interview is finished. Thank you for participating."
-
-
-def _get_llm_client() -> Anthropic:
-    global _llm_client
-    if _llm_client is None:
-        api_key = settings.anthropic_api_key
-        if not api_key:
-            raise RuntimeError("ANTHROPIC_API_KEY is not set")
-        _llm_client = Anthropic(api_key=api_key)
-    return _llm_client
+GREETING_MESSAGES = (
+    "Hi, I'm Amanda from HR. The interview starts now. Please introduce yourself.",
+    "Hello and welcome! I'm Amanda, your interviewer today. Let's begin: tell me about yourself.",
+    "Hi there, I'm Amanda. Thanks for joining. Let's start with a quick introduction from you.",
+)
+# Spoken when the LLM misses its latency budget; pre-synthesized by the TTS warm-up.
+FALLBACK_QUESTIONS = (
+    "Thanks. Can you walk me through a recent project you're proud of?",
+    "Got it. Tell me about a difficult bug you tracked down and how you found it.",
+    "Thank you. How do you approach designing a system that needs to scale?",
+    "Okay. Describe a time you disagreed with a teammate and how you resolved it.",
+    "Thanks for sharing. How do you make sure the code you ship is reliable?",
+    "Understood. What are you hoping to learn in your next role?",
+)
+# Spoken before a question-bank question when no LLM acknowledgement is generated.
+ACKNOWLEDGEMENTS = ("Thank you.", "Got it, thanks.", "Thanks for sharing.", "Okay, great.")
+ACKNOWLEDGEMENT_PROMPT = (
+    "You are Amanda, an HR interviewer at a high-tech company. Briefly acknowledge the "
+    "candidate's answer in under 12 words of English. Do not ask a question."
+)
+
+
+def _record_stage(timings: dict[str, float], stage: str, start: float) -> None:
+    timings[stage] = round((time.perf_counter() - start) * 1000, 1)
 
 
 class AgentService:
     """Text -> (echo) -> streaming TTS -> LiveKit audio track."""
 
     def __init__(self) -> None:
-        self.active_sessions: dict[str, dict] = {}
+        self.active_sessions: dict[str, InterviewSession] = {}
         self.livekit = livekit_service
         self.tts = openai_tts_service
         self.tavus = tavus_avatar_service
+        self.speculation_totals = {"started": 0, "used": 0, "discarded": 0, "failed": 0}
 
     def _track_task(self, session_id: str, task: asyncio.Task, label: str) -> None:
         session = self.active_sessions.get(session_id)
         if session is not None:
-            session[label] = task
+            setattr(session, label, task)
 
         def _done(done_task: asyncio.Task) -> None:
             try:
@@ -54,46 +80,94 @@ class AgentService:
         self,
         room_name: str,
         participant_name: str = "User",
+        job_id: str | None = None,
     ) -> dict:
         """Create a new LiveKit session for the client. """
+        startup_t0 = time.perf_counter()
+        timings: dict[str, float] = {}
+        memory = ConversationMemory(
+            token_budget=settings.conversation_token_budget,
+            keep_recent_turns=settings.conversation_keep_recent_turns,
+        )
+        # The greeting does not depend on the room, so produce it while the room, the
+        # publisher and the avatar are being set up.
+        greeting_task: asyncio.Task | None = None
+        session: InterviewSession | None = None
+        claimed = False
+        if settings.greeting_prefetch_enabled:
+            greeting_task = asyncio.create_task(
+                self._prepare_greeting(room_name, memory, timings, startup_t0)
+            )
         try:
+            await room_leases.claim(
+                room_name,
+                {"room_name": room_name, "participant_name": participant_name, "job_id": job_id},
+            )
+            claimed = True
+            question_bank: list[str] = []
+            if job_id:
+                try:
+                    question_bank = await question_bank_service.get(job_id)
+                except Exception as e:
+                    logger.warning("Failed to load question bank for job %s: %s", job_id, e)
+                if not question_bank:
+                    logger.info("No question bank for job %s; questions come from the LLM", job_id)
+
             logger.info("Creating LiveKit room: %s", room_name)
             await self.livekit.create_room(room_name)
             token = self.livekit.create_token(room_name, participant_name)
+            _record_stage(timings, "room_create_ms", startup_t0)
 
             session_id = room_name
-            self.active_sessions[session_id] = {
-                "room_name": room_name,
-                "participant_name": participant_name,
-                "created_at": asyncio.get_event_loop().time(),
-                "client_ws": None,
-                "tts_task": None,
-                "publisher_task": None,
-                "greeted": False,
-                "question_count": 0,
-                "turn_count": 0,
-            }
-
-            use_tavus = settings.use_tavus and self.tavus.enabled
-            if settings.use_tavus and not self.tavus.enabled:
-                logger.warning("Tavus enabled but missing configuration; falling back to TTS.")
-
-            if use_tavus:
-                try:
-                    await self.tavus.ensure_avatar(room_name)
-                except Exception as e:
-                    logger.warning("Tavus avatar start failed; falling back to TTS: %s", e)
-                    use_tavus = False
-
-            if not use_tavus:
-                publisher_task = asyncio.create_task(
-                    self.livekit.ensure_publisher(
-                        room_name,
-                        participant_name="tts-bot",
-                        publish_video=False,
+            session = InterviewSession(
+                room_name,
+                participant_name,
+                memory,
+                job_id=job_id,
+                question_bank=question_bank,
+                startup_t0=startup_t0,
+                startup_timings=timings,
+            )
+            # A turn that arrives while the avatar or publisher is still connecting waits
+            # for the session to be ready.
+            await session.turn_lock.acquire()
+            try:
+                self.active_sessions[session_id] = session
+                if greeting_task is not None:
+                    self._track_task(session_id, greeting_task, "greeting_task")
+
+                use_tavus = settings.use_tavus and self.tavus.enabled
+                if settings.use_tavus and not self.tavus.enabled:
+                    logger.warning("Tavus enabled but missing configuration; falling back to TTS.")
+
+                if use_tavus:
+                    try:
+                        await self.tavus.ensure_avatar(room_name)
+                        _record_stage(timings, "tavus_start_ms", startup_t0)
+                    except Exception as e:
+                        logger.warning("Tavus avatar start failed; falling back to TTS: %s", e)
+                        use_tavus = False
+
+                if not use_tavus:
+                    publisher_task = asyncio.create_task(
+                        self._timed_stage(
+                            self.livekit.ensure_publisher(
+                                room_name,
+                                participant_name="tts-bot",
+                                publish_video=False,
+                            ),
+                            timings,
+                            "publisher_connect_ms",
+                            startup_t0,
+                        )
                     )
-                )
-                self._track_task(session_id, publisher_task, "publisher_task")
+                    self._track_task(session_id, publisher_task, "publisher_task")
+                if not session.closed:
+                    session.transition(SessionState.GREETING)
+            finally:
+                session.turn_lock.release()
+            await room_leases.update(room_name, session.as_dict())
+            _record_stage(timings, "session_ready_ms", startup_t0)
 
             logger.info("Session created: %s", session_id)
             logger.info(
@@ -113,106 +187,571 @@ class AgentService:
 
         except Exception as e:
             logger.error("Failed to create session: %s", e)
+            if greeting_task is not None and not greeting_task.done():
+                greeting_task.cancel()
+            if session is not None and not session.closed:
+                self.active_sessions.pop(room_name, None)
+                session.transition(SessionState.CLOSED)
+            if claimed:
+                await room_leases.release(room_name)
             raise
 
+    async def _prepare_greeting(
+        self,
+        room_name: str,
+        memory: ConversationMemory,
+        timings: dict[str, float],
+        startup_t0: float,
+    ) -> tuple[str, bytes]:
+        """Generate the greeting and synthesize it into a PCM buffer ready to publish."""
+        text = await self._generate_response(
+            room_name=room_name,
+            text="Hello",
+            greeted=False,
+            question_count=0,
+            turn_count=1,
+            memory=memory,
+        )
+        _record_stage(timings, "greeting_text_ms", startup_t0)
+        pcm = bytearray()
+        async for chunk in self.tts.iter_pcm_bytes(text):
+            pcm.extend(chunk)
+        _record_stage(timings, "greeting_audio_ms", startup_t0)
+        return text, bytes(pcm)
+
+    async def _take_prepared_greeting(self, room_name: str) -> tuple[str, bytes] | None:
+        """Wait for the greeting started by ``create_session``; None if there is none."""
+        session = self.active_sessions.get(room_name)
+        task = session.greeting_task if session else None
+        if task is None:
+            return None
+        timings = session.startup_timings
+        wait_start = time.perf_counter()
+        await asyncio.wait({task})
+        session.greeting_task = None
+        _record_stage(timings, "greeting_wait_ms", wait_start)
+        _record_stage(timings, "first_say_ms", session.startup_t0)
+        if task.cancelled() or task.exception() is not None:
+            logger.warning("Prepared greeting unavailable room=%s; generating it now", room_name)
+            return None
+        logger.info("Startup timings room=%s %s", room_name, timings)
+        return task.result()
+
+    @staticmethod
+    async def _timed_stage(awaitable, timings: dict[str, float], stage: str, start: float):
+        result = await awaitable
+        _record_stage(timings, stage, start)
+        return result
+
     async def process_message(self, room_name: str, message: str) -> dict:
         """Echo the text and publish TTS audio to LiveKit."""
         return await self.say_text(room_name=room_name, text=message)
 
     async def say_text(self, room_name: str, text: str, t0_ms: float | None = None) -> dict:
-        """Process text -> TTS streaming into LiveKit audio track."""
+        """Process text -> TTS streaming into LiveKit audio track.
+
+        Turns of one session are serialized: a call made while another turn is still
+        running waits for it to finish.
+        """
         try:
             session = self.active_sessions.get(room_name)
             if not session:
                 raise ValueError(f"Session {room_name} not found")
 
-            turn_count = int(session.get("turn_count", 0)) + 1
-            session["turn_count"] = turn_count
+            session.touch()
+            async with session.turn_lock:
+                if session.closed:
+                    raise ValueError(f"Session {room_name} not found")
+                response_text = await self._run_turn(session, text, t0_ms)
+                session.touch()
+                await room_leases.update(room_name, session.as_dict())
+
+            return {
+                "session_id": room_name,
+                "response": response_text,
+                "audio_url": None,
+                "video_url": None,
+            }
+
+        except Exception as e:
+            logger.error("Failed to process message: %s", e)
+            raise
 
+    async def _run_turn(self, session: InterviewSession, text: str, t0_ms: float | None) -> str:
+        room_name = session.room_name
+        session.turn_count += 1
+        turn_count = session.turn_count
+        session.turn_interrupt = asyncio.Event()
+
+        greeted = session.greeted
+        question_count = session.question_count
+        greeting = None if greeted else await self._take_prepared_greeting(room_name)
+        bank_question = self._next_bank_question(session, text, greeted, turn_count)
+        speculative_text = None
+        if greeting is None and bank_question is None:
+            speculative_text = self._take_speculation(room_name, text, question_count, turn_count)
+        if greeting is not None:
+            response_text, pcm = greeting
+            if await self._prepare_tavus(room_name):
+                self.tavus.enqueue_text(room_name, response_text, t0_ms=t0_ms)
+            else:
+                self._start_tts_task(room_name, response_text, t0_ms=t0_ms, pcm=pcm)
+        elif bank_question is not None:
+            response_text = await self._say_bank_question(
+                room_name, text, bank_question, session.memory, t0_ms=t0_ms
+            )
+            if response_text:
+                session.bank_index += 1
+        elif speculative_text is not None:
+            spoken = await self._speak_text(room_name, speculative_text, t0_ms=t0_ms)
+            response_text = speculative_text if spoken else ""
+        elif settings.llm_streaming:
+            response_text = await self._say_streaming(
+                room_name,
+                self._stream_response(
+                    room_name=room_name,
+                    text=text,
+                    greeted=greeted,
+                    question_count=question_count,
+                    turn_count=turn_count,
+                    memory=session.memory,
+                ),
+                t0_ms=t0_ms,
+            )
+        else:
             response_text = await self._generate_response(
+                room_name=room_name,
                 text=text,
-                greeted=bool(session.get("greeted")),
-                question_count=int(session.get("question_count", 0)),
+                greeted=greeted,
+                question_count=question_count,
                 turn_count=turn_count,
+                memory=session.memory,
             )
-            logger.info("Say text for room=%s text=%s", room_name, response_text)
-
-            if not session.get("greeted"):
-                session["greeted"] = True
-            else:
-                if response_text != FINISH_MESSAGE:
-                    session["question_count"] = int(session.get("question_count", 0)) + 1
-
-            use_tavus = settings.use_tavus and self.tavus.enabled
-            if use_tavus:
-                try:
-                    await self.tavus.ensure_avatar(room_name)
-                    self.tavus.enqueue_text(room_name, response_text, t0_ms=t0_ms)
-                except Exception as e:
-                    logger.warning("Tavus enqueue failed; falling back to TTS: %s", e)
-                    use_tavus = False
+            if not await self._speak_text(room_name, response_text, t0_ms=t0_ms):
+                response_text = ""
+        logger.info("Say text for room=%s text=%s", room_name, response_text)
+        if bank_question is None and self._is_next_bank_question(session, response_text):
+            # The LLM missed its budget and the fallback asked the bank's next question.
+            session.bank_index += 1
+        if not response_text.strip():
+            # Barged in before anything was said: the question was never asked, so it is
+            # neither remembered (an empty assistant message is rejected by the API) nor
+            # counted, and a bank question stays next in line.
+            logger.info("Turn interrupted before any reply room=%s", room_name)
+            return response_text
+        session.memory.add_turn(text, response_text)
+
+        if session.closed:
+            return response_text
+        if response_text == FINISH_MESSAGE:
+            session.transition(SessionState.FINISHING)
+            return response_text
+        if greeted:
+            session.question_count += 1
+        else:
+            session.transition(SessionState.QUESTIONING)
+        self._start_speculation(room_name)
+        return response_text
 
-            if not use_tavus:
-                existing_task = session.get("tts_task")
-                if existing_task and not existing_task.done():
-                    existing_task.cancel()
+    async def _speak_text(self, room_name: str, text: str, t0_ms: float | None = None) -> bool:
+        """Start speaking ``text``; False if the turn was interrupted before it could."""
+        if self._interrupted(room_name):
+            return False
+        use_tavus = await self._prepare_tavus(room_name)
+        if use_tavus:
+            self.tavus.enqueue_text(room_name, text, t0_ms=t0_ms)
+        else:
+            self._start_tts_task(room_name, text, t0_ms=t0_ms)
+        return True
+
+    async def _speak_fragments(
+        self, room_name: str, fragments: list[str], t0_ms: float | None = None
+    ) -> bool:
+        """Speak pre-split fragments so each one is looked up in the TTS cache on its own."""
+        if self._interrupted(room_name):
+            return False
+        use_tavus = await self._prepare_tavus(room_name)
+        if use_tavus:
+            for index, fragment in enumerate(fragments):
+                first = index == 0
+                self.tavus.enqueue_text(
+                    room_name, fragment, t0_ms=t0_ms if first else None, interrupt=first
+                )
+        else:
+            self._start_tts_task(room_name, self._iter_items(fragments), t0_ms=t0_ms)
+        return True
+
+    @staticmethod
+    async def _iter_items(items: list) -> AsyncIterator:
+        for item in items:
+            yield item
+
+    @staticmethod
+    def _next_bank_question(
+        session: InterviewSession, text: str, greeted: bool, turn_count: int
+    ) -> str | None:
+        """Next ranked question from the job's bank, unless the turn needs a tailored reply.
+
+        ``bank_index`` only moves on once the question has actually been spoken.
+        """
+        bank = session.question_bank
+        index = session.bank_index
+        if not greeted or turn_count >= MAX_TURNS or index >= len(bank):
+            return None
+        if "?" in text:
+            # The candidate asked something; let the LLM answer it.
+            return None
+        return bank[index]
+
+    @staticmethod
+    def _is_next_bank_question(session: InterviewSession, text: str) -> bool:
+        index = session.bank_index
+        if index >= len(session.question_bank):
+            return False
+        return text.split() == session.question_bank[index].split()
 
-                tts_task = asyncio.create_task(
-                    self._stream_tts_to_livekit(room_name, response_text, t0_ms=t0_ms)
+    async def _say_bank_question(
+        self,
+        room_name: str,
+        text: str,
+        question: str,
+        memory: ConversationMemory,
+        t0_ms: float | None = None,
+    ) -> str:
+        if settings.question_bank_llm_ack and settings.anthropic_model:
+            acknowledgement = await llm_budget.create(
+                room_name,
+                {
+                    "model": settings.anthropic_model,
+                    "system": ACKNOWLEDGEMENT_PROMPT + memory.system_notes(),
+                    "messages": memory.messages(f"User input: {text}"),
+                    "max_tokens": 40,
+                    "temperature": 0.2,
+                },
+                fallback=lambda: random.choice(ACKNOWLEDGEMENTS),
+            )
+        else:
+            acknowledgement = random.choice(ACKNOWLEDGEMENTS)
+        if not await self._speak_fragments(room_name, [acknowledgement, question], t0_ms=t0_ms):
+            return ""
+        return f"{acknowledgement} {question}"
+
+    def _start_speculation(self, room_name: str) -> None:
+        """Draft the next question and pre-synthesize it while the current reply plays.
+
+        The next question only depends on the candidate's answer in the prompt's user
+        input, so a question drafted without it is usually just as good. It is used by
+        the next turn if that turn is a plain answer (see ``_take_speculation``).
+        """
+        session = self.active_sessions.get(room_name)
+        if not session or not settings.speculative_prefetch_enabled or not session.greeted:
+            return
+        if session.turn_count + 1 >= MAX_TURNS:
+            return
+        if session.bank_index < len(session.question_bank):
+            return
+        stats = session.speculation_stats
+        if stats["started"] >= settings.speculative_max_per_session:
+            return
+        existing_task = session.speculation_task
+        if existing_task and not existing_task.done():
+            existing_task.cancel()
+
+        stats["started"] += 1
+        self.speculation_totals["started"] += 1
+        session.speculation = None
+        question_count = session.question_count
+        task = asyncio.create_task(self._speculate_next_question(room_name, question_count))
+        self._track_task(room_name, task, "speculation_task")
+
+    async def _speculate_next_question(self, room_name: str, question_count: int) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            session = self.active_sessions.get(room_name)
+            if session is None:
+                return
+            text = await llm_client.create_text(
+                **self._build_llm_request(
+                    "",
+                    True,
+                    question_count,
+                    session.memory,
+                    user_content=(
+                        "The candidate has answered the previous question. "
+                        "Ask the next question without referring to their answer."
+                    ),
                 )
-                self._track_task(room_name, tts_task, "tts_task")
+            )
+            await self.tts.prefetch(text)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._count_speculation(room_name, "failed")
+            logger.warning("Speculative question failed room=%s: %s", room_name, e)
+            return
 
-            return {
-                "session_id": room_name,
-                "response": response_text,
-                "audio_url": None,
-                "video_url": None,
+        session = self.active_sessions.get(room_name)
+        if session is not None:
+            session.speculation = {
+                "text": text,
+                "question_count": question_count,
+                "created_at": loop.time(),
             }
+            logger.info("Speculative question ready room=%s text=%s", room_name, text)
+
+    def _take_speculation(
+        self, room_name: str, text: str, question_count: int, turn_count: int
+    ) -> str | None:
+        """Return the prefetched next question if it still fits this turn, else discard it."""
+        session = self.active_sessions.get(room_name)
+        if not session:
+            return None
+        speculation = session.speculation
+        task = session.speculation_task
+        session.speculation = None
+        if speculation is None:
+            if task and not task.done():
+                # Still drafting: the candidate answered faster than the prefetch finished.
+                task.cancel()
+                self._count_speculation(room_name, "discarded")
+            return None
+
+        reason = None
+        age_s = asyncio.get_running_loop().time() - speculation["created_at"]
+        if turn_count >= MAX_TURNS:
+            reason = "finishing"
+        elif speculation["question_count"] != question_count:
+            reason = "out_of_order"
+        elif age_s > settings.speculative_ttl_s:
+            reason = "stale"
+        elif "?" in text:
+            reason = "candidate_question"
+        elif len(text.split()) < settings.speculative_min_answer_words:
+            reason = "short_answer"
+        if reason is not None:
+            self._count_speculation(room_name, "discarded")
+            logger.info("Speculative question discarded room=%s reason=%s", room_name, reason)
+            return None
+
+        self._count_speculation(room_name, "used")
+        logger.info("Speculative question used room=%s", room_name)
+        return speculation["text"]
+
+    def _count_speculation(self, room_name: str, outcome: str) -> None:
+        self.speculation_totals[outcome] += 1
+        session = self.active_sessions.get(room_name)
+        if session is not None:
+            session.speculation_stats[outcome] += 1
+
+    def _interrupted(self, room_name: str) -> bool:
+        session = self.active_sessions.get(room_name)
+        return bool(session and session.turn_interrupt.is_set())
+
+    async def interrupt(self, room_name: str) -> dict:
+        """Barge-in: stop the current reply everywhere and report how long silence took.
 
+        Cancelling the TTS task unwinds the whole pipeline: the single-flight synthesis
+        loses its last reader and cancels the Edge TTS stream, and an unfinished ffmpeg
+        decode is killed (the pool refills in the background). Audio already queued in
+        the LiveKit source is dropped and the tail is faded out to avoid a click.
+        """
+        session = self.active_sessions.get(room_name)
+        if not session:
+            raise ValueError(f"Session {room_name} not found")
+        start = time.perf_counter()
+        session.touch()
+        session.turn_interrupt.set()
+
+        use_tavus = settings.use_tavus and self.tavus.enabled
+        if use_tavus:
+            self.tavus.interrupt(room_name, requested_at=start)
+
+        tts_task = session.tts_task
+        if tts_task and not tts_task.done():
+            tts_task.cancel()
+            await asyncio.wait({tts_task}, timeout=settings.interrupt_cancel_timeout_s)
+        cancel_ms = (time.perf_counter() - start) * 1000
+
+        fade_ms = 0.0
+        try:
+            fade_ms = await self.livekit.clear_audio(room_name, fade_ms=settings.interrupt_fade_ms)
         except Exception as e:
-            logger.error("Failed to process message: %s", e)
-            raise
+            logger.warning("Failed to clear LiveKit audio room=%s: %s", room_name, e)
+        silence_ms = (time.perf_counter() - start) * 1000 + fade_ms
+
+        stats = pacing_metrics.for_room(room_name)
+        stats.interrupts += 1
+        stats.interrupt_silence_ms_total += silence_ms
+        stats.interrupt_silence_ms_max = max(stats.interrupt_silence_ms_max, silence_ms)
+        logger.info(
+            "Interrupted room=%s cancel_ms=%.1f silence_ms=%.1f", room_name, cancel_ms, silence_ms
+        )
+        return {
+            "room_name": room_name,
+            "cancel_ms": round(cancel_ms, 1),
+            "silence_ms": round(silence_ms, 1),
+            "tavus": use_tavus,
+        }
+
+    async def _prepare_tavus(self, room_name: str) -> bool:
+        """Return True when this turn should be spoken by the Tavus avatar."""
+        if not (settings.use_tavus and self.tavus.enabled):
+            return False
+        try:
+            await self.tavus.ensure_avatar(room_name)
+        except Exception as e:
+            logger.warning("Tavus avatar unavailable; falling back to TTS: %s", e)
+            return False
+        return True
+
+    def _start_tts_task(
+        self,
+        room_name: str,
+        text: str | AsyncIterator[str],
+        t0_ms: float | None = None,
+        pcm: bytes | None = None,
+    ) -> None:
+        session = self.active_sessions.get(room_name)
+        existing_task = session.tts_task if session else None
+        if existing_task and not existing_task.done():
+            existing_task.cancel()
+
+        tts_task = asyncio.create_task(
+            self._stream_tts_to_livekit(room_name, text, t0_ms=t0_ms, pcm=pcm)
+        )
+        self._track_task(room_name, tts_task, "tts_task")
+
+    async def _say_streaming(
+        self,
+        room_name: str,
+        deltas: AsyncIterator[str],
+        t0_ms: float | None = None,
+    ) -> str:
+        """Speak LLM output fragment by fragment while it is still being generated."""
+        use_tavus = await self._prepare_tavus(room_name)
+        fragments: asyncio.Queue[str | None] = asyncio.Queue()
+        if not use_tavus:
+            self._start_tts_task(room_name, self._drain_fragments(fragments), t0_ms=t0_ms)
+
+        session = self.active_sessions.get(room_name)
+        interrupted = session.turn_interrupt if session else asyncio.Event()
+        parts: list[str] = []
+        try:
+            async for fragment in iter_sentences(
+                self._until_interrupted(deltas, interrupted),
+                min_chars=settings.tts_fragment_min_chars,
+                max_chars=settings.tts_fragment_max_chars,
+            ):
+                if not parts and t0_ms is not None:
+                    logger.info(
+                        "LLM first fragment room=%s latency_ms=%.0f",
+                        room_name,
+                        time.time() * 1000 - t0_ms,
+                    )
+                parts.append(fragment)
+                if use_tavus:
+                    first = len(parts) == 1
+                    self.tavus.enqueue_text(
+                        room_name,
+                        fragment,
+                        t0_ms=t0_ms if first else None,
+                        interrupt=first,
+                    )
+                else:
+                    fragments.put_nowait(fragment)
+        finally:
+            fragments.put_nowait(None)
+
+        content = " ".join(parts).strip()
+        if not content and not interrupted.is_set():
+            raise RuntimeError("LLM returned empty content")
+        return content
+
+    @staticmethod
+    async def _until_interrupted(
+        items: AsyncIterator[str], interrupted: asyncio.Event
+    ) -> AsyncIterator[str]:
+        """Pass ``items`` through until ``interrupted`` is set, aborting a pending read."""
+        source = items.__aiter__()
+        stop = asyncio.ensure_future(interrupted.wait())
+        try:
+            while True:
+                pending = asyncio.ensure_future(source.__anext__())
+                await asyncio.wait({pending, stop}, return_when=asyncio.FIRST_COMPLETED)
+                if not pending.done():
+                    pending.cancel()
+                    await asyncio.gather(pending, return_exceptions=True)
+                    return
+                try:
+                    item = pending.result()
+                except StopAsyncIteration:
+                    return
+                yield item
+        finally:
+            stop.cancel()
+            aclose = getattr(source, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    @staticmethod
+    async def _drain_fragments(fragments: "asyncio.Queue[str | None]") -> AsyncIterator[str]:
+        while True:
+            fragment = await fragments.get()
+            if fragment is None:
+                return
+            yield fragment
 
     async def register_client_ws(self, room_name: str, websocket) -> None:
         session = self.active_sessions.get(room_name)
         if not session:
             return
-        session["client_ws"] = websocket
+        session.client_ws = websocket
+        session.touch()
 
     async def unregister_client_ws(self, room_name: str, websocket) -> None:
         session = self.active_sessions.get(room_name)
         if not session:
             return
-        if session.get("client_ws") is websocket:
-            session["client_ws"] = None
+        if session.client_ws is websocket:
+            session.client_ws = None
 
-    async def end_session(self, room_name: str) -> bool:
-        """End a digital human session and delete the LiveKit room."""
+    async def end_session(self, room_name: str, delete_room: bool = True) -> bool:
+        """End a digital human session and delete the LiveKit room.
+
+        ``delete_room=False`` only stops serving the room here, e.g. after another
+        worker took over its lease and now serves it.
+        """
         try:
             session = self.active_sessions.get(room_name)
             if not session:
                 return False
 
-            for task_name in ("tts_task", "publisher_task"):
-                task = session.get(task_name)
+            del self.active_sessions[room_name]
+            session.transition(SessionState.CLOSED)
+            # Wake the current turn's streaming loop; queued turns see the closed state.
+            session.turn_interrupt.set()
+            for task in session.tasks():
                 if task and not task.done():
                     task.cancel()
 
+            session.memory.close()
+
             if settings.use_tavus and self.tavus.enabled:
                 self.tavus.close_room(room_name)
 
-            try:
-                await self.livekit.delete_room(room_name)
+            teardown = [self.livekit.close_publisher(room_name), room_leases.release(room_name)]
+            if delete_room:
+                teardown.append(self.livekit.delete_room(room_name))
+            closed, _, *deleted = await asyncio.gather(*teardown, return_exceptions=True)
+            if deleted and isinstance(deleted[0], Exception):
+                logger.warning("Failed to delete LiveKit room: %s", deleted[0])
+            elif deleted:
                 logger.info("Deleted LiveKit room: %s", room_name)
-            except Exception as e:
-                logger.warning("Failed to delete LiveKit room: %s", e)
-
-            try:
-                await self.livekit.close_publisher(room_name)
-            except Exception as e:
-                logger.warning("Failed to close LiveKit publisher: %s", e)
+            if isinstance(closed, Exception):
+                logger.warning("Failed to close LiveKit publisher: %s", closed)
 
-            del self.active_sessions[room_name]
+            pacing_metrics.drop(room_name)
+            jitter_buffers.drop(room_name)
             logger.info("Ended session: %s", room_name)
             return True
 
@@ -220,18 +759,34 @@ class AgentService:
             logger.error("Failed to end session: %s", e)
             return False
 
-    def get_session_status(self, room_name: str) -> Optional[dict]:
+    async def lease_lost(self, room_name: str) -> None:
+        """Stop serving a room whose lease another worker now holds; the room stays up."""
+        await self.end_session(room_name, delete_room=False)
+
+    def get_session_status(self, room_name: str) -> Optional[InterviewSession]:
         """Get status of a session."""
         return self.active_sessions.get(room_name)
 
     async def _stream_tts_to_livekit(
-        self, room_name: str, text: str, t0_ms: float | None = None
+        self,
+        room_name: str,
+        text: str | AsyncIterator[str],
+        t0_ms: float | None = None,
+        pcm: bytes | None = None,
     ) -> None:
         publisher = await self.livekit.ensure_publisher(room_name, participant_name="tts-bot")
         if not publisher:
             logger.warning("LiveKit publisher unavailable for room %s", room_name)
             return
-        logger.info("TTS stream start room=%s text_len=%s", room_name, len(text))
+        if pcm is not None:
+            logger.info("TTS stream start room=%s prepared_bytes=%s", room_name, len(pcm))
+            pcm_chunks = self._iter_items([pcm])
+        elif isinstance(text, str):
+            logger.info("TTS stream start room=%s text_len=%s", room_name, len(text))
+            pcm_chunks = self.tts.iter_pcm_bytes(text)
+        else:
+            logger.info("TTS stream start room=%s streaming=True", room_name)
+            pcm_chunks = self._iter_fragment_pcm(text)
 
         sample_rate = settings.openai_tts_sample_rate
         num_channels = settings.openai_tts_channels
@@ -239,88 +794,187 @@ class AgentService:
         frame_samples = int(sample_rate * settings.openai_tts_frame_ms / 1000)
         frame_bytes = frame_samples * num_channels * bytes_per_sample
 
-        buffer = bytearray()
+        sample_bytes = bytes_per_sample * num_channels
+        framer = PcmFramer(frame_bytes, sample_align=sample_bytes)
+        pacer = AudioPacer(
+            sample_rate,
+            lead_ms=settings.audio_pacing_lead_ms,
+            stats=pacing_metrics.for_room(room_name),
+        )
+        prebuffer = jitter_buffers.for_room(room_name)
+        underruns_before = pacer.stats.underruns
         samples_sent = 0
-        start_time = asyncio.get_event_loop().time()
+
+        frames = prebuffer.hold(
+            framer.iter_frames(self._log_first_chunk(room_name, pcm_chunks)),
+            frame_bytes,
+            settings.openai_tts_frame_ms,
+        )
+        # Filler plays while the pre-buffer fills; it bypasses the buffer so it is neither
+        # held back nor counted in the upstream rate the buffer adapts to.
+        frames = filler_audio.cover(frames, frame_bytes)
 
         first_frame = True
-        first_chunk_logged = False
-        async for chunk in self.tts.iter_pcm_bytes(text):
-            if not chunk:
-                continue
-            if not first_chunk_logged:
-                logger.info("TTS PCM chunk received room=%s bytes=%s", room_name, len(chunk))
-                first_chunk_logged = True
-            buffer.extend(chunk)
-
-            while len(buffer) >= frame_bytes:
-                frame = bytes(buffer[:frame_bytes])
-                del buffer[:frame_bytes]
-                if first_frame:
-                    logger.info("Publishing first audio frame room=%s bytes=%s", room_name, len(frame))
-                await self.livekit.publish_audio_frame(
-                    room_name=room_name,
-                    pcm_data=frame,
-                    sample_rate=sample_rate,
-                    num_channels=num_channels,
-                    samples_per_channel=frame_samples,
-                )
-                if first_frame and t0_ms is not None:
+        async for frame in frames:
+            samples = len(frame) // sample_bytes
+            if first_frame:
+                logger.info("Publishing first audio frame room=%s bytes=%s", room_name, len(frame))
+            await self.livekit.publish_audio_frame(
+                room_name=room_name,
+                pcm_data=frame,
+                sample_rate=sample_rate,
+                num_channels=num_channels,
+                samples_per_channel=samples,
+            )
+            if first_frame:
+                if t0_ms is not None:
                     t1_ms = time.time() * 1000
                     logger.info(
                         "TTS first frame published room=%s latency_ms=%.0f",
                         room_name,
                         t1_ms - t0_ms,
                     )
-                    first_frame = False
-                samples_sent += frame_samples
-                await self._pace_audio(samples_sent, sample_rate, start_time)
+                first_frame = False
+            samples_sent += samples
+            await pacer.pace(samples)
 
+        prebuffer.observe(pacer.stats.underruns - underruns_before)
         if samples_sent == 0:
             logger.warning("TTS stream ended without audio frames room=%s", room_name)
 
-        if buffer:
-            remainder = len(buffer) - (len(buffer) % (bytes_per_sample * num_channels))
-            if remainder > 0:
-                frame = bytes(buffer[:remainder])
-                samples = remainder // (bytes_per_sample * num_channels)
-                await self.livekit.publish_audio_frame(
-                    room_name=room_name,
-                    pcm_data=frame,
-                    sample_rate=sample_rate,
-                    num_channels=num_channels,
-                    samples_per_channel=samples,
-                )
-                if first_frame and t0_ms is not None:
-                    t1_ms = time.time() * 1000
-                    logger.info(
-                        "TTS first frame published room=%s latency_ms=%.0f",
-                        room_name,
-                        t1_ms - t0_ms,
-                    )
-                    first_frame = False
-                samples_sent += samples
-                await self._pace_audio(samples_sent, sample_rate, start_time)
+    @staticmethod
+    async def _log_first_chunk(
+        room_name: str, chunks: AsyncIterator[bytes]
+    ) -> AsyncIterator[bytes]:
+        first = True
+        async for chunk in chunks:
+            if first and chunk:
+                logger.info("TTS PCM chunk received room=%s bytes=%s", room_name, len(chunk))
+                first = False
+            yield chunk
+
+    async def _iter_fragment_pcm(self, fragments: AsyncIterator[str]) -> AsyncIterator[bytes]:
+        """Synthesize fragments in order into one continuous PCM stream.
 
-    async def _pace_audio(self, samples_sent: int, sample_rate: int, start_time: float) -> None:
-        expected = samples_sent / sample_rate
-        elapsed = asyncio.get_event_loop().time() - start_time
-        if expected > elapsed:
-            await asyncio.sleep(expected - elapsed)
+        Synthesis runs in a producer task so the next fragment is fetched while the current
+        one is still being paced out, which keeps playback gap-free across fragments.
+        """
+        chunks: asyncio.Queue[object] = asyncio.Queue()
+        done = object()
+
+        async def _produce() -> None:
+            try:
+                async for fragment in fragments:
+                    async for chunk in self.tts.iter_pcm_bytes(fragment):
+                        chunks.put_nowait(chunk)
+            except Exception as exc:
+                chunks.put_nowait(exc)
+            finally:
+                chunks.put_nowait(done)
+
+        producer = asyncio.create_task(_produce())
+        try:
+            while True:
+                item = await chunks.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            if not producer.done():
+                producer.cancel()
 
     async def _generate_response(
         self,
+        room_name: str,
         text: str,
         greeted: bool,
         question_count: int,
         turn_count: int,
+        memory: ConversationMemory | None = None,
     ) -> str:
-        max_turns = 7
-        if turn_count >= max_turns:
+        if turn_count >= MAX_TURNS:
             return FINISH_MESSAGE
+        if not greeted and settings.agent_static_greeting:
+            return random.choice(GREETING_MESSAGES)
+
+        return await llm_budget.create(
+            room_name,
+            self._build_llm_request(text, greeted, question_count, memory),
+            fallback=lambda: self._fallback_reply(room_name, greeted, memory),
+        )
+
+    async def _stream_response(
+        self,
+        room_name: str,
+        text: str,
+        greeted: bool,
+        question_count: int,
+        turn_count: int,
+        memory: ConversationMemory | None = None,
+    ) -> AsyncIterator[str]:
+        """Yield the reply as text deltas straight from the Anthropic token stream."""
+        if turn_count >= MAX_TURNS:
+            yield FINISH_MESSAGE
+            return
+        if not greeted and settings.agent_static_greeting:
+            yield random.choice(GREETING_MESSAGES)
+            return
 
-        max_questions = 5
+        async for delta in llm_budget.stream(
+            room_name,
+            self._build_llm_request(text, greeted, question_count, memory),
+            fallback=lambda: self._fallback_reply(room_name, greeted, memory),
+        ):
+            yield delta
 
+    def _fallback_reply(
+        self, room_name: str, greeted: bool, memory: ConversationMemory | None
+    ) -> str:
+        """Pick a pre-synthesized line that has not been spoken in this session yet.
+
+        The job's next bank question comes first; the generic questions only cover
+        sessions without a bank or whose bank is used up.
+        """
+        if not greeted:
+            return random.choice(GREETING_MESSAGES)
+        session = self.active_sessions.get(room_name)
+        if session is not None and session.bank_index < len(session.question_bank):
+            return session.question_bank[session.bank_index]
+        spoken = {interviewer for _, interviewer in memory.turns} if memory else set()
+        unused = [question for question in FALLBACK_QUESTIONS if question not in spoken]
+        return random.choice(unused or FALLBACK_QUESTIONS)
+
+    def _build_llm_request(
+        self,
+        text: str,
+        greeted: bool,
+        question_count: int,
+        memory: ConversationMemory | None,
+        user_content: str | None = None,
+    ) -> dict:
+        model = settings.anthropic_model
+        if not model:
+            raise RuntimeError("ANTHROPIC_MODEL is not set")
+        system_content = self._build_system_prompt(greeted, question_count)
+        if user_content is None:
+            user_content = f"User input: {text}\nRespond to the user's input."
+        if memory is not None:
+            system_content += memory.system_notes()
+            messages = memory.messages(user_content)
+        else:
+            messages = [{"role": "user", "content": user_content}]
+        return {
+            "model": model,
+            "system": system_content,
+            "messages": messages,
+            "max_tokens": 120,
+            "temperature": 0.2,
+        }
+
+    @staticmethod
+    def _build_system_prompt(greeted: bool, question_count: int) -> str:
         if not greeted:
             system_content = (
                 "You are an interview expert. You are an HR at a high-tech company interviewing a software engineer. "
@@ -331,40 +985,10 @@ class AgentService:
             next_q_num = question_count + 1
             system_content = (
                 "You are an interview expert. You are an HR at a high-tech company interviewing a software engineer. "
-                f"Ask interview question #{next_q_num} of {max_questions}. Keep it within 20 words in English. "
+                f"Ask interview question #{next_q_num} of {MAX_QUESTIONS}. Keep it within 20 words in English. "
                 "Do not repeat the greeting or the introduction request."
             )
-        user_content = f"User input: {text}\nRespond to the user's input."
-        model = settings.anthropic_model
-        if not model:
-            raise RuntimeError("ANTHROPIC_MODEL is not set")
-
-        def _call_llm() -> str:
-            client_llm = _get_llm_client()
-            response = client_llm.messages.create(
-                model=model,
-                system=system_content,
-                messages=[{"role": "user", "content": user_content}],
-                max_tokens=120,
-                temperature=0.2,
-            )
-            content_parts: list[str] = []
-            for block in getattr(response, "content", []) or []:
-                block_type = block.get("type") if isinstance(block, dict) else getattr(block, "type", None)
-                if block_type != "text":
-                    continue
-                text_part = block.get("text") if isinstance(block, dict) else getattr(block, "text", None)
-                if text_part:
-                    content_parts.append(text_part)
-            content = " ".join(content_parts).strip()
-
-            if not content:
-                logger.error("LLM returned empty content; response=%s", response)
-                raise RuntimeError("LLM returned empty content")
-
-            return content
-
-        return await asyncio.to_thread(_call_llm)
+        return system_content
 
 
 DigitalHumanService = AgentService
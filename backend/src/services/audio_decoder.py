@@ -0,0 +1,558 @@
+import asyncio
+import logging
+from typing import AsyncIterator
+
+try:
+    import av
+except ImportError:
+    av = None
+
+logger = logging.getLogger(__name__)
+
+
+class PcmDecoder:
+    """Streaming mp3 -> s16le PCM decoder backend."""
+
+    name = "base"
+
+    async def start(self) -> None:
+        return None
+
+    async def close(self) -> None:
+        return None
+
+    def decode(
+        self,
+        source: AsyncIterator[bytes],
+        first_chunk_timeout_s: float | None = None,
+    ) -> AsyncIterator[bytes]:
+        raise NotImplementedError
+
+    def stats(self) -> dict:
+        return {}
+
+
+class PyAVDecoder(PcmDecoder):
+    """In-process decoder built on PyAV (libavcodec bindings).
+
+    mp3 chunks are parsed and decoded as they arrive and resampled straight into PCM
+    buffers, with no subprocess or pipe in between. Decoding runs in worker threads so
+    it never blocks the event loop, and like the ffmpeg pool at most ``max_workers``
+    jobs decode at once while the rest queue.
+    """
+
+    name = "pyav"
+
+    def __init__(
+        self, sample_rate: int, num_channels: int, max_workers: int, job_timeout_s: float
+    ) -> None:
+        if av is None:
+            raise RuntimeError("PyAV is not installed")
+        self.sample_rate = sample_rate
+        self.num_channels = num_channels
+        self._layout = "mono" if num_channels == 1 else "stereo"
+        self.max_workers = max(1, max_workers)
+        self.job_timeout_s = job_timeout_s
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self.active = 0
+        self.queued = 0
+        self.max_queued = 0
+        self.jobs = 0
+        self.failures = 0
+        self.timeouts = 0
+
+    async def start(self) -> None:
+        self._bind_loop()
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.max_workers)
+        return loop
+
+    async def decode(
+        self,
+        source: AsyncIterator[bytes],
+        first_chunk_timeout_s: float | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Decode mp3 bytes from ``source`` and yield PCM chunks.
+
+        Only jobs on the loop the decoder was started on share the worker limit; the
+        Tavus agent runs its jobs on its own thread and loop.
+        """
+        loop = self._bind_loop()
+        pooled = loop is self._loop
+        if pooled:
+            self.queued += 1
+            self.max_queued = max(self.max_queued, self.queued)
+            try:
+                await self._slots.acquire()
+            finally:
+                self.queued -= 1
+
+        self.active += 1
+        self.jobs += 1
+        chunks = self._decode_chunks(source)
+        try:
+            deadline = loop.time() + self.job_timeout_s
+            first = True
+            while True:
+                timeout = deadline - loop.time()
+                if first and first_chunk_timeout_s is not None:
+                    timeout = min(timeout, first_chunk_timeout_s)
+                try:
+                    chunk = await asyncio.wait_for(chunks.__anext__(), timeout=max(0.0, timeout))
+                except StopAsyncIteration:
+                    break
+                except asyncio.TimeoutError as exc:
+                    self.timeouts += 1
+                    raise RuntimeError("PyAV decode timeout") from exc
+                first = False
+                yield chunk
+        except Exception:
+            self.failures += 1
+            raise
+        finally:
+            await chunks.aclose()
+            aclose = getattr(source, "aclose", None)
+            if aclose is not None:
+                await aclose()
+            self.active -= 1
+            if pooled:
+                self._slots.release()
+
+    async def _decode_chunks(self, source: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        codec = av.CodecContext.create("mp3", "r")
+        resampler = av.AudioResampler(format="s16", layout=self._layout, rate=self.sample_rate)
+        data, delay, source_rate = await _split_info_frame(_skip_id3_tag(source))
+        skip = round(delay * self.sample_rate / source_rate) * 2 * self.num_channels
+        async for chunk in data:
+            pcm = await asyncio.to_thread(self._decode_data, codec, resampler, chunk)
+            if skip and pcm:
+                pcm, skip = pcm[skip:], max(0, skip - len(pcm))
+            if pcm:
+                yield pcm
+        pcm = await asyncio.to_thread(self._flush, codec, resampler)
+        if skip and pcm:
+            pcm = pcm[skip:]
+        if pcm:
+            yield pcm
+
+    def _decode_data(self, codec, resampler, data: bytes) -> bytes:
+        return self._decode_packets(codec, resampler, codec.parse(data))
+
+    def _flush(self, codec, resampler) -> bytes:
+        """Flush the parser, the decoder and the resampler."""
+        pcm = self._decode_packets(codec, resampler, codec.parse(None))
+        pcm += self._decode_frames(resampler, codec.decode(None))
+        pcm += self._resampled_bytes(resampler.resample(None))
+        return pcm
+
+    def _decode_packets(self, codec, resampler, packets) -> bytes:
+        pcm = bytearray()
+        for packet in packets:
+            try:
+                frames = codec.decode(packet)
+            except av.InvalidDataError:
+                # Like ffmpeg, skip a damaged frame instead of failing the utterance.
+                continue
+            pcm += self._decode_frames(resampler, frames)
+        return bytes(pcm)
+
+    def _decode_frames(self, resampler, frames) -> bytearray:
+        pcm = bytearray()
+        for frame in frames:
+            pcm += self._resampled_bytes(resampler.resample(frame))
+        return pcm
+
+    def _resampled_bytes(self, frames) -> bytearray:
+        pcm = bytearray()
+        for frame in frames:
+            size = frame.samples * self.num_channels * 2
+            pcm += memoryview(frame.planes[0])[:size]
+        return pcm
+
+    def stats(self) -> dict:
+        return {
+            "max_workers": self.max_workers,
+            "active": self.active,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "jobs": self.jobs,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+        }
+
+
+async def _skip_id3_tag(source: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Drop a leading ID3v2 tag, which the raw mp3 parser would feed to the decoder."""
+    head: bytearray | None = bytearray()
+    async for data in source:
+        if head is None:
+            yield data
+            continue
+        head += data
+        if len(head) < 10:
+            continue
+        if head[:3] == b"ID3":
+            size = 10 + (
+                (head[6] & 0x7F) << 21 | (head[7] & 0x7F) << 14 | (head[8] & 0x7F) << 7 | head[9] & 0x7F
+            )
+            if len(head) < size:
+                continue
+            del head[:size]
+        if head:
+            yield bytes(head)
+        head = None
+    if head and head[:3] != b"ID3":
+        yield bytes(head)
+
+
+# libavcodec's mp3 decoder delay, which ffmpeg adds to the encoder delay it skips.
+_MP3_DECODER_DELAY = 529
+_LAYER3_BITRATES_KBPS = {
+    True: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    False: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+
+def _parse_layer3_header(header: bytes) -> tuple[int, int] | None:
+    """Frame size and sample rate of the MPEG layer III frame starting at ``header``."""
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+    version = header[1] >> 3 & 3
+    bitrate_index = header[2] >> 4
+    rate_index = header[2] >> 2 & 3
+    if version == 1 or header[1] >> 1 & 3 != 1 or rate_index == 3 or bitrate_index in (0, 15):
+        return None
+    mpeg1 = version == 3
+    bitrate = _LAYER3_BITRATES_KBPS[mpeg1][bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+    frame_size = (144 if mpeg1 else 72) * bitrate // sample_rate + (header[2] >> 1 & 1)
+    return frame_size, sample_rate
+
+
+def _info_frame_delay(frame: bytes) -> int | None:
+    """Encoder delay in samples if ``frame`` is a Xing/Info frame; zero without a LAME tag."""
+    mpeg1 = frame[1] >> 3 & 3 == 3
+    mono = frame[3] >> 6 == 3
+    offset = 4 + ((17 if mono else 32) if mpeg1 else (9 if mono else 17))
+    if frame[offset : offset + 4] not in (b"Xing", b"Info"):
+        return None
+    flags = int.from_bytes(frame[offset + 4 : offset + 8], "big")
+    offset += 8 + 4 * (flags & 1) + 4 * (flags >> 1 & 1) + 100 * (flags >> 2 & 1)
+    offset += 4 * (flags >> 3 & 1)
+    if frame[offset : offset + 4] not in (b"LAME", b"Lavf", b"Lavc") or len(frame) < offset + 24:
+        return 0
+    return int.from_bytes(frame[offset + 21 : offset + 23], "big") >> 4
+
+
+async def _split_info_frame(source: AsyncIterator[bytes]) -> tuple[AsyncIterator[bytes], int, int]:
+    """Drop a leading Xing/Info frame and read the encoder delay from its LAME tag.
+
+    Returns the remaining mp3 stream, the samples to skip at its start and the stream's
+    sample rate. Like ffmpeg's mp3 demuxer, the decoder delay is added to the encoder
+    delay; the end padding is kept, as ffmpeg keeps it when reading from a pipe.
+    """
+    chunks = source.__aiter__()
+    head = bytearray()
+    async for data in chunks:
+        head += data
+        if len(head) >= 4 and len(head) >= (_parse_layer3_header(head) or (0, 0))[0]:
+            break
+    parsed = _parse_layer3_header(head)
+    delay = 0
+    source_rate = 1
+    if parsed is not None and len(head) >= parsed[0]:
+        frame_size, source_rate = parsed
+        encoder_delay = _info_frame_delay(bytes(head[:frame_size]))
+        if encoder_delay is not None:
+            del head[:frame_size]
+            if encoder_delay:
+                delay = encoder_delay + _MP3_DECODER_DELAY
+
+    async def _rest() -> AsyncIterator[bytes]:
+        if head:
+            yield bytes(head)
+        async for data in chunks:
+            yield data
+
+    return _rest(), delay, source_rate
+
+
+class FfmpegDecoderPool(PcmDecoder):
+    """Bounded pool of pre-spawned ffmpeg decoders (mp3 on stdin -> s16le PCM on stdout).
+
+    ffmpeg cannot delimit several utterances on one pipe, so each job still gets its own
+    process; the pool keeps ``prewarm`` processes already forked and waiting on stdin so
+    that fork/exec happens off the critical path, caps concurrent decodes at
+    ``max_workers`` and queues the rest.
+    """
+
+    name = "ffmpeg"
+
+    def __init__(
+        self,
+        ffmpeg_path: str,
+        sample_rate: int,
+        num_channels: int,
+        max_workers: int,
+        prewarm: int,
+        job_timeout_s: float,
+        chunk_bytes: int,
+    ) -> None:
+        self._cmd = [
+            ffmpeg_path,
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-i",
+            "pipe:0",
+            "-f",
+            "s16le",
+            "-acodec",
+            "pcm_s16le",
+            "-ar",
+            str(sample_rate),
+            "-ac",
+            str(num_channels),
+            "pipe:1",
+        ]
+        self.max_workers = max(1, max_workers)
+        self.prewarm = max(0, prewarm)
+        self.job_timeout_s = job_timeout_s
+        self.chunk_bytes = chunk_bytes
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._idle: list[asyncio.subprocess.Process] = []
+        self._refill_task: asyncio.Task | None = None
+        self._closed = False
+
+        self.active = 0
+        self.queued = 0
+        self.max_queued = 0
+        self.jobs = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.spawned = 0
+        self.warm_starts = 0
+        self._queue_wait_total_s = 0.0
+        self._queue_wait_max_s = 0.0
+
+    async def start(self) -> None:
+        self._closed = False
+        self._bind_loop()
+        await self._refill()
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.max_workers)
+        return loop
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._refill_task and not self._refill_task.done():
+            self._refill_task.cancel()
+        idle, self._idle = self._idle, []
+        for process in idle:
+            await self._kill(process)
+
+    async def decode(
+        self,
+        source: AsyncIterator[bytes],
+        first_chunk_timeout_s: float | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Feed mp3 bytes from ``source`` through a pooled decoder and yield PCM chunks.
+
+        The pool belongs to the loop it was started on; callers on another loop (the Tavus
+        agent runs jobs on its own thread) get a dedicated process outside the pool.
+        """
+        loop = self._bind_loop()
+        pooled = loop is self._loop
+        if pooled:
+            self.queued += 1
+            self.max_queued = max(self.max_queued, self.queued)
+            wait_start = loop.time()
+            try:
+                await self._slots.acquire()
+            finally:
+                self.queued -= 1
+            waited = loop.time() - wait_start
+            self._queue_wait_total_s += waited
+            self._queue_wait_max_s = max(self._queue_wait_max_s, waited)
+
+        self.active += 1
+        self.jobs += 1
+        process: asyncio.subprocess.Process | None = None
+        feed_task: asyncio.Task | None = None
+        finished = False
+        try:
+            if pooled:
+                process = await self._acquire_process()
+                self._schedule_refill()
+            else:
+                process = await self._spawn()
+            feed_task = asyncio.create_task(self._feed(process, source))
+            assert process.stdout is not None
+
+            deadline = loop.time() + self.job_timeout_s
+            first = True
+            while True:
+                timeout = deadline - loop.time()
+                if first and first_chunk_timeout_s is not None:
+                    timeout = min(timeout, first_chunk_timeout_s)
+                try:
+                    chunk = await asyncio.wait_for(
+                        process.stdout.read(self.chunk_bytes), timeout=max(0.0, timeout)
+                    )
+                except asyncio.TimeoutError as exc:
+                    self.timeouts += 1
+                    raise RuntimeError("ffmpeg decode timeout") from exc
+                if not chunk:
+                    break
+                first = False
+                yield chunk
+
+            await feed_task
+            finished = True
+        except Exception:
+            self.failures += 1
+            raise
+        finally:
+            if feed_task is not None and not feed_task.done():
+                feed_task.cancel()
+                try:
+                    await feed_task
+                except BaseException:
+                    pass
+            if process is not None:
+                await self._reap(process, finished)
+            self.active -= 1
+            if pooled:
+                self._slots.release()
+
+    def stats(self) -> dict:
+        return {
+            "max_workers": self.max_workers,
+            "active": self.active,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "idle": len(self._idle),
+            "jobs": self.jobs,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "spawned": self.spawned,
+            "warm_starts": self.warm_starts,
+            "queue_wait_avg_ms": round(self._queue_wait_total_s / self.jobs * 1000, 2)
+            if self.jobs
+            else 0.0,
+            "queue_wait_max_ms": round(self._queue_wait_max_s * 1000, 2),
+        }
+
+    async def _acquire_process(self) -> asyncio.subprocess.Process:
+        while self._idle:
+            process = self._idle.pop()
+            if process.returncode is None:
+                self.warm_starts += 1
+                return process
+        return await self._spawn()
+
+    async def _spawn(self) -> asyncio.subprocess.Process:
+        process = await asyncio.create_subprocess_exec(
+            *self._cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        self.spawned += 1
+        return process
+
+    def _schedule_refill(self) -> None:
+        if self._closed or len(self._idle) >= self.prewarm:
+            return
+        if self._refill_task is None or self._refill_task.done():
+            self._refill_task = asyncio.create_task(self._refill())
+
+    async def _refill(self) -> None:
+        try:
+            while not self._closed and len(self._idle) < self.prewarm:
+                self._idle.append(await self._spawn())
+        except Exception as exc:
+            logger.warning("Failed to prewarm ffmpeg decoder: %s", exc)
+
+    async def _feed(self, process: asyncio.subprocess.Process, source: AsyncIterator[bytes]) -> None:
+        assert process.stdin is not None
+        try:
+            async for data in source:
+                process.stdin.write(data)
+                await process.stdin.drain()
+        finally:
+            aclose = getattr(source, "aclose", None)
+            if aclose is not None:
+                await aclose()
+            if not process.stdin.is_closing():
+                process.stdin.close()
+
+    async def _reap(self, process: asyncio.subprocess.Process, finished: bool) -> None:
+        if not finished and process.returncode is None:
+            await self._kill(process)
+            return
+        stderr_output = b""
+        if process.stderr:
+            stderr_output = await process.stderr.read()
+        returncode = await process.wait()
+        if returncode != 0:
+            logger.error("ffmpeg decode failed (%s): %s", returncode, stderr_output.decode())
+
+    @staticmethod
+    async def _kill(process: asyncio.subprocess.Process) -> None:
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+        await process.wait()
+
+
+def create_decoder(
+    backend: str,
+    ffmpeg_path: str,
+    sample_rate: int,
+    num_channels: int,
+    max_workers: int,
+    prewarm: int,
+    job_timeout_s: float,
+    chunk_bytes: int,
+) -> PcmDecoder:
+    """Build the configured decoder backend ("auto", "pyav" or "ffmpeg").
+
+    ffmpeg is the fallback whenever the in-process backend is unavailable.
+    """
+    backend = backend.lower()
+    if backend in ("auto", "pyav"):
+        try:
+            return PyAVDecoder(
+                sample_rate=sample_rate,
+                num_channels=num_channels,
+                max_workers=max_workers,
+                job_timeout_s=job_timeout_s,
+            )
+        except RuntimeError as exc:
+            if backend == "pyav":
+                logger.warning("PyAV decoder unavailable; falling back to ffmpeg: %s", exc)
+    elif backend != "ffmpeg":
+        logger.warning("Unknown TTS decoder backend %r; using ffmpeg", backend)
+    return FfmpegDecoderPool(
+        ffmpeg_path,
+        sample_rate=sample_rate,
+        num_channels=num_channels,
+        max_workers=max_workers,
+        prewarm=prewarm,
+        job_timeout_s=job_timeout_s,
+        chunk_bytes=chunk_bytes,
+    )
@@ -0,0 +1,101 @@
+import sys
+from array import array
+from typing import AsyncIterator
+
+
+class PcmFramer:
+    """Cuts a PCM byte stream into fixed-size frames using a preallocated ring buffer.
+
+    The ring capacity is a multiple of the frame size and frames are always consumed
+    whole, so a frame never straddles the wrap point and can be returned as a memoryview
+    into the ring without copying. A returned view is only valid until the next
+    ``push()``; ``rtc.AudioFrame`` copies it on construction.
+    """
+
+    def __init__(self, frame_bytes: int, sample_align: int = 2, capacity_frames: int = 64) -> None:
+        if frame_bytes <= 0 or frame_bytes % sample_align:
+            raise ValueError("frame_bytes must be a positive multiple of sample_align")
+        self.frame_bytes = frame_bytes
+        self.sample_align = sample_align
+        self._buffer = bytearray(frame_bytes * max(2, capacity_frames))
+        self._view = memoryview(self._buffer)
+        self._read = 0
+        self._size = 0
+
+    @property
+    def buffered(self) -> int:
+        return self._size
+
+    def push(self, chunk: bytes | bytearray | memoryview) -> None:
+        data = memoryview(chunk).cast("B")
+        length = len(data)
+        if self._size + length > len(self._buffer):
+            self._grow(self._size + length)
+        capacity = len(self._buffer)
+        write = (self._read + self._size) % capacity
+        first = min(length, capacity - write)
+        self._view[write : write + first] = data[:first]
+        if first < length:
+            self._view[: length - first] = data[first:]
+        self._size += length
+
+    def pop(self) -> memoryview | None:
+        """Return the next full frame, or None if less than a frame is buffered."""
+        if self._size < self.frame_bytes:
+            return None
+        start = self._read
+        self._read = (start + self.frame_bytes) % len(self._buffer)
+        self._size -= self.frame_bytes
+        return self._view[start : start + self.frame_bytes]
+
+    def flush(self) -> memoryview | None:
+        """Return the sample-aligned remainder (shorter than a frame) and reset."""
+        usable = self._size - (self._size % self.sample_align)
+        start = self._read
+        self._read = 0
+        self._size = 0
+        if usable <= 0:
+            return None
+        return self._view[start : start + usable]
+
+    async def iter_frames(
+        self, chunks: AsyncIterator[bytes | memoryview]
+    ) -> AsyncIterator[memoryview]:
+        """Yield full frames as chunks arrive, then the aligned tail remainder."""
+        async for chunk in chunks:
+            if not chunk:
+                continue
+            self.push(chunk)
+            while (frame := self.pop()) is not None:
+                yield frame
+        tail = self.flush()
+        if tail is not None:
+            yield tail
+
+    def _grow(self, needed: int) -> None:
+        frames = -(-needed // self.frame_bytes)
+        capacity = max(len(self._buffer) * 2, frames * self.frame_bytes)
+        buffer = bytearray(capacity)
+        old_capacity = len(self._buffer)
+        first = min(self._size, old_capacity - self._read)
+        buffer[:first] = self._view[self._read : self._read + first]
+        if first < self._size:
+            buffer[first : self._size] = self._view[: self._size - first]
+        # Allocate a new ring rather than resizing: outstanding frame views keep the old one.
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        self._read = 0
+
+
+def fade_out(pcm: bytes | memoryview, num_channels: int) -> bytes:
+    """Apply a linear fade to silence over 16-bit PCM."""
+    samples = array("h")
+    samples.frombytes(pcm)
+    if sys.byteorder == "big":
+        samples.byteswap()
+    frames = len(samples) // num_channels
+    for index in range(frames * num_channels):
+        samples[index] = int(samples[index] * (1 - (index // num_channels) / frames))
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return samples.tobytes()
@@ -0,0 +1,112 @@
+import asyncio
+import threading
+from dataclasses import asdict, dataclass
+
+
+@dataclass
+class PacingStats:
+    """Per-room pacing telemetry, accumulated across utterances."""
+
+    utterances: int = 0
+    frames: int = 0
+    audio_ms: float = 0.0
+    late_frames: int = 0
+    underruns: int = 0
+    max_lateness_ms: float = 0.0
+    total_lateness_ms: float = 0.0
+    interrupts: int = 0
+    interrupt_silence_ms_max: float = 0.0
+    interrupt_silence_ms_total: float = 0.0
+
+    def as_dict(self) -> dict:
+        data = asdict(self)
+        data["audio_ms"] = round(self.audio_ms, 1)
+        data["max_lateness_ms"] = round(self.max_lateness_ms, 1)
+        data["total_lateness_ms"] = round(self.total_lateness_ms, 1)
+        data["interrupt_silence_ms_max"] = round(self.interrupt_silence_ms_max, 1)
+        data["interrupt_silence_ms_total"] = round(self.interrupt_silence_ms_total, 1)
+        return data
+
+
+class PacingMetrics:
+    """Registry of per-room pacing stats (written from the main and Tavus loops)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._rooms: dict[str, PacingStats] = {}
+
+    def for_room(self, room_name: str) -> PacingStats:
+        with self._lock:
+            stats = self._rooms.get(room_name)
+            if stats is None:
+                stats = PacingStats()
+                self._rooms[room_name] = stats
+            return stats
+
+    def snapshot(self, room_name: str) -> dict | None:
+        with self._lock:
+            stats = self._rooms.get(room_name)
+        return stats.as_dict() if stats else None
+
+    def drop(self, room_name: str) -> None:
+        with self._lock:
+            self._rooms.pop(room_name, None)
+
+
+class AudioPacer:
+    """Paces published frames against the loop clock while keeping a small lead.
+
+    Frames are released until the publisher is ``lead_ms`` ahead of real time, so the
+    sink always holds that much audio and an upstream stall shorter than the lead is
+    never heard. A frame handed over after its play deadline is counted as late; the
+    clock is then re-anchored so the lateness is not repaid by bursting, and the next
+    frames rebuild the lead.
+    """
+
+    def __init__(self, sample_rate: int, lead_ms: float, stats: PacingStats | None = None) -> None:
+        self.sample_rate = sample_rate
+        self.lead_s = max(0.0, lead_ms / 1000)
+        self.stats = stats if stats is not None else PacingStats()
+        self.stats.utterances += 1
+        self._loop = asyncio.get_running_loop()
+        self._start: float | None = None
+        self._sent_s = 0.0
+        self._late = False
+
+    @property
+    def buffered_s(self) -> float:
+        """Audio currently buffered ahead of the playback position, in seconds."""
+        if self._start is None:
+            return 0.0
+        return max(0.0, self._start + self._sent_s - self._loop.time())
+
+    async def pace(self, samples: int) -> None:
+        """Account for a frame that was just published and wait until the next one is due."""
+        now = self._loop.time()
+        if self._start is None:
+            self._start = now
+        lateness = now - (self._start + self._sent_s)
+        if lateness > 0:
+            stats = self.stats
+            lateness_ms = lateness * 1000
+            stats.late_frames += 1
+            stats.total_lateness_ms += lateness_ms
+            stats.max_lateness_ms = max(stats.max_lateness_ms, lateness_ms)
+            if not self._late:
+                stats.underruns += 1
+            self._late = True
+            self._start += lateness
+        else:
+            self._late = False
+
+        duration = samples / self.sample_rate
+        self._sent_s += duration
+        self.stats.frames += 1
+        self.stats.audio_ms += duration * 1000
+
+        ahead = self._start + self._sent_s - now
+        if ahead > self.lead_s:
+            await asyncio.sleep(ahead - self.lead_s)
+
+
+pacing_metrics = PacingMetrics()
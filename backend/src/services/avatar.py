@@ -13,6 +13,9 @@ from livekit.plugins import tavus
 from livekit.protocol import models
 
 from ..config.settings import settings
+from .audio_framing import PcmFramer
+from .audio_pacing import AudioPacer, pacing_metrics
+from .jitter_buffer import jitter_buffers
 from .openai_tts_service import openai_tts_service
 
 logger = logging.getLogger(__name__)
@@ -25,6 +28,13 @@ class _RoomState:
     started: bool = False
 
 
+@dataclass
+class _Interrupt:
+    """Queue payload asking the avatar to stop speaking now."""
+
+    requested_at: float
+
+
 class TavusAvatarService:
     def __init__(self) -> None:
         self._enabled = bool(
@@ -97,7 +107,14 @@ class TavusAvatarService:
                 state.started = False
             raise
 
-    def enqueue_text(self, room_name: str, text: str, t0_ms: float | None = None) -> None:
+    def enqueue_text(
+        self,
+        room_name: str,
+        text: str,
+        t0_ms: float | None = None,
+        interrupt: bool = True,
+    ) -> None:
+        """Queue text for the avatar; ``interrupt=False`` appends to the current reply."""
         if not self._enabled:
             return
 
@@ -107,7 +124,31 @@ class TavusAvatarService:
             logger.warning("Tavus room state missing for %s", room_name)
             return
 
-        state.queue.put((text, t0_ms))
+        state.queue.put((text, t0_ms, interrupt))
+
+    def interrupt(self, room_name: str, requested_at: float | None = None) -> None:
+        """Drop queued speech and stop the current utterance (``requested_at``: perf_counter)."""
+        if not self._enabled:
+            return
+
+        with self._lock:
+            state = self._room_states.get(room_name)
+        if not state:
+            return
+
+        closing = False
+        while True:
+            try:
+                payload = state.queue.get_nowait()
+            except queue.Empty:
+                break
+            if payload is None:
+                closing = True
+        if requested_at is None:
+            requested_at = time.perf_counter()
+        state.queue.put(_Interrupt(requested_at))
+        if closing:
+            state.queue.put(None)
 
     def close_room(self, room_name: str) -> None:
         with self._lock:
@@ -162,7 +203,21 @@ class TavusAvatarService:
 
         session.on("close", _on_close)
 
-        current_handle = None
+        # Every handle queued for the reply being spoken (its streamed fragments or an
+        # acknowledgement plus a question) and the synthesis started ahead for each queued
+        # fragment; a new reply or a barge-in cancels all of them.
+        reply_handles: list = []
+        reply_prefetches: list[asyncio.Task] = []
+
+        def _interrupt_reply() -> None:
+            for handle in reply_handles:
+                if not handle.done():
+                    handle.interrupt(force=True)
+            reply_handles.clear()
+            for task in reply_prefetches:
+                task.cancel()
+            reply_prefetches.clear()
+
         while True:
             get_task = asyncio.get_running_loop().run_in_executor(None, state.queue.get)
             close_task = asyncio.create_task(closed.wait())
@@ -179,66 +234,68 @@ class TavusAvatarService:
             if payload is None:
                 ctx.shutdown("client_closed")
                 break
+            if isinstance(payload, _Interrupt):
+                _interrupt_reply()
+                logger.info(
+                    "Tavus interrupted room=%s latency_ms=%.1f",
+                    room_name,
+                    (time.perf_counter() - payload.requested_at) * 1000,
+                )
+                continue
             if isinstance(payload, tuple):
-                text, t0_ms = payload
+                text, t0_ms, interrupt = payload
             else:
                 text = payload
                 t0_ms = None
+                interrupt = True
 
-            if current_handle and not current_handle.done():
-                current_handle.interrupt(force=True)
-
-            audio_stream = self._pcm_frames(room_name, text, t0_ms=t0_ms)
-            current_handle = session.say(text, audio=audio_stream, add_to_chat_ctx=False)
+            if interrupt:
+                _interrupt_reply()
+            else:
+                # A queued fragment's audio is only read once the previous one has played;
+                # synthesize it now so its reader joins the flight (or hits the cache)
+                # instead of waiting for TTS between sentences.
+                prefetch = asyncio.create_task(openai_tts_service.prefetch(text))
+                prefetch.add_done_callback(self._log_prefetch_failure)
+                reply_prefetches.append(prefetch)
+
+            # Appended fragments play right after the previous one, so only the start of a
+            # reply is pre-buffered.
+            audio_stream = self._pcm_frames(room_name, text, t0_ms=t0_ms, prebuffer=interrupt)
+            reply_handles.append(session.say(text, audio=audio_stream, add_to_chat_ctx=False))
 
         logger.info("Tavus agent stopped for room %s", room_name)
 
-    async def _pcm_frames(self, room_name: str, text: str, t0_ms: float | None = None):
+    async def _pcm_frames(
+        self,
+        room_name: str,
+        text: str,
+        t0_ms: float | None = None,
+        prebuffer: bool = True,
+    ):
         sample_rate = settings.openai_tts_sample_rate
         num_channels = settings.openai_tts_channels
         bytes_per_sample = 2
         frame_samples = int(sample_rate * settings.openai_tts_frame_ms / 1000)
         frame_bytes = frame_samples * num_channels * bytes_per_sample
 
-        buffer = bytearray()
-        samples_sent = 0
-        start_time = asyncio.get_running_loop().time()
+        sample_bytes = bytes_per_sample * num_channels
+        framer = PcmFramer(frame_bytes, sample_align=sample_bytes)
+        pacer = AudioPacer(
+            sample_rate,
+            lead_ms=settings.audio_pacing_lead_ms,
+            stats=pacing_metrics.for_room(room_name),
+        )
+        jitter = jitter_buffers.for_room(room_name)
+        underruns_before = pacer.stats.underruns
+        frames = framer.iter_frames(openai_tts_service.iter_pcm_bytes(text))
+        if prebuffer:
+            frames = jitter.hold(frames, frame_bytes, settings.openai_tts_frame_ms)
         first_frame = True
 
         try:
-            async for chunk in openai_tts_service.iter_pcm_bytes(text):
-                if not chunk:
-                    continue
-                buffer.extend(chunk)
-
-                while len(buffer) >= frame_bytes:
-                    frame_data = bytes(buffer[:frame_bytes])
-                    del buffer[:frame_bytes]
-                    frame = rtc.AudioFrame(
-                        data=frame_data,
-                        sample_rate=sample_rate,
-                        num_channels=num_channels,
-                        samples_per_channel=frame_samples,
-                    )
-                    if first_frame and t0_ms is not None:
-                        t1_ms = time.time() * 1000
-                        logger.info(
-                            "Tavus first frame published room=%s latency_ms=%.0f",
-                            room_name,
-                            t1_ms - t0_ms,
-                        )
-                        first_frame = False
-                    samples_sent += frame_samples
-                    yield frame
-                    await self._pace_audio(samples_sent, sample_rate, start_time)
-        except asyncio.CancelledError:
-            return
-
-        if buffer:
-            remainder = len(buffer) - (len(buffer) % (bytes_per_sample * num_channels))
-            if remainder > 0:
-                frame_data = bytes(buffer[:remainder])
-                samples = remainder // (bytes_per_sample * num_channels)
+            async for frame_data in frames:
+                samples = len(frame_data) // sample_bytes
                 frame = rtc.AudioFrame(
                     data=frame_data,
                     sample_rate=sample_rate,
@@ -253,21 +310,23 @@ class TavusAvatarService:
                         t1_ms - t0_ms,
                     )
                     first_frame = False
-                samples_sent += samples
                 yield frame
-                await self._pace_audio(samples_sent, sample_rate, start_time)
-
-    async def _pace_audio(self, samples_sent: int, sample_rate: int, start_time: float) -> None:
-        expected = samples_sent / sample_rate
-        elapsed = asyncio.get_running_loop().time() - start_time
-        if expected > elapsed:
-            await asyncio.sleep(expected - elapsed)
+                await pacer.pace(samples)
+        except asyncio.CancelledError:
+            return
+        if prebuffer:
+            jitter.observe(pacer.stats.underruns - underruns_before)
 
     def _on_session_end(self, ctx: JobContext) -> None:
         room_name = ctx.room.name
         with self._lock:
             self._room_states.pop(room_name, None)
 
+    @staticmethod
+    def _log_prefetch_failure(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Tavus fragment prefetch failed: %s", task.exception())
+
     def _log_task_failure(self, task: asyncio.Task) -> None:
         if task.cancelled():
             return
@@ -0,0 +1,136 @@
+import asyncio
+import logging
+
+from .llm_client import llm_client
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_PROMPT = (
+    "You keep notes for an interviewer. Merge the existing notes and the new interview "
+    "exchanges into concise notes: questions already asked and the key facts from the "
+    "candidate's answers. Plain text, no preamble."
+)
+
+
+# Stored for a turn whose candidate text was empty or whitespace only.
+NO_ANSWER = "(no answer)"
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token) used for budgeting prompts."""
+    return len(text) // 4 + 1
+
+
+class ConversationMemory:
+    """Per-session interview transcript kept under a token budget.
+
+    Turns are stored as (candidate, interviewer) pairs. Once the transcript exceeds the
+    budget, all but the most recent turns are folded into a running summary by a
+    background call to a cheap model. Until that finishes, ``messages()`` simply leaves
+    out the oldest turns, so the prompt never grows past the budget.
+    """
+
+    def __init__(self, token_budget: int, keep_recent_turns: int) -> None:
+        self.token_budget = token_budget
+        self.keep_recent_turns = max(1, keep_recent_turns)
+        self.turns: list[tuple[str, str]] = []
+        self.summary = ""
+        self.summaries = 0
+        self._summary_task: asyncio.Task | None = None
+
+    @staticmethod
+    def _turn_tokens(turn: tuple[str, str]) -> int:
+        return estimate_tokens(turn[0]) + estimate_tokens(turn[1])
+
+    @property
+    def transcript_tokens(self) -> int:
+        return sum(self._turn_tokens(turn) for turn in self.turns)
+
+    def add_turn(self, candidate: str, interviewer: str) -> None:
+        # The API rejects empty messages, which would fail every later call of the session.
+        interviewer = interviewer.strip()
+        if not interviewer:
+            return
+        self.turns.append((candidate.strip() or NO_ANSWER, interviewer))
+        self._maybe_summarize()
+
+    def system_notes(self) -> str:
+        """Summary of earlier turns to append to the system prompt, or ""."""
+        if not self.summary:
+            return ""
+        return f"\n\nNotes from earlier in this interview:\n{self.summary}"
+
+    def messages(self, user_content: str) -> list[dict]:
+        """Recent turns that fit the budget, followed by the current user message."""
+        budget = self.token_budget - estimate_tokens(self.summary) - estimate_tokens(user_content)
+        recent: list[tuple[str, str]] = []
+        for turn in reversed(self.turns):
+            budget -= self._turn_tokens(turn)
+            if budget < 0:
+                break
+            recent.append(turn)
+
+        messages: list[dict] = []
+        for candidate, interviewer in reversed(recent):
+            messages.append({"role": "user", "content": candidate})
+            messages.append({"role": "assistant", "content": interviewer})
+        messages.append({"role": "user", "content": user_content})
+        return messages
+
+    def _maybe_summarize(self) -> None:
+        if self._summary_task is not None and not self._summary_task.done():
+            return
+        if len(self.turns) <= self.keep_recent_turns:
+            return
+        if estimate_tokens(self.summary) + self.transcript_tokens <= self.token_budget:
+            return
+        count = len(self.turns) - self.keep_recent_turns
+        self._summary_task = asyncio.create_task(self._summarize(count))
+
+    async def _summarize(self, count: int) -> None:
+        transcript = "\n".join(
+            f"Candidate: {candidate}\nInterviewer: {interviewer}"
+            for candidate, interviewer in self.turns[:count]
+        )
+        existing = self.summary or "(none)"
+        try:
+            summary = await llm_client.create_text(
+                model=settings.conversation_summary_model or settings.anthropic_model,
+                system=SUMMARY_PROMPT,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": f"Existing notes:\n{existing}\n\nNew exchanges:\n{transcript}",
+                    }
+                ],
+                max_tokens=settings.conversation_summary_max_tokens,
+                temperature=0,
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Conversation summary failed; keeping the raw transcript: %s", e)
+            return
+        # Only this task removes turns, and turns are only appended meanwhile.
+        del self.turns[:count]
+        self.summary = summary
+        self.summaries += 1
+        logger.info(
+            "Conversation summarized: turns=%s summary_tokens=%s",
+            count,
+            estimate_tokens(summary),
+        )
+
+    def close(self) -> None:
+        if self._summary_task is not None and not self._summary_task.done():
+            self._summary_task.cancel()
+
+    def stats(self) -> dict:
+        return {
+            "turns": len(self.turns),
+            "transcript_tokens": self.transcript_tokens,
+            "summary_tokens": estimate_tokens(self.summary) if self.summary else 0,
+            "summaries": self.summaries,
+            "token_budget": self.token_budget,
+        }
@@ -0,0 +1,128 @@
+import asyncio
+import logging
+import time
+
+from .admission import AdmissionRejected, admission_controller
+from .agent import agent_service
+from .session_reaper import session_reaper
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class DrainController:
+    """Graceful drain for shutdown and rolling deploys.
+
+    Phases: stop admitting new sessions and turns, let running turns and the replies
+    they are still speaking finish (up to ``DRAIN_TURN_DEADLINE_S``), then end every session
+    concurrently with at most ``DRAIN_CONCURRENCY`` teardowns at a time (up to
+    ``DRAIN_TEARDOWN_DEADLINE_S``).
+    Each phase is timed and the last report is kept for ``status()``.
+    """
+
+    def __init__(self) -> None:
+        self.agent = agent_service
+        self.state = "serving"
+        self.last_report: dict | None = None
+        self.turns_rejected = 0
+        self._task: asyncio.Task | None = None
+
+    async def drain(self) -> dict:
+        """Run a drain, or join the one already running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._drain(), name="drain")
+        return await asyncio.shield(self._task)
+
+    async def _drain(self) -> dict:
+        start = time.perf_counter()
+        self.state = "draining"
+        phases: dict[str, float] = {}
+
+        admission_controller.close("draining")
+        await session_reaper.stop()
+        phases["stop_admission_ms"] = round((time.perf_counter() - start) * 1000, 1)
+
+        phase_start = time.perf_counter()
+        busy = await self._wait_for_turns(settings.drain_turn_deadline_s)
+        phases["turns_ms"] = round((time.perf_counter() - phase_start) * 1000, 1)
+
+        phase_start = time.perf_counter()
+        rooms = list(self.agent.active_sessions)
+        ended, failed, unfinished = await self._teardown(rooms)
+        phases["teardown_ms"] = round((time.perf_counter() - phase_start) * 1000, 1)
+        phases["total_ms"] = round((time.perf_counter() - start) * 1000, 1)
+
+        self.state = "drained"
+        self.last_report = {
+            "rooms": len(rooms),
+            "ended": ended,
+            "failed": failed,
+            "unfinished": unfinished,
+            "turns_cut_off": busy,
+            "phases": phases,
+        }
+        logger.info("Drain finished: %s", self.last_report)
+        return self.last_report
+
+    def check_turn(self) -> None:
+        """Raise ``AdmissionRejected`` (503) for a new turn once a drain has started."""
+        if self.state != "serving":
+            self.turns_rejected += 1
+            raise AdmissionRejected(self.state, 503, settings.admission_retry_after_s)
+
+    @staticmethod
+    def _busy(session) -> bool:
+        """A turn is running, or its reply is still being spoken."""
+        tts_task = session.tts_task
+        return session.turn_lock.locked() or (tts_task is not None and not tts_task.done())
+
+    async def _wait_for_turns(self, deadline_s: float) -> int:
+        """Wait until no session has a turn or its TTS running; returns how many still do."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + deadline_s
+        while True:
+            busy = sum(1 for session in self.agent.active_sessions.values() if self._busy(session))
+            if busy == 0 or loop.time() >= deadline:
+                return busy
+            await asyncio.sleep(0.05)
+
+    async def _teardown(self, rooms: list[str]) -> tuple[int, int, int]:
+        if not rooms:
+            return 0, 0, 0
+        semaphore = asyncio.Semaphore(max(1, settings.drain_concurrency))
+
+        async def _end(room_name: str) -> bool:
+            async with semaphore:
+                return await self.agent.end_session(room_name)
+
+        tasks = [asyncio.create_task(_end(room_name)) for room_name in rooms]
+        done, pending = await asyncio.wait(tasks, timeout=settings.drain_teardown_deadline_s)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        ended = sum(1 for task in done if task.result())
+        if pending:
+            logger.warning("Drain deadline hit with %s sessions still tearing down", len(pending))
+        return ended, len(done) - ended, len(pending)
+
+    def resume(self) -> None:
+        """Accept sessions again after a drain (e.g. a cancelled deploy)."""
+        if self._task is not None and not self._task.done():
+            raise RuntimeError("Drain still in progress")
+        admission_controller.open()
+        session_reaper.start()
+        self.state = "serving"
+
+    def status(self) -> dict:
+        return {
+            "state": self.state,
+            "active_sessions": len(self.agent.active_sessions),
+            "turns_running": sum(
+                1 for session in self.agent.active_sessions.values() if self._busy(session)
+            ),
+            "turns_rejected": self.turns_rejected,
+            "last_report": self.last_report,
+        }
+
+
+drain_controller = DrainController()
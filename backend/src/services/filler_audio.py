@@ -0,0 +1,106 @@
+import asyncio
+import logging
+import random
+from typing import AsyncIterator
+
+from .audio_framing import fade_out
+from .openai_tts_service import openai_tts_service
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class FillerAudio:
+    """Short "thinking" clips kept as decoded PCM in memory.
+
+    ``cover()`` plays one while the first real chunk of a reply is pending and cuts it
+    with a short fade as soon as that chunk arrives.
+    """
+
+    def __init__(self) -> None:
+        self.tts = openai_tts_service
+        self._clips: list[bytes] = []
+        self._task: asyncio.Task | None = None
+        self.played = 0
+        self.cut = 0
+
+    def start(self) -> None:
+        if settings.filler_enabled and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._load(), name="filler_audio_load")
+
+    async def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _load(self) -> None:
+        clips = []
+        for phrase in settings.filler_phrases:
+            try:
+                pcm = bytearray()
+                async for chunk in self.tts.iter_pcm_bytes(phrase):
+                    pcm.extend(chunk)
+            except Exception as e:
+                logger.warning("Failed to prepare filler clip %r: %s", phrase, e)
+                continue
+            usable = len(pcm) - len(pcm) % (2 * settings.openai_tts_channels)
+            if usable:
+                clips.append(bytes(pcm[:usable]))
+        self._clips = clips
+        logger.info("Filler clips ready: %s", len(clips))
+
+    async def cover(
+        self, chunks: AsyncIterator[bytes | memoryview], frame_bytes: int
+    ) -> AsyncIterator[bytes | memoryview]:
+        """Pass ``chunks`` through, playing a filler clip until the first one arrives."""
+        if not settings.filler_enabled or not self._clips:
+            async for chunk in chunks:
+                yield chunk
+            return
+
+        source = chunks.__aiter__()
+        pending = asyncio.ensure_future(source.__anext__())
+        try:
+            done, _ = await asyncio.wait({pending}, timeout=settings.filler_delay_ms / 1000)
+            if not done:
+                clip = memoryview(random.choice(self._clips))
+                self.played += 1
+                offset = 0
+                # The consumer paces each frame, which lets the pending read make progress.
+                while not pending.done() and offset < len(clip):
+                    yield clip[offset : offset + frame_bytes]
+                    offset += frame_bytes
+                if offset < len(clip):
+                    self.cut += 1
+                    sample_bytes = 2 * settings.openai_tts_channels
+                    fade_bytes = int(
+                        settings.openai_tts_sample_rate * settings.filler_fade_ms / 1000
+                    ) * sample_bytes
+                    yield fade_out(
+                        clip[offset : offset + fade_bytes], settings.openai_tts_channels
+                    )
+            try:
+                first = await pending
+            except StopAsyncIteration:
+                return
+            yield first
+            async for chunk in source:
+                yield chunk
+        finally:
+            if not pending.done():
+                pending.cancel()
+                await asyncio.gather(pending, return_exceptions=True)
+
+    def stats(self) -> dict:
+        return {
+            "enabled": settings.filler_enabled,
+            "clips": len(self._clips),
+            "played": self.played,
+            "cut": self.cut,
+        }
+
+
+filler_audio = FillerAudio()
@@ -0,0 +1,132 @@
+import asyncio
+import time
+from enum import Enum
+
+from .conversation_memory import ConversationMemory
+
+
+class SessionState(str, Enum):
+    CONNECTING = "connecting"
+    GREETING = "greeting"
+    QUESTIONING = "questioning"
+    FINISHING = "finishing"
+    CLOSED = "closed"
+
+
+_TRANSITIONS: dict[SessionState, frozenset[SessionState]] = {
+    SessionState.CONNECTING: frozenset({SessionState.GREETING, SessionState.CLOSED}),
+    SessionState.GREETING: frozenset(
+        {SessionState.QUESTIONING, SessionState.FINISHING, SessionState.CLOSED}
+    ),
+    SessionState.QUESTIONING: frozenset({SessionState.FINISHING, SessionState.CLOSED}),
+    SessionState.FINISHING: frozenset({SessionState.CLOSED}),
+    SessionState.CLOSED: frozenset(),
+}
+
+
+class InterviewSession:
+    """State of one interview room.
+
+    ``state`` moves connecting -> greeting -> questioning -> finishing -> closed; any
+    state can go straight to closed. Turns hold ``turn_lock`` from start to finish, and
+    asyncio locks wake waiters in FIFO order, so overlapping ``/say`` calls run one after
+    another instead of racing on the counters and the TTS task.
+    """
+
+    __slots__ = (
+        "room_name",
+        "participant_name",
+        "job_id",
+        "created_at",
+        "state",
+        "memory",
+        "question_bank",
+        "bank_index",
+        "question_count",
+        "turn_count",
+        "turn_lock",
+        "turn_interrupt",
+        "client_ws",
+        "tts_task",
+        "publisher_task",
+        "greeting_task",
+        "speculation",
+        "speculation_task",
+        "speculation_stats",
+        "startup_t0",
+        "startup_timings",
+        "last_activity",
+    )
+
+    def __init__(
+        self,
+        room_name: str,
+        participant_name: str,
+        memory: ConversationMemory,
+        job_id: str | None = None,
+        question_bank: list[str] | None = None,
+        startup_t0: float | None = None,
+        startup_timings: dict[str, float] | None = None,
+    ) -> None:
+        self.room_name = room_name
+        self.participant_name = participant_name
+        self.job_id = job_id
+        self.created_at = asyncio.get_running_loop().time()
+        self.state = SessionState.CONNECTING
+        self.memory = memory
+        self.question_bank = question_bank or []
+        self.bank_index = 0
+        self.question_count = 0
+        self.turn_count = 0
+        self.turn_lock = asyncio.Lock()
+        self.turn_interrupt = asyncio.Event()
+        self.client_ws = None
+        self.tts_task: asyncio.Task | None = None
+        self.publisher_task: asyncio.Task | None = None
+        self.greeting_task: asyncio.Task | None = None
+        self.speculation: dict | None = None
+        self.speculation_task: asyncio.Task | None = None
+        self.speculation_stats = {"started": 0, "used": 0, "discarded": 0, "failed": 0}
+        self.startup_t0 = time.perf_counter() if startup_t0 is None else startup_t0
+        self.startup_timings = {} if startup_timings is None else startup_timings
+        self.last_activity = self.created_at
+
+    @property
+    def greeted(self) -> bool:
+        return self.state not in (SessionState.CONNECTING, SessionState.GREETING)
+
+    @property
+    def closed(self) -> bool:
+        return self.state is SessionState.CLOSED
+
+    def touch(self) -> None:
+        self.last_activity = asyncio.get_running_loop().time()
+
+    def idle_s(self) -> float:
+        return asyncio.get_running_loop().time() - self.last_activity
+
+    def transition(self, state: SessionState) -> None:
+        """Move to ``state``; staying in the current state is a no-op."""
+        if state is self.state:
+            return
+        if state not in _TRANSITIONS[self.state]:
+            raise RuntimeError(
+                f"Invalid session transition {self.state.value} -> {state.value} "
+                f"for room {self.room_name}"
+            )
+        self.state = state
+
+    def tasks(self) -> tuple[asyncio.Task | None, ...]:
+        return (self.tts_task, self.publisher_task, self.speculation_task, self.greeting_task)
+
+    def as_dict(self) -> dict:
+        return {
+            "room_name": self.room_name,
+            "participant_name": self.participant_name,
+            "job_id": self.job_id,
+            "state": self.state.value,
+            "turn_count": self.turn_count,
+            "question_count": self.question_count,
+            "turn_in_progress": self.turn_lock.locked(),
+            "idle_s": round(self.idle_s(), 1),
+        }
@@ -0,0 +1,150 @@
+import logging
+import threading
+import time
+from typing import AsyncIterator
+
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+POLICIES = ("low_latency", "smooth")
+
+
+class AdaptivePrebuffer:
+    """Per-room depth of audio held back before the first frame of an utterance is published.
+
+    After each utterance the depth is re-derived from what was observed:
+
+    * ``low_latency`` starts at ``min_ms`` and only grows after an utterance underran,
+      halving back toward the minimum once playback is clean again.
+    * ``smooth`` sizes the buffer to cover the expected production deficit,
+      ``duration * (1 - rate)`` with ``rate`` the upstream audio-per-wall-second seen so
+      far, plus a step after underruns, and decays slowly.
+    """
+
+    def __init__(self, policy: str, min_ms: float, max_ms: float, step_ms: float) -> None:
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown jitter policy {policy!r}; expected one of {POLICIES}")
+        self.policy = policy
+        self.min_ms = min_ms
+        self.max_ms = max(min_ms, max_ms)
+        self.step_ms = step_ms
+        self.depth_ms = min_ms if policy == "low_latency" else min(max_ms, min_ms + step_ms)
+        self.rate: float | None = None
+        self.duration_ms: float | None = None
+        self.utterances = 0
+        self.underrun_utterances = 0
+        self.prebuffer_wait_ms_total = 0.0
+        self._last_audio_ms = 0.0
+        self._last_wall_ms = 0.0
+
+    def _clamp(self, value: float) -> float:
+        return max(self.min_ms, min(self.max_ms, value))
+
+    async def hold(
+        self, frames: AsyncIterator[bytes | memoryview], frame_bytes: int, frame_ms: float
+    ) -> AsyncIterator[bytes | memoryview]:
+        """Yield ``frames``, holding the first ``depth_ms`` back until it is all available.
+
+        Also measures how fast upstream delivered the utterance (from its first frame to
+        the end of the source) for the next ``observe()``. Held frames are copied because
+        framer views are only valid until the next push.
+        """
+        count = int(self.depth_ms // frame_ms)
+        held: list[bytes] | None = [] if count > 1 else None
+        first_at: float | None = None
+        total_bytes = 0
+        async for frame in frames:
+            now = time.perf_counter()
+            if first_at is None:
+                first_at = now
+            total_bytes += len(frame)
+            if held is None:
+                yield frame
+                continue
+            held.append(bytes(frame))
+            if len(held) >= count:
+                self.prebuffer_wait_ms_total += (now - first_at) * 1000
+                for item in held:
+                    yield item
+                held = None
+        if first_at is not None:
+            self._last_audio_ms = total_bytes / frame_bytes * frame_ms
+            self._last_wall_ms = (time.perf_counter() - first_at) * 1000
+        if held:
+            for item in held:
+                yield item
+
+    def observe(self, underruns: int) -> None:
+        """Adapt the depth after an utterance played to the end with ``underruns``."""
+        audio_ms, wall_ms = self._last_audio_ms, self._last_wall_ms
+        self._last_audio_ms = self._last_wall_ms = 0.0
+        if audio_ms <= 0:
+            return
+        self.utterances += 1
+        if underruns:
+            self.underrun_utterances += 1
+        # Short utterances come out of the cache at once; cap the rate so they don't
+        # dominate the average.
+        rate = min(audio_ms / wall_ms, 2.0) if wall_ms > 0 else 2.0
+        self.rate = rate if self.rate is None else 0.7 * self.rate + 0.3 * rate
+        self.duration_ms = (
+            audio_ms if self.duration_ms is None else 0.7 * self.duration_ms + 0.3 * audio_ms
+        )
+
+        if self.policy == "smooth":
+            target = self.duration_ms * max(0.0, 1.0 - self.rate) * 1.25
+            if underruns:
+                target += self.step_ms
+            self.depth_ms = self._clamp(max(target, self.depth_ms * 0.8))
+        elif underruns:
+            self.depth_ms = self._clamp(self.depth_ms + self.step_ms)
+        else:
+            self.depth_ms = self._clamp(self.min_ms + (self.depth_ms - self.min_ms) / 2)
+
+    def as_dict(self) -> dict:
+        return {
+            "policy": self.policy,
+            "depth_ms": round(self.depth_ms, 1),
+            "upstream_rate": round(self.rate, 3) if self.rate is not None else None,
+            "utterances": self.utterances,
+            "underrun_utterances": self.underrun_utterances,
+            "prebuffer_wait_ms_total": round(self.prebuffer_wait_ms_total, 1),
+        }
+
+
+class JitterBuffers:
+    """Registry of per-room pre-buffers (used from the main and Tavus loops)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._rooms: dict[str, AdaptivePrebuffer] = {}
+
+    def for_room(self, room_name: str) -> AdaptivePrebuffer:
+        with self._lock:
+            prebuffer = self._rooms.get(room_name)
+            if prebuffer is None:
+                policy = settings.jitter_policy
+                if policy not in POLICIES:
+                    logger.warning("Unknown JITTER_POLICY %r; using low_latency", policy)
+                    policy = "low_latency"
+                prebuffer = AdaptivePrebuffer(
+                    policy,
+                    min_ms=settings.jitter_min_ms,
+                    max_ms=settings.jitter_max_ms,
+                    step_ms=settings.jitter_step_ms,
+                )
+                self._rooms[room_name] = prebuffer
+            return prebuffer
+
+    def snapshot(self, room_name: str) -> dict | None:
+        with self._lock:
+            prebuffer = self._rooms.get(room_name)
+        return prebuffer.as_dict() if prebuffer else None
+
+    def drop(self, room_name: str) -> None:
+        with self._lock:
+            self._rooms.pop(room_name, None)
+
+
+jitter_buffers = JitterBuffers()
@@ -1,4 +1,5 @@
 import asyncio
+from collections import deque
 from typing import Optional
 from datetime import timedelta
 try:
@@ -15,10 +16,14 @@ except ImportError:
     rtc = None
 import logging
 
+from .audio_framing import fade_out
 from ..config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# rtc.AudioSource buffers up to this much audio by default (queue_size_ms).
+_SOURCE_QUEUE_MS = 1000
+
 
 class LiveKitService:
     """Service for managing LiveKit connections and rooms"""
@@ -282,6 +287,10 @@ class LiveKitService:
         await room.local_participant.publish_track(audio_track)
         publisher["audio_source"] = audio_source
         publisher["audio_track"] = audio_track
+        # Frames still in the source's queue, so an interrupt can fade from the play head.
+        publisher["recent_frames"] = deque(
+            maxlen=_SOURCE_QUEUE_MS // max(1, settings.openai_tts_frame_ms) + 2
+        )
         if publish_video:
             video_source = rtc.VideoSource(width=640, height=360)
             video_track = rtc.LocalVideoTrack.create_video_track("ai-video", video_source)
@@ -294,7 +303,7 @@ class LiveKitService:
     async def publish_audio_frame(
         self,
         room_name: str,
-        pcm_data: bytes,
+        pcm_data: bytes | memoryview,
         sample_rate: int,
         num_channels: int,
         samples_per_channel: int,
@@ -327,6 +336,68 @@ class LiveKitService:
         result = audio_source.capture_frame(frame)
         if asyncio.iscoroutine(result):
             await result
+        # AudioFrame already owns a copy of the PCM; keep a reference, not another copy.
+        recent_frames = publisher.get("recent_frames")
+        if recent_frames is not None:
+            recent_frames.append(frame)
+
+    async def clear_audio(self, room_name: str, fade_ms: float = 20.0) -> float:
+        """Drop audio queued in the room's source and fade out; returns the fade length (ms).
+
+        The fade starts at the play head: the audio right after the last sample the
+        source has sent, or a ramp down from that sample once the queue has run dry.
+        """
+        publisher = self.publishers.get(room_name)
+        audio_source = publisher.get("audio_source") if publisher else None
+        if audio_source is None:
+            return 0.0
+
+        queued_s = getattr(audio_source, "queued_duration", 0.0) or 0.0
+        clear_queue = getattr(audio_source, "clear_queue", None)
+        if clear_queue is not None:
+            clear_queue()
+        else:
+            queued_s = 0.0
+
+        recent_frames = publisher.get("recent_frames")
+        if not recent_frames or fade_ms <= 0:
+            return 0.0
+        last = recent_frames[-1]
+        sample_rate, num_channels = last.sample_rate, last.num_channels
+        sample_bytes = 2 * num_channels
+        fade_samples = int(sample_rate * fade_ms / 1000)
+
+        # Walk back from the newest frame to the one holding the play head.
+        queued_bytes = int(queued_s * sample_rate) * sample_bytes
+        frames = []
+        covered = 0
+        for frame in reversed(recent_frames):
+            frames.append(frame)
+            covered += frame.samples_per_channel * sample_bytes
+            if covered > queued_bytes:
+                break
+        frames.reverse()
+        recent_frames.clear()
+        pcm = b"".join(memoryview(frame.data).cast("B") for frame in frames)
+        play_head = max(0, len(pcm) - queued_bytes)
+
+        tail = pcm[play_head : play_head + fade_samples * sample_bytes]
+        if len(tail) < fade_samples * sample_bytes and play_head >= sample_bytes:
+            # Nothing (or too little) left unplayed: ramp down from the last sample sent.
+            tail = pcm[play_head - sample_bytes : play_head] * fade_samples
+        samples = len(tail) // sample_bytes
+        if samples <= 0:
+            return 0.0
+        frame = rtc.AudioFrame(
+            data=fade_out(tail, num_channels),
+            sample_rate=sample_rate,
+            num_channels=num_channels,
+            samples_per_channel=samples,
+        )
+        result = audio_source.capture_frame(frame)
+        if asyncio.iscoroutine(result):
+            await result
+        return samples / sample_rate * 1000
 
     async def publish_video_frame(
         self,
@@ -352,6 +423,17 @@ class LiveKitService:
         if asyncio.iscoroutine(result):
             await result
 
+    def participant_present(self, room_name: str, identity: str) -> Optional[bool]:
+        """Whether ``identity`` is in the room, as seen by our publisher (None if unknown)."""
+        publisher = self.publishers.get(room_name)
+        room = publisher.get("room") if publisher else None
+        if room is None:
+            return None
+        return any(
+            participant.identity == identity
+            for participant in room.remote_participants.values()
+        )
+
     async def close_publisher(self, room_name: str):
         publisher = self.publishers.pop(room_name, None)
         if not publisher:
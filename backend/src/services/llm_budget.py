@@ -0,0 +1,195 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import AsyncIterator, Callable
+
+from .llm_client import llm_client
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyBudget:
+    """Bounds the time to the first LLM token of a turn.
+
+    If the primary request has not produced anything within the turn budget, a hedged
+    request to a faster model is raced against it (``LLM_BUDGET_ACTION=hedge``); if
+    neither delivers within the hedge budget, or when ``LLM_BUDGET_ACTION=fallback``,
+    the turn is answered from a fallback phrase whose audio is already cached.
+    """
+
+    def __init__(self) -> None:
+        self.counters = {
+            "turns": 0,
+            "budget_misses": 0,
+            "hedges": 0,
+            "hedge_wins": 0,
+            "fallbacks": 0,
+            "errors": 0,
+        }
+        self.events: deque[dict] = deque(maxlen=100)
+
+    def _record(self, room_name: str, event: str, start: float, **extra) -> None:
+        elapsed_ms = round((time.perf_counter() - start) * 1000)
+        self.events.append(
+            {
+                "room_name": room_name,
+                "event": event,
+                "elapsed_ms": elapsed_ms,
+                "at": time.time(),
+                **extra,
+            }
+        )
+        logger.info(
+            "LLM budget event=%s room=%s elapsed_ms=%s %s", event, room_name, elapsed_ms, extra
+        )
+
+    @staticmethod
+    async def _first_success(
+        futures: list[asyncio.Future], timeout_s: float
+    ) -> asyncio.Future | None:
+        """Wait for the first future that completes without error, up to ``timeout_s``."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_s
+        pending = {future for future in futures if not future.done()}
+        while pending:
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=max(0.0, deadline - loop.time()),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                return None
+            for future in done:
+                if not future.cancelled() and future.exception() is None:
+                    return future
+                if not future.cancelled():
+                    logger.warning("LLM request failed within budget: %s", future.exception())
+        return None
+
+    def _hedged_request(self, request: dict) -> dict | None:
+        if settings.llm_budget_action != "hedge":
+            return None
+        return {**request, "model": settings.anthropic_hedge_model or request["model"]}
+
+    async def stream(
+        self, room_name: str, request: dict, fallback: Callable[[], str]
+    ) -> AsyncIterator[str]:
+        """Stream the reply of ``request``, hedging or falling back on a slow first token."""
+        if settings.llm_budget_action == "none":
+            async for delta in llm_client.stream_text(**request):
+                yield delta
+            return
+
+        self.counters["turns"] += 1
+        start = time.perf_counter()
+        streams: dict[asyncio.Future, AsyncIterator[str]] = {}
+
+        def _open(req: dict) -> asyncio.Future:
+            stream = llm_client.stream_text(**req).__aiter__()
+            future = asyncio.ensure_future(stream.__anext__())
+            streams[future] = stream
+            return future
+
+        winner = None
+        try:
+            primary = _open(request)
+            winner = await self._first_success([primary], settings.llm_turn_budget_ms / 1000)
+            if winner is None:
+                if primary.done():
+                    self.counters["errors"] += 1
+                    self._record(room_name, "error", start, model=request["model"])
+                else:
+                    self.counters["budget_misses"] += 1
+                    self._record(room_name, "budget_miss", start, model=request["model"])
+                hedged = self._hedged_request(request)
+                if hedged is not None:
+                    self.counters["hedges"] += 1
+                    self._record(room_name, "hedge", start, model=hedged["model"])
+                    hedge = _open(hedged)
+                    winner = await self._first_success(
+                        [primary, hedge], settings.llm_hedge_budget_ms / 1000
+                    )
+                    if winner is hedge:
+                        self.counters["hedge_wins"] += 1
+                        self._record(room_name, "hedge_win", start, model=hedged["model"])
+        finally:
+            for future, stream in streams.items():
+                if future is winner:
+                    continue
+                future.cancel()
+                await asyncio.gather(future, return_exceptions=True)
+                await stream.aclose()
+
+        if winner is None:
+            self.counters["fallbacks"] += 1
+            text = fallback()
+            self._record(room_name, "fallback", start, text=text)
+            yield text
+            return
+
+        stream = streams[winner]
+        try:
+            yield winner.result()
+            async for delta in stream:
+                yield delta
+        finally:
+            await stream.aclose()
+
+    async def create(self, room_name: str, request: dict, fallback: Callable[[], str]) -> str:
+        """Non-streaming counterpart of ``stream()``.
+
+        A non-streaming reply only arrives once it is complete, so it is held to the
+        larger whole-reply ``llm_create_budget_ms`` instead of the first-token budgets.
+        """
+        if settings.llm_budget_action == "none":
+            return await llm_client.create_text(**request)
+
+        self.counters["turns"] += 1
+        start = time.perf_counter()
+        tasks = [asyncio.create_task(llm_client.create_text(**request))]
+        try:
+            winner = await self._first_success(tasks, settings.llm_create_budget_ms / 1000)
+            if winner is None:
+                if tasks[0].done():
+                    self.counters["errors"] += 1
+                    self._record(room_name, "error", start, model=request["model"])
+                else:
+                    self.counters["budget_misses"] += 1
+                    self._record(room_name, "budget_miss", start, model=request["model"])
+                hedged = self._hedged_request(request)
+                if hedged is not None:
+                    self.counters["hedges"] += 1
+                    self._record(room_name, "hedge", start, model=hedged["model"])
+                    tasks.append(asyncio.create_task(llm_client.create_text(**hedged)))
+                    winner = await self._first_success(tasks, settings.llm_create_budget_ms / 1000)
+                    if winner is tasks[1]:
+                        self.counters["hedge_wins"] += 1
+                        self._record(room_name, "hedge_win", start, model=hedged["model"])
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if winner is None:
+            self.counters["fallbacks"] += 1
+            text = fallback()
+            self._record(room_name, "fallback", start, text=text)
+            return text
+        return winner.result()
+
+    def stats(self) -> dict:
+        return {
+            "action": settings.llm_budget_action,
+            "turn_budget_ms": settings.llm_turn_budget_ms,
+            "hedge_budget_ms": settings.llm_hedge_budget_ms,
+            "create_budget_ms": settings.llm_create_budget_ms,
+            "hedge_model": settings.anthropic_hedge_model,
+            **self.counters,
+            "recent_events": list(self.events),
+        }
+
+
+llm_budget = LatencyBudget()
@@ -0,0 +1,197 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import httpx
+from anthropic import AsyncAnthropic
+
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LLMTimeoutError(RuntimeError):
+    """Raised when an LLM request misses its deadline."""
+
+
+class _LatencyStats:
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total_s += seconds
+        self.max_s = max(self.max_s, seconds)
+
+    def as_dict(self) -> dict:
+        return {
+            "avg_ms": round(self.total_s / self.count * 1000, 1) if self.count else 0.0,
+            "max_ms": round(self.max_s * 1000, 1),
+        }
+
+
+class LLMClient:
+    """Shared AsyncAnthropic client with a bounded connection pool and concurrency limits.
+
+    Requests wait for a global slot and a per-model slot before they are sent; queue
+    wait, latency, time to first token, timeouts and errors are tracked for stats().
+    """
+
+    def __init__(self) -> None:
+        self._client: AsyncAnthropic | None = None
+        self._global_slots: asyncio.Semaphore | None = None
+        self._model_slots: dict[str, asyncio.Semaphore] = {}
+        self.requests = 0
+        self.in_flight = 0
+        self.queued = 0
+        self.errors = 0
+        self.timeouts = 0
+        self._queue_wait = _LatencyStats()
+        self._latency = _LatencyStats()
+        self._first_token = _LatencyStats()
+
+    def _get_client(self) -> AsyncAnthropic:
+        if self._client is None:
+            api_key = settings.anthropic_api_key
+            if not api_key:
+                raise RuntimeError("ANTHROPIC_API_KEY is not set")
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.llm_pool_size,
+                    max_keepalive_connections=settings.llm_pool_size,
+                ),
+                timeout=httpx.Timeout(settings.llm_request_timeout_s, connect=5.0),
+            )
+            self._client = AsyncAnthropic(
+                api_key=api_key,
+                http_client=http_client,
+                max_retries=settings.llm_max_retries,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    @asynccontextmanager
+    async def _slot(self, model: str):
+        if self._global_slots is None:
+            self._global_slots = asyncio.Semaphore(settings.llm_max_concurrency)
+        model_slots = self._model_slots.get(model)
+        if model_slots is None:
+            model_slots = asyncio.Semaphore(settings.llm_max_concurrency_per_model)
+            self._model_slots[model] = model_slots
+
+        loop = asyncio.get_running_loop()
+        wait_start = loop.time()
+        self.queued += 1
+        try:
+            await self._global_slots.acquire()
+            try:
+                await model_slots.acquire()
+            except BaseException:
+                self._global_slots.release()
+                raise
+        finally:
+            self.queued -= 1
+        self._queue_wait.add(loop.time() - wait_start)
+
+        self.requests += 1
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            model_slots.release()
+            self._global_slots.release()
+
+    async def create_text(self, *, model: str, timeout_s: float | None = None, **kwargs) -> str:
+        """Send a non-streaming Messages request and return the joined text blocks."""
+        timeout_s = timeout_s or settings.llm_request_timeout_s
+        async with self._slot(model):
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            try:
+                response = await asyncio.wait_for(
+                    self._get_client().messages.create(model=model, timeout=timeout_s, **kwargs),
+                    timeout=timeout_s,
+                )
+            except asyncio.TimeoutError as exc:
+                self.timeouts += 1
+                raise LLMTimeoutError(f"LLM request timed out after {timeout_s}s") from exc
+            except Exception:
+                self.errors += 1
+                raise
+            self._latency.add(loop.time() - start)
+
+        content_parts: list[str] = []
+        for block in getattr(response, "content", []) or []:
+            block_type = block.get("type") if isinstance(block, dict) else getattr(block, "type", None)
+            if block_type != "text":
+                continue
+            text_part = block.get("text") if isinstance(block, dict) else getattr(block, "text", None)
+            if text_part:
+                content_parts.append(text_part)
+        content = " ".join(content_parts).strip()
+        if not content:
+            logger.error("LLM returned empty content; response=%s", response)
+            raise RuntimeError("LLM returned empty content")
+        return content
+
+    async def stream_text(
+        self, *, model: str, timeout_s: float | None = None, **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream text deltas of a Messages request; the whole stream shares one deadline."""
+        timeout_s = timeout_s or settings.llm_request_timeout_s
+        async with self._slot(model):
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            deadline = start + timeout_s
+            first = True
+            try:
+                async with self._get_client().messages.stream(
+                    model=model, timeout=timeout_s, **kwargs
+                ) as stream:
+                    deltas = stream.text_stream.__aiter__()
+                    while True:
+                        try:
+                            delta = await asyncio.wait_for(
+                                deltas.__anext__(), timeout=max(0.0, deadline - loop.time())
+                            )
+                        except StopAsyncIteration:
+                            break
+                        if first:
+                            self._first_token.add(loop.time() - start)
+                            first = False
+                        yield delta
+            except asyncio.TimeoutError as exc:
+                self.timeouts += 1
+                raise LLMTimeoutError(f"LLM stream timed out after {timeout_s}s") from exc
+            except (GeneratorExit, asyncio.CancelledError):
+                raise
+            except Exception:
+                self.errors += 1
+                raise
+            self._latency.add(loop.time() - start)
+
+    def stats(self) -> dict:
+        return {
+            "requests": self.requests,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "max_concurrency": settings.llm_max_concurrency,
+            "max_concurrency_per_model": settings.llm_max_concurrency_per_model,
+            "pool_size": settings.llm_pool_size,
+            "queue_wait": self._queue_wait.as_dict(),
+            "latency": self._latency.as_dict(),
+            "first_token": self._first_token.as_dict(),
+        }
+
+
+llm_client = LLMClient()
@@ -1,17 +1,76 @@
 import asyncio
 import hashlib
 import logging
+import os
+import uuid
 from pathlib import Path
 
 import aiofiles
 import edge_tts
 from imageio_ffmpeg import get_ffmpeg_exe
 
+from .audio_decoder import create_decoder
+from .tts_cache import PcmFileCache, PcmMemoryCache, TTSDiskCache
 from ..config.settings import settings
 
 logger = logging.getLogger(__name__)
 
 
+class _InflightSynthesis:
+    """One upstream synthesis shared by every reader asking for the same cache key.
+
+    Decoded chunks are kept so late readers replay from the start; the producer is
+    cancelled when the last reader goes away before it finishes, and a cancelled flight
+    is never joined again.
+    """
+
+    def __init__(self, cache_key: str) -> None:
+        self.cache_key = cache_key
+        self.chunks: list[bytes] = []
+        self.done = False
+        self.error: BaseException | None = None
+        self.readers = 0
+        self.abandoned = False
+        self.task: asyncio.Task | None = None
+        self.loop = asyncio.get_running_loop()
+        self._updated = asyncio.Event()
+
+    def append(self, chunk: bytes) -> None:
+        self.chunks.append(chunk)
+        self._notify()
+
+    def finish(self, error: BaseException | None = None) -> None:
+        self.done = True
+        self.error = error
+        self._notify()
+
+    def _notify(self) -> None:
+        self._updated.set()
+        self._updated = asyncio.Event()
+
+    async def read(self):
+        self.readers += 1
+        index = 0
+        try:
+            while True:
+                updated = self._updated
+                if index < len(self.chunks):
+                    chunk = self.chunks[index]
+                    index += 1
+                    yield chunk
+                    continue
+                if self.error is not None:
+                    raise self.error
+                if self.done:
+                    return
+                await updated.wait()
+        finally:
+            self.readers -= 1
+            if self.readers == 0 and not self.done and self.task is not None:
+                self.abandoned = True
+                self.task.cancel()
+
+
 class EdgeTTSService:
     def __init__(self) -> None:
         base_dir = Path(__file__).resolve().parents[2]
@@ -20,6 +79,69 @@ class EdgeTTSService:
         self._cache_dir.mkdir(parents=True, exist_ok=True)
         self._static_dir.mkdir(parents=True, exist_ok=True)
         self._ffmpeg_path = get_ffmpeg_exe()
+        self._decoder = create_decoder(
+            settings.tts_decoder_backend,
+            self._ffmpeg_path,
+            sample_rate=settings.openai_tts_sample_rate,
+            num_channels=settings.openai_tts_channels,
+            max_workers=settings.tts_decoder_max_workers,
+            prewarm=settings.tts_decoder_prewarm,
+            job_timeout_s=settings.tts_decoder_job_timeout_s,
+            chunk_bytes=settings.openai_tts_chunk_bytes,
+        )
+        self._memory_cache = PcmMemoryCache(
+            max_bytes=settings.tts_memory_cache_bytes,
+            max_entry_bytes=settings.tts_memory_cache_max_entry_bytes,
+        )
+        frame_samples = int(settings.openai_tts_sample_rate * settings.openai_tts_frame_ms / 1000)
+        self._pcm_files: PcmFileCache | None = None
+        if settings.tts_pcm_cache_enabled:
+            self._pcm_files = PcmFileCache(
+                self._cache_dir,
+                sample_rate=settings.openai_tts_sample_rate,
+                num_channels=settings.openai_tts_channels,
+                frame_bytes=frame_samples * settings.openai_tts_channels * 2,
+                max_entry_bytes=settings.tts_pcm_cache_max_entry_bytes,
+            )
+        self._disk_cache = TTSDiskCache(
+            self._cache_dir,
+            index_path=base_dir / settings.tts_cache_index_path,
+            max_bytes=settings.tts_cache_max_bytes,
+            max_entries=settings.tts_cache_max_entries,
+            evict_interval_s=settings.tts_cache_evict_interval_s,
+            on_evict=self._on_disk_evict,
+            evict=settings.tts_cache_evict_enabled,
+        )
+        self._inflight: dict[str, _InflightSynthesis] = {}
+        self._single_flight_joins = 0
+
+    async def start(self) -> None:
+        await self._decoder.start()
+        await self._disk_cache.start()
+
+    async def stop(self) -> None:
+        await self._decoder.close()
+        await self._disk_cache.stop()
+
+    def _on_disk_evict(self, keys: list[str]) -> None:
+        if self._pcm_files is None:
+            return
+        for key in keys:
+            self._pcm_files.forget(key)
+
+    def decoder_stats(self) -> dict:
+        return {"backend": self._decoder.name, **self._decoder.stats()}
+
+    def cache_stats(self) -> dict:
+        stats = {
+            "memory": self._memory_cache.stats(),
+            "inflight": len(self._inflight),
+            "single_flight_joins": self._single_flight_joins,
+            "disk": self._disk_cache.stats(),
+        }
+        if self._pcm_files is not None:
+            stats["pcm_files"] = self._pcm_files.stats()
+        return stats
 
     def _build_cache_key(self, text: str) -> str:
         key = "|".join(
@@ -44,17 +166,87 @@ class EdgeTTSService:
             rel_path = Path("audio") / filename
         return f"{settings.static_url_path}/{rel_path.as_posix()}"
 
+    def is_cached(self, text: str) -> bool:
+        cache_key = self._build_cache_key(text)
+        if self._memory_cache.contains(cache_key):
+            return True
+        return self._pcm_files is not None and self._pcm_files.path_for(cache_key).exists()
+
+    async def prefetch(self, text: str) -> None:
+        """Synthesize ``text`` into the caches without publishing it anywhere."""
+        async for _ in self.iter_pcm_bytes(text):
+            pass
+
     async def iter_pcm_bytes(self, text: str):
+        cache_key = self._build_cache_key(text)
+        pcm = self._memory_cache.get(cache_key)
+        if pcm is None and self._pcm_files is not None:
+            pcm = self._pcm_files.open(cache_key)
+        if pcm is not None:
+            self._disk_cache.record_hit(cache_key)
+            view = memoryview(pcm)
+            chunk_bytes = settings.openai_tts_chunk_bytes
+            for offset in range(0, len(view), chunk_bytes):
+                yield view[offset : offset + chunk_bytes]
+            return
+
+        flight = self._inflight.get(cache_key)
+        if flight is None or flight.abandoned or flight.loop is not asyncio.get_running_loop():
+            # Readers can only share a producer on the same event loop; a caller on another
+            # loop runs its own synthesis (the mp3 publish is atomic either way). A flight
+            # whose readers all left is being cancelled, so start over instead of joining.
+            flight_on_other_loop = flight is not None and not flight.abandoned
+            flight = _InflightSynthesis(cache_key)
+            if flight_on_other_loop:
+                self._inflight.setdefault(cache_key, flight)
+            else:
+                self._inflight[cache_key] = flight
+            flight.task = asyncio.create_task(self._run_synthesis(flight, text))
+        else:
+            self._single_flight_joins += 1
+            self._disk_cache.record_hit(cache_key)
+            logger.info("Joining in-flight TTS synthesis: %s", cache_key)
+
+        async for chunk in flight.read():
+            yield chunk
+
+    async def _run_synthesis(self, flight: _InflightSynthesis, text: str) -> None:
+        try:
+            async for chunk in self._iter_uncached_pcm(text):
+                flight.append(chunk)
+        except asyncio.CancelledError:
+            # The cancellation belongs to the producer; readers get an ordinary error.
+            flight.finish(RuntimeError(f"TTS synthesis cancelled: {flight.cache_key}"))
+            raise
+        except Exception as exc:
+            flight.finish(exc)
+            return
+        finally:
+            if self._inflight.get(flight.cache_key) is flight:
+                del self._inflight[flight.cache_key]
+
+        pcm = b"".join(flight.chunks)
+        self._memory_cache.put(flight.cache_key, pcm)
+        flight.finish()
+        if self._pcm_files is not None and self._pcm_files.accepts(len(pcm)):
+            await asyncio.to_thread(self._pcm_files.write, flight.cache_key, pcm)
+        self._disk_cache.record_write(flight.cache_key)
+
+    async def _iter_uncached_pcm(self, text: str):
         filename = self._build_filename(text)
         file_path = self._cache_dir / filename
 
         if file_path.exists():
             logger.info("Using cached TTS audio: %s", filename)
+            yielded = False
             try:
                 async for chunk in self._yield_pcm_from_mp3(file_path):
+                    yielded = True
                     yield chunk
                 return
             except Exception as exc:
+                if yielded:
+                    raise
                 logger.warning("Cached TTS decode failed, regenerating: %s", exc)
                 try:
                     file_path.unlink()
@@ -72,32 +264,10 @@ class EdgeTTSService:
             logger.info("Generated TTS audio: %s", filename)
 
     async def _stream_pcm_from_edge_tts(self, text: str, file_path: Path):
-        cmd = [
-            self._ffmpeg_path,
-            "-hide_banner",
-            "-loglevel",
-            "error",
-            "-i",
-            "pipe:0",
-            "-f",
-            "s16le",
-            "-acodec",
-            "pcm_s16le",
-            "-ar",
-            str(settings.openai_tts_sample_rate),
-            "-ac",
-            str(settings.openai_tts_channels),
-            "pipe:1",
-        ]
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        assert process.stdin is not None
-        assert process.stdout is not None
+        async for chunk in self._decoder.decode(self._iter_edge_tts_mp3(text, file_path)):
+            yield chunk
 
+    async def _iter_edge_tts_mp3(self, text: str, file_path: Path):
         communicate = edge_tts.Communicate(
             text,
             settings.edge_tts_voice,
@@ -105,102 +275,46 @@ class EdgeTTSService:
             volume=settings.edge_tts_volume,
             pitch=settings.edge_tts_pitch,
         )
-
-        async def _feed_stdin():
-            async with aiofiles.open(file_path, "wb") as handle:
+        # Write to a private temp file and publish it atomically once the stream is
+        # complete, so concurrent readers never see a half-written mp3.
+        tmp_path = file_path.with_name(f"{file_path.name}.{uuid.uuid4().hex}.tmp")
+        published = False
+        try:
+            async with aiofiles.open(tmp_path, "wb") as handle:
                 async for message in communicate.stream():
                     if message.get("type") != "audio":
                         continue
                     data = message["data"]
                     await handle.write(data)
-                    process.stdin.write(data)
-                    await process.stdin.drain()
-            process.stdin.close()
-
-        feed_task = asyncio.create_task(_feed_stdin())
-        feed_error = None
-        try:
-            while True:
-                chunk = await process.stdout.read(settings.openai_tts_chunk_bytes)
-                if not chunk:
-                    break
-                yield chunk
+                    yield data
+            os.replace(tmp_path, file_path)
+            published = True
         finally:
-            if not feed_task.done():
-                feed_task.cancel()
-            try:
-                await feed_task
-            except asyncio.CancelledError:
-                pass
-            except Exception as exc:
-                feed_error = exc
-            if process.stdin and not process.stdin.is_closing():
-                process.stdin.close()
-            stderr_output = b""
-            if process.stderr:
-                stderr_output = await process.stderr.read()
-            returncode = await process.wait()
-            if returncode != 0:
-                logger.error("ffmpeg decode failed (%s): %s", returncode, stderr_output.decode())
-            if feed_error:
-                raise feed_error
+            if not published:
+                try:
+                    tmp_path.unlink()
+                except FileNotFoundError:
+                    pass
 
     async def _yield_pcm_from_mp3(self, file_path: Path):
-        logger.info("Decoding cached TTS audio with ffmpeg: %s", file_path.name)
-        cmd = [
-            self._ffmpeg_path,
-            "-hide_banner",
-            "-loglevel",
-            "error",
-            "-i",
-            str(file_path),
-            "-f",
-            "s16le",
-            "-acodec",
-            "pcm_s16le",
-            "-ar",
-            str(settings.openai_tts_sample_rate),
-            "-ac",
-            str(settings.openai_tts_channels),
-            "pipe:1",
-        ]
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        logger.info("Decoding cached TTS audio with %s: %s", self._decoder.name, file_path.name)
         first_chunk_logged = False
-        try:
-            assert process.stdout is not None
-            try:
-                first_chunk = await asyncio.wait_for(
-                    process.stdout.read(settings.openai_tts_chunk_bytes),
-                    timeout=2,
-                )
-            except asyncio.TimeoutError as exc:
-                raise RuntimeError("ffmpeg decode timeout") from exc
-
-            if first_chunk:
-                logger.info("ffmpeg PCM chunk bytes=%s", len(first_chunk))
+        async for chunk in self._decoder.decode(
+            self._iter_file_bytes(file_path), first_chunk_timeout_s=2
+        ):
+            if not first_chunk_logged:
+                logger.info("%s PCM chunk bytes=%s", self._decoder.name, len(chunk))
                 first_chunk_logged = True
-                yield first_chunk
-            else:
-                return
+            yield chunk
+        logger.info("%s decode finished: %s", self._decoder.name, file_path.name)
 
+    async def _iter_file_bytes(self, file_path: Path):
+        async with aiofiles.open(file_path, "rb") as handle:
             while True:
-                chunk = await process.stdout.read(settings.openai_tts_chunk_bytes)
-                if not chunk:
+                data = await handle.read(settings.openai_tts_chunk_bytes)
+                if not data:
                     break
-                yield chunk
-        finally:
-            stderr_output = b""
-            if process.stderr:
-                stderr_output = await process.stderr.read()
-            returncode = await process.wait()
-            if returncode != 0:
-                logger.error("ffmpeg decode failed (%s): %s", returncode, stderr_output.decode())
-            else:
-                logger.info("ffmpeg decode finished (%s)", returncode)
+                yield data
 
 
 openai_tts_service = EdgeTTSService()
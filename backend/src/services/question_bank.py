@@ -0,0 +1,212 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from .llm_client import llm_client
+from .openai_tts_service import openai_tts_service
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+QUESTION_BANK_PROMPT = (
+    "You are an HR interviewer at a high-tech company preparing a spoken interview. "
+    "From the job posting, write {count} interview questions ranked from most to least "
+    "important for judging a candidate for this role. Each question must stand on its own, "
+    "be answerable out loud and stay within 20 words. "
+    "Reply with a JSON array of strings only."
+)
+
+
+def _parse_questions(content: str, count: int) -> list[str]:
+    start, end = content.find("["), content.rfind("]")
+    if start == -1 or end <= start:
+        raise ValueError("Question bank response is not a JSON array")
+    items = json.loads(content[start : end + 1])
+    questions = [item.strip() for item in items if isinstance(item, str) and item.strip()]
+    if not questions:
+        raise ValueError("Question bank response has no questions")
+    return list(dict.fromkeys(questions))[:count]
+
+
+class QuestionBankService:
+    """Ranked interview questions per job, generated once by the LLM and kept in SQLite.
+
+    Building a bank also pre-synthesizes every question into the TTS cache, so a session
+    created for the job can speak its questions without an LLM or TTS round trip.
+    """
+
+    def __init__(self) -> None:
+        base_dir = Path(__file__).resolve().parents[2]
+        self.path = base_dir / settings.question_bank_path
+        self.tts = openai_tts_service
+        self._conn: sqlite3.Connection | None = None
+        self._db_lock = threading.Lock()
+        self._banks: dict[str, list[str]] = {}
+        self._building: dict[str, asyncio.Task] = {}
+        self.builds = 0
+        self.build_failures = 0
+
+    async def start(self) -> None:
+        await asyncio.to_thread(self._open)
+
+    async def stop(self) -> None:
+        for task in list(self._building.values()):
+            task.cancel()
+        await asyncio.gather(*self._building.values(), return_exceptions=True)
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    async def get(self, job_id: str) -> list[str]:
+        """Ranked questions for ``job_id`` (empty if no bank was built)."""
+        questions = self._banks.get(job_id)
+        if questions is None:
+            questions = await asyncio.to_thread(self._load, job_id)
+            if questions:
+                self._banks[job_id] = questions
+        return list(questions)
+
+    async def all_questions(self) -> list[str]:
+        return await asyncio.to_thread(self._load_all)
+
+    async def build(self, job: dict, force: bool = False) -> list[str]:
+        """Generate, store and pre-synthesize the bank for one job dict (``Job.to_dict()``)."""
+        job_id = str(job["id"])
+        if not force:
+            existing = await self.get(job_id)
+            if existing:
+                return existing
+        # Concurrent builds of the same job share one LLM call.
+        task = self._building.get(job_id)
+        if task is None or task.done():
+            task = asyncio.create_task(self._build(job_id, job), name=f"question_bank:{job_id}")
+            self._building[job_id] = task
+            task.add_done_callback(lambda _: self._building.pop(job_id, None))
+        return await asyncio.shield(task)
+
+    async def build_many(self, jobs: list[dict], force: bool = False) -> dict:
+        """Batch pipeline over several jobs with bounded concurrency."""
+        semaphore = asyncio.Semaphore(max(1, settings.question_bank_build_concurrency))
+        results: dict[str, object] = {}
+
+        async def _one(job: dict) -> None:
+            async with semaphore:
+                try:
+                    results[str(job["id"])] = len(await self.build(job, force=force))
+                except Exception as e:
+                    logger.warning("Question bank build failed for job %s: %s", job.get("id"), e)
+                    results[str(job["id"])] = str(e)
+
+        await asyncio.gather(*(_one(job) for job in jobs))
+        return results
+
+    async def _build(self, job_id: str, job: dict) -> list[str]:
+        start = time.perf_counter()
+        count = settings.question_bank_size
+        posting = "\n".join(
+            f"{label}: {job.get(field)}"
+            for label, field in (
+                ("Title", "title"),
+                ("Company", "company"),
+                ("Description", "description"),
+                ("Qualifications", "qualifications"),
+                ("Responsibilities", "responsibilities"),
+            )
+            if job.get(field)
+        )
+        try:
+            content = await llm_client.create_text(
+                model=settings.question_bank_model or settings.anthropic_model,
+                system=QUESTION_BANK_PROMPT.format(count=count),
+                messages=[{"role": "user", "content": posting}],
+                max_tokens=60 * count,
+                temperature=0.3,
+            )
+            questions = _parse_questions(content, count)
+        except Exception:
+            self.build_failures += 1
+            raise
+
+        await asyncio.to_thread(self._store, job_id, questions)
+        self._banks[job_id] = questions
+        self.builds += 1
+
+        semaphore = asyncio.Semaphore(max(1, settings.tts_warmup_concurrency))
+
+        async def _synthesize(text: str) -> None:
+            async with semaphore:
+                try:
+                    await self.tts.prefetch(text)
+                except Exception as e:
+                    logger.warning("Question bank TTS failed for %r: %s", text[:60], e)
+
+        await asyncio.gather(*(_synthesize(text) for text in questions))
+        logger.info(
+            "Question bank built: job=%s questions=%s duration_ms=%.0f",
+            job_id,
+            len(questions),
+            (time.perf_counter() - start) * 1000,
+        )
+        return questions
+
+    def stats(self) -> dict:
+        return {
+            "jobs_loaded": len(self._banks),
+            "building": len(self._building),
+            "builds": self.builds,
+            "build_failures": self.build_failures,
+        }
+
+    def _open(self) -> None:
+        with self._db_lock:
+            if self._conn is not None:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS job_questions ("
+                "job_id TEXT NOT NULL, rank INTEGER NOT NULL, question TEXT NOT NULL, "
+                "created_at REAL NOT NULL, PRIMARY KEY (job_id, rank))"
+            )
+            conn.commit()
+            self._conn = conn
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            raise RuntimeError("Question bank store is not started")
+        return self._conn
+
+    def _load(self, job_id: str) -> list[str]:
+        with self._db_lock:
+            rows = self._connection().execute(
+                "SELECT question FROM job_questions WHERE job_id = ? ORDER BY rank", (job_id,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def _load_all(self) -> list[str]:
+        with self._db_lock:
+            rows = self._connection().execute(
+                "SELECT question FROM job_questions ORDER BY job_id, rank"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def _store(self, job_id: str, questions: list[str]) -> None:
+        now = time.time()
+        with self._db_lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM job_questions WHERE job_id = ?", (job_id,))
+                conn.executemany(
+                    "INSERT INTO job_questions (job_id, rank, question, created_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    [(job_id, rank, question, now) for rank, question in enumerate(questions)],
+                )
+
+
+question_bank_service = QuestionBankService()
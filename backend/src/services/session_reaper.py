@@ -0,0 +1,131 @@
+import asyncio
+import logging
+import time
+
+from .agent import agent_service
+from .livekit_service import livekit_service
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class SessionReaper:
+    """Ends sessions nobody has used for ``SESSION_IDLE_TTL_S``.
+
+    A session counts as active while a turn is running, while a client WebSocket is
+    connected, or while the candidate is in the LiveKit room (as seen by our publisher).
+    Otherwise its last say/interrupt/WebSocket message is what ages it. Idle sessions
+    are torn down concurrently, and a sweep waits at most ``SESSION_REAPER_DEADLINE_S``
+    for them; slower teardowns finish in the background.
+    """
+
+    def __init__(self) -> None:
+        self.agent = agent_service
+        self.livekit = livekit_service
+        self._task: asyncio.Task | None = None
+        self._pending: set[asyncio.Task] = set()
+        self.sweeps = 0
+        self.reclaimed = 0
+        self.failures = 0
+        self.overran_deadline = 0
+        self.last_sweep_ms = 0.0
+
+    def start(self) -> None:
+        if settings.session_idle_ttl_s <= 0:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="session_reaper")
+
+    async def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(settings.session_reaper_interval_s)
+            try:
+                await self.sweep()
+            except Exception:
+                logger.exception("Session reaper sweep failed")
+
+    def _is_active(self, session) -> bool:
+        if session.turn_lock.locked() or session.client_ws is not None:
+            return True
+        return bool(self.livekit.participant_present(session.room_name, session.participant_name))
+
+    def idle_rooms(self) -> list[str]:
+        idle = []
+        for room_name, session in list(self.agent.active_sessions.items()):
+            if self._is_active(session):
+                session.touch()
+            elif session.idle_s() >= settings.session_idle_ttl_s:
+                idle.append(room_name)
+        return idle
+
+    async def sweep(self) -> list[str]:
+        """Tear down the sessions that are idle now; returns the rooms reclaimed in time."""
+        start = time.perf_counter()
+        self.sweeps += 1
+        rooms = self.idle_rooms()
+        if not rooms:
+            self.last_sweep_ms = (time.perf_counter() - start) * 1000
+            return []
+
+        semaphore = asyncio.Semaphore(max(1, settings.session_reaper_concurrency))
+
+        async def _reap(room_name: str) -> bool:
+            async with semaphore:
+                logger.info("Reaping idle session room=%s", room_name)
+                return await self.agent.end_session(room_name)
+
+        tasks = {asyncio.create_task(_reap(room_name)): room_name for room_name in rooms}
+        for task in tasks:
+            self._pending.add(task)
+            task.add_done_callback(self._finished)
+        await asyncio.wait(tasks, timeout=settings.session_reaper_deadline_s)
+
+        reclaimed = [room for task, room in tasks.items() if self._ended(task)]
+        overran = sum(1 for task in tasks if not task.done())
+        self.overran_deadline += overran
+        self.last_sweep_ms = (time.perf_counter() - start) * 1000
+        logger.info(
+            "Session reaper: idle=%s reclaimed=%s overran=%s duration_ms=%.0f",
+            len(rooms),
+            len(reclaimed),
+            overran,
+            self.last_sweep_ms,
+        )
+        return reclaimed
+
+    @staticmethod
+    def _ended(task: asyncio.Task) -> bool:
+        """Whether the teardown finished and ended the session, without raising its error."""
+        return task.done() and not task.cancelled() and task.exception() is None and task.result()
+
+    def _finished(self, task: asyncio.Task) -> None:
+        self._pending.discard(task)
+        if task.cancelled():
+            return
+        if self._ended(task):
+            self.reclaimed += 1
+        else:
+            self.failures += 1
+
+    def stats(self) -> dict:
+        return {
+            "idle_ttl_s": settings.session_idle_ttl_s,
+            "active_sessions": len(self.agent.active_sessions),
+            "sweeps": self.sweeps,
+            "reclaimed": self.reclaimed,
+            "failures": self.failures,
+            "overran_deadline": self.overran_deadline,
+            "in_progress": len(self._pending),
+            "last_sweep_ms": round(self.last_sweep_ms, 1),
+        }
+
+
+session_reaper = SessionReaper()
@@ -0,0 +1,355 @@
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable
+
+import httpx
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Header set on requests forwarded between workers so they are never forwarded twice.
+FORWARDED_HEADER = "X-Interview-Forwarded"
+
+
+class RoomOwnedError(RuntimeError):
+    """The room's lease is held by another worker."""
+
+    def __init__(self, room_name: str, owner: str | None) -> None:
+        super().__init__(f"Room {room_name} is already served by worker {owner}")
+        self.room_name = room_name
+        self.owner = owner
+
+
+class SessionStore(ABC):
+    """Session records and room leases shared by every API worker.
+
+    A record is a small JSON-serializable summary of a session (see
+    ``InterviewSession.as_dict()``); live objects such as the LiveKit publisher stay in
+    the worker that holds the room's lease.
+    """
+
+    @abstractmethod
+    async def put_session(self, room_name: str, record: dict) -> None: ...
+
+    @abstractmethod
+    async def get_session(self, room_name: str) -> dict | None: ...
+
+    @abstractmethod
+    async def delete_session(self, room_name: str) -> None: ...
+
+    @abstractmethod
+    async def list_sessions(self) -> list[str]: ...
+
+    @abstractmethod
+    async def acquire_lease(self, room_name: str, owner: str, ttl_s: float) -> bool:
+        """Take the lease if it is free, expired or already held by ``owner``."""
+
+    @abstractmethod
+    async def renew_lease(self, room_name: str, owner: str, ttl_s: float) -> bool:
+        """Extend a lease still held by ``owner``; False if it was lost."""
+
+    @abstractmethod
+    async def release_lease(self, room_name: str, owner: str) -> None: ...
+
+    @abstractmethod
+    async def lease_owner(self, room_name: str) -> str | None: ...
+
+    async def close(self) -> None:
+        pass
+
+
+class MemorySessionStore(SessionStore):
+    """Process-local store; correct for a single worker only."""
+
+    def __init__(self) -> None:
+        self._sessions: dict[str, dict] = {}
+        self._leases: dict[str, tuple[str, float]] = {}
+
+    async def put_session(self, room_name: str, record: dict) -> None:
+        self._sessions[room_name] = dict(record)
+
+    async def get_session(self, room_name: str) -> dict | None:
+        record = self._sessions.get(room_name)
+        return dict(record) if record is not None else None
+
+    async def delete_session(self, room_name: str) -> None:
+        self._sessions.pop(room_name, None)
+
+    async def list_sessions(self) -> list[str]:
+        return list(self._sessions)
+
+    def _live_owner(self, room_name: str) -> str | None:
+        lease = self._leases.get(room_name)
+        if lease is None:
+            return None
+        if lease[1] <= time.monotonic():
+            del self._leases[room_name]
+            return None
+        return lease[0]
+
+    async def acquire_lease(self, room_name: str, owner: str, ttl_s: float) -> bool:
+        current = self._live_owner(room_name)
+        if current is not None and current != owner:
+            return False
+        self._leases[room_name] = (owner, time.monotonic() + ttl_s)
+        return True
+
+    async def renew_lease(self, room_name: str, owner: str, ttl_s: float) -> bool:
+        if self._live_owner(room_name) != owner:
+            return False
+        self._leases[room_name] = (owner, time.monotonic() + ttl_s)
+        return True
+
+    async def release_lease(self, room_name: str, owner: str) -> None:
+        if self._live_owner(room_name) == owner:
+            del self._leases[room_name]
+
+    async def lease_owner(self, room_name: str) -> str | None:
+        return self._live_owner(room_name)
+
+
+# Compare-and-set scripts so a worker can only renew or drop a lease it still holds.
+_ACQUIRE_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if current == false or current == ARGV[1] then
+  redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[2])
+  return 1
+end
+return 0
+"""
+_RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class RedisSessionStore(SessionStore):
+    """Store backed by any server that speaks the Redis protocol (Redis, Valkey, KeyDB)."""
+
+    def __init__(self, url: str, prefix: str) -> None:
+        if aioredis is None:
+            raise RuntimeError("SESSION_STORE_BACKEND=redis requires the 'redis' package")
+        self._redis = aioredis.from_url(url, decode_responses=True)
+        self._prefix = prefix
+        self._acquire = self._redis.register_script(_ACQUIRE_SCRIPT)
+        self._renew = self._redis.register_script(_RENEW_SCRIPT)
+        self._release = self._redis.register_script(_RELEASE_SCRIPT)
+
+    def _session_key(self, room_name: str) -> str:
+        return f"{self._prefix}:session:{room_name}"
+
+    def _lease_key(self, room_name: str) -> str:
+        return f"{self._prefix}:lease:{room_name}"
+
+    @property
+    def _index_key(self) -> str:
+        return f"{self._prefix}:sessions"
+
+    async def put_session(self, room_name: str, record: dict) -> None:
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.set(self._session_key(room_name), json.dumps(record))
+            pipe.sadd(self._index_key, room_name)
+            await pipe.execute()
+
+    async def get_session(self, room_name: str) -> dict | None:
+        raw = await self._redis.get(self._session_key(room_name))
+        return json.loads(raw) if raw else None
+
+    async def delete_session(self, room_name: str) -> None:
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.delete(self._session_key(room_name))
+            pipe.srem(self._index_key, room_name)
+            await pipe.execute()
+
+    async def list_sessions(self) -> list[str]:
+        return sorted(await self._redis.smembers(self._index_key))
+
+    async def acquire_lease(self, room_name: str, owner: str, ttl_s: float) -> bool:
+        ttl_ms = int(ttl_s * 1000)
+        return bool(await self._acquire(keys=[self._lease_key(room_name)], args=[owner, ttl_ms]))
+
+    async def renew_lease(self, room_name: str, owner: str, ttl_s: float) -> bool:
+        ttl_ms = int(ttl_s * 1000)
+        return bool(await self._renew(keys=[self._lease_key(room_name)], args=[owner, ttl_ms]))
+
+    async def release_lease(self, room_name: str, owner: str) -> None:
+        await self._release(keys=[self._lease_key(room_name)], args=[owner])
+
+    async def lease_owner(self, room_name: str) -> str | None:
+        return await self._redis.get(self._lease_key(room_name))
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+def create_session_store() -> SessionStore:
+    backend = settings.session_store_backend
+    if backend == "memory":
+        return MemorySessionStore()
+    if backend == "redis":
+        return RedisSessionStore(settings.session_store_url, settings.session_store_prefix)
+    raise ValueError(f"Unknown SESSION_STORE_BACKEND {backend!r}; expected 'memory' or 'redis'")
+
+
+class RoomLeases:
+    """Room ownership for this worker: claims, renewals and forwarding to other owners.
+
+    The worker that creates a room holds its lease while the session lives and renews
+    it in the background; a request for a room owned by another worker is forwarded to
+    that worker's ``WORKER_URL``. A lease that is taken over, or that cannot be renewed
+    before it expires, is reported to ``on_lost`` so the room stops being served here.
+    """
+
+    def __init__(self) -> None:
+        self.store: SessionStore = MemorySessionStore()
+        self.owner_id = settings.worker_url or f"{socket.gethostname()}:{os.getpid()}"
+        self._owned: set[str] = set()
+        self._renewed_at: dict[str, float] = {}
+        self._lost_tasks: set[asyncio.Task] = set()
+        self.on_lost: Callable[[str], Awaitable[object]] | None = None
+        self._task: asyncio.Task | None = None
+        self._http: httpx.AsyncClient | None = None
+        self.forwarded = 0
+        self.forward_failures = 0
+        self.leases_lost = 0
+
+    async def start(self, on_lost: Callable[[str], Awaitable[object]] | None = None) -> None:
+        self.store = create_session_store()
+        self.on_lost = on_lost
+        self.owner_id = settings.worker_url or f"{socket.gethostname()}:{os.getpid()}"
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._renew_loop(), name="room_lease_renew")
+
+    async def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        await asyncio.gather(*self._lost_tasks, return_exceptions=True)
+        for room_name in list(self._owned):
+            await self.release(room_name)
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        await self.store.close()
+
+    async def claim(self, room_name: str, record: dict) -> None:
+        """Take the room's lease and publish its session record."""
+        if not await self.store.acquire_lease(
+            room_name, self.owner_id, settings.session_lease_ttl_s
+        ):
+            raise RoomOwnedError(room_name, await self.store.lease_owner(room_name))
+        self._owned.add(room_name)
+        self._renewed_at[room_name] = time.monotonic()
+        await self.store.put_session(room_name, {**record, "owner": self.owner_id})
+
+    async def update(self, room_name: str, record: dict) -> None:
+        if room_name not in self._owned:
+            return
+        try:
+            await self.store.put_session(room_name, {**record, "owner": self.owner_id})
+        except Exception as e:
+            logger.warning("Failed to update session record room=%s: %s", room_name, e)
+
+    async def release(self, room_name: str) -> None:
+        self._renewed_at.pop(room_name, None)
+        if room_name not in self._owned:
+            # Never held, or lost to another worker, which now owns the record too.
+            return
+        self._owned.discard(room_name)
+        try:
+            await self.store.release_lease(room_name, self.owner_id)
+            await self.store.delete_session(room_name)
+        except Exception as e:
+            logger.warning("Failed to release room lease room=%s: %s", room_name, e)
+
+    async def remote_owner(self, room_name: str) -> str | None:
+        """URL of the worker that owns ``room_name`` if it is not this one."""
+        owner = await self.store.lease_owner(room_name)
+        if owner is None or owner == self.owner_id or not owner.startswith("http"):
+            return None
+        return owner
+
+    async def forward(
+        self, owner: str, method: str, path: str, json_body: dict | None = None
+    ) -> httpx.Response:
+        if self._http is None:
+            self._http = httpx.AsyncClient(timeout=settings.session_forward_timeout_s)
+        try:
+            response = await self._http.request(
+                method,
+                owner.rstrip("/") + path,
+                json=json_body,
+                headers={FORWARDED_HEADER: self.owner_id},
+            )
+        except Exception:
+            self.forward_failures += 1
+            raise
+        self.forwarded += 1
+        return response
+
+    async def _renew_loop(self) -> None:
+        ttl_s = settings.session_lease_ttl_s
+        interval = max(0.1, ttl_s / 3)
+        while True:
+            await asyncio.sleep(interval)
+            for room_name in list(self._owned):
+                try:
+                    renewed = await self.store.renew_lease(room_name, self.owner_id, ttl_s)
+                except Exception as e:
+                    logger.warning("Room lease renewal failed room=%s: %s", room_name, e)
+                    # Past the TTL the lease has expired in the store whether we saw it or not.
+                    renewed = time.monotonic() - self._renewed_at.get(room_name, 0.0) < ttl_s
+                    if renewed:
+                        continue
+                if room_name not in self._owned:
+                    continue
+                if renewed:
+                    self._renewed_at[room_name] = time.monotonic()
+                else:
+                    self._lost(room_name)
+
+    def _lost(self, room_name: str) -> None:
+        self._owned.discard(room_name)
+        self._renewed_at.pop(room_name, None)
+        self.leases_lost += 1
+        logger.warning("Lost room lease room=%s; no longer serving it", room_name)
+        if self.on_lost is None:
+            return
+        task = asyncio.create_task(self.on_lost(room_name), name=f"room_lease_lost:{room_name}")
+        self._lost_tasks.add(task)
+        task.add_done_callback(self._lost_tasks.discard)
+
+    def stats(self) -> dict:
+        return {
+            "backend": settings.session_store_backend,
+            "owner": self.owner_id,
+            "owned_rooms": len(self._owned),
+            "forwarded": self.forwarded,
+            "forward_failures": self.forward_failures,
+            "leases_lost": self.leases_lost,
+        }
+
+
+room_leases = RoomLeases()
@@ -0,0 +1,469 @@
+import asyncio
+import logging
+import mmap
+import os
+import sqlite3
+import struct
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+# Raw PCM cache file: fixed 64-byte header, then s16le frames padded to whole frames.
+PCM_MAGIC = b"LPCM"
+PCM_VERSION = 1
+PCM_HEADER = struct.Struct("<4sHHIHHQ")
+PCM_HEADER_SIZE = 64
+PCM_SUFFIX = ".pcm"
+CACHE_SUFFIXES = (".mp3", PCM_SUFFIX)
+# Temp files younger than this may still be written by another worker sharing the cache.
+STALE_TMP_AGE_S = 600.0
+
+
+class PcmMemoryCache:
+    """Byte-budgeted LRU of decoded s16le PCM keyed by the TTS cache key."""
+
+    def __init__(self, max_bytes: int, max_entry_bytes: int) -> None:
+        self.max_bytes = max(0, max_bytes)
+        self.max_entry_bytes = max(0, min(max_entry_bytes, self.max_bytes))
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._bytes = 0
+        # The Tavus agent reads the caches from its own thread.
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            pcm = self._entries.get(key)
+            if pcm is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return pcm
+
+    def accepts(self, size: int) -> bool:
+        return self.enabled and 0 < size <= self.max_entry_bytes
+
+    def contains(self, key: str) -> bool:
+        return key in self._entries
+
+    def put(self, key: str, pcm: bytes) -> bool:
+        if not self.accepts(len(pcm)):
+            return False
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = pcm
+            self._bytes += len(pcm)
+            while self._bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+        return True
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            pcm = self._entries.pop(key, None)
+            if pcm is not None:
+                self._bytes -= len(pcm)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class PcmFileCache:
+    """On-disk cache of pre-resampled PCM served zero-copy from shared memory maps.
+
+    Each file holds PCM at the configured sample rate and channel count behind a small
+    header, padded to whole frames. Maps are kept open in a bounded LRU so every room
+    speaking the same phrase reads the same page-cache pages.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        sample_rate: int,
+        num_channels: int,
+        frame_bytes: int,
+        max_entry_bytes: int,
+        max_open_maps: int = 256,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.sample_rate = sample_rate
+        self.num_channels = num_channels
+        self.frame_bytes = max(1, frame_bytes)
+        self.max_entry_bytes = max_entry_bytes
+        self.max_open_maps = max(1, max_open_maps)
+        self._views: OrderedDict[str, memoryview] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{PCM_SUFFIX}"
+
+    def accepts(self, size: int) -> bool:
+        return 0 < size <= self.max_entry_bytes
+
+    def open(self, key: str) -> memoryview | None:
+        """Return a read-only view of the cached PCM, or None on a miss."""
+        with self._lock:
+            view = self._views.get(key)
+            if view is not None:
+                self._views.move_to_end(key)
+                self.hits += 1
+                return view
+
+        view = self._map_file(self.path_for(key))
+        with self._lock:
+            if view is None:
+                self.misses += 1
+                return None
+            self._views[key] = view
+            # Dropping our reference is enough; the map closes once no reader holds a slice.
+            while len(self._views) > self.max_open_maps:
+                self._views.popitem(last=False)
+            self.hits += 1
+        return view
+
+    def _map_file(self, path: Path) -> memoryview | None:
+        try:
+            with open(path, "rb") as handle:
+                mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            return None
+        except OSError as exc:
+            logger.warning("Failed to map PCM cache file %s: %s", path.name, exc)
+            return None
+
+        if len(mapped) < PCM_HEADER_SIZE:
+            mapped.close()
+            self._remove(path)
+            return None
+        magic, version, channels, sample_rate, sample_width, _, data_bytes = (
+            PCM_HEADER.unpack_from(mapped, 0)
+        )
+        if (
+            magic != PCM_MAGIC
+            or version != PCM_VERSION
+            or channels != self.num_channels
+            or sample_rate != self.sample_rate
+            or sample_width != 2
+            or PCM_HEADER_SIZE + data_bytes > len(mapped)
+        ):
+            logger.info("Discarding stale PCM cache file: %s", path.name)
+            mapped.close()
+            self._remove(path)
+            return None
+        return memoryview(mapped)[PCM_HEADER_SIZE : PCM_HEADER_SIZE + data_bytes]
+
+    def write(self, key: str, pcm: bytes) -> None:
+        """Write PCM atomically (blocking; run off the event loop)."""
+        if not self.accepts(len(pcm)):
+            return
+        pad = -len(pcm) % self.frame_bytes
+        data_bytes = len(pcm) + pad
+        header = PCM_HEADER.pack(
+            PCM_MAGIC, PCM_VERSION, self.num_channels, self.sample_rate, 2, 0, data_bytes
+        )
+        path = self.path_for(key)
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(tmp_path, "wb") as handle:
+                handle.write(header.ljust(PCM_HEADER_SIZE, b"\0"))
+                handle.write(pcm)
+                if pad:
+                    handle.write(bytes(pad))
+            os.replace(tmp_path, path)
+            self.writes += 1
+        except OSError as exc:
+            logger.warning("Failed to write PCM cache file %s: %s", path.name, exc)
+            self._remove(tmp_path)
+
+    def discard(self, key: str) -> None:
+        self.forget(key)
+        self._remove(self.path_for(key))
+
+    def forget(self, key: str) -> None:
+        """Drop the shared map for ``key`` without touching the file."""
+        with self._lock:
+            self._views.pop(key, None)
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            logger.warning("Failed to remove PCM cache file %s: %s", path.name, exc)
+
+    def stats(self) -> dict:
+        return {
+            "open_maps": len(self._views),
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+        }
+
+
+class TTSDiskCache:
+    """Persistent index over ``tts_cache_dir`` with byte/entry limits and LRU eviction.
+
+    Each key owns its ``.mp3`` and ``.pcm`` files. Hits and writes are buffered in memory
+    and flushed to a SQLite index by a background task, which also evicts the least
+    recently used keys once the cache is over its limits, so no directory scan is needed
+    after the first start. With ``evict=False`` the task only flushes, leaving eviction
+    to the one process that owns it when several workers share the cache.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        index_path: Path,
+        max_bytes: int,
+        max_entries: int,
+        evict_interval_s: float,
+        on_evict: Callable[[list[str]], None] | None = None,
+        evict: bool = True,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.index_path = index_path
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.evict_interval_s = evict_interval_s
+        self.on_evict = on_evict
+        self.evict = evict
+        self._conn: sqlite3.Connection | None = None
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self._pending_hits: dict[str, tuple[float, int]] = {}
+        self._pending_writes: dict[str, float] = {}
+
+        self.entries = 0
+        self.bytes = 0
+        self.evictions = 0
+        self.evicted_bytes = 0
+        self.last_evict_at: float | None = None
+
+    async def start(self) -> None:
+        async with self._lock:
+            await asyncio.to_thread(self._open)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="tts_cache_evictor")
+
+    async def stop(self) -> None:
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        async with self._lock:
+            if self._conn is not None:
+                await asyncio.to_thread(self._flush, *self._take_pending())
+                self._conn.close()
+                self._conn = None
+
+    def record_hit(self, key: str) -> None:
+        _, hits = self._pending_hits.get(key, (0.0, 0))
+        self._pending_hits[key] = (time.time(), hits + 1)
+
+    def record_write(self, key: str) -> None:
+        self._pending_writes[key] = time.time()
+
+    async def maintain(self) -> None:
+        """Flush buffered index updates and evict down to the configured limits."""
+        async with self._lock:
+            if self._conn is None:
+                return
+            if not self.evict:
+                await asyncio.to_thread(self._flush_and_refresh, *self._take_pending())
+                return
+            evicted = await asyncio.to_thread(self._flush_and_evict, *self._take_pending())
+        if evicted and self.on_evict is not None:
+            self.on_evict(evicted)
+
+    def _take_pending(self) -> tuple[dict[str, float], dict[str, tuple[float, int]]]:
+        writes, self._pending_writes = self._pending_writes, {}
+        hits, self._pending_hits = self._pending_hits, {}
+        return writes, hits
+
+    def stats(self) -> dict:
+        return {
+            "entries": self.entries,
+            "bytes": self.bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "evict": self.evict,
+            "evictions": self.evictions,
+            "evicted_bytes": self.evicted_bytes,
+            "pending_updates": len(self._pending_hits) + len(self._pending_writes),
+            "last_evict_at": self.last_evict_at,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.evict_interval_s)
+            try:
+                await self.maintain()
+            except Exception:
+                logger.exception("TTS cache maintenance failed")
+
+    def _open(self) -> None:
+        if self._conn is not None:
+            return
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.index_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, bytes INTEGER NOT NULL, created_at REAL NOT NULL, "
+            "last_access REAL NOT NULL, hits INTEGER NOT NULL DEFAULT 0)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries(last_access)")
+        conn.commit()
+        self._conn = conn
+        if conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0] == 0:
+            self._adopt_existing_files()
+        self._refresh_totals()
+        logger.info("TTS cache index ready: entries=%s bytes=%s", self.entries, self.bytes)
+
+    def _adopt_existing_files(self) -> None:
+        """One-time scan that indexes files written before the index existed."""
+        sizes: dict[str, int] = {}
+        mtimes: dict[str, float] = {}
+        stale_before = time.time() - STALE_TMP_AGE_S
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    # Renamed or evicted by another worker since the listing.
+                    continue
+                if entry.name.endswith(".tmp"):
+                    # Left behind by a crashed write; recent ones may be in progress elsewhere.
+                    if stat.st_mtime < stale_before:
+                        self._remove(Path(entry.path))
+                    continue
+                key, suffix = os.path.splitext(entry.name)
+                if suffix not in CACHE_SUFFIXES:
+                    continue
+                sizes[key] = sizes.get(key, 0) + stat.st_size
+                mtimes[key] = max(mtimes.get(key, 0.0), stat.st_mtime)
+        assert self._conn is not None
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO entries (key, bytes, created_at, last_access, hits) "
+            "VALUES (?, ?, ?, ?, 0)",
+            [(key, size, mtimes[key], mtimes[key]) for key, size in sizes.items()],
+        )
+        self._conn.commit()
+        if sizes:
+            logger.info("Indexed %s existing TTS cache entries", len(sizes))
+
+    def _flush(
+        self, writes: dict[str, float], hits: dict[str, tuple[float, int]]
+    ) -> None:
+        assert self._conn is not None
+        if writes:
+            self._conn.executemany(
+                "INSERT INTO entries (key, bytes, created_at, last_access, hits) "
+                "VALUES (?, ?, ?, ?, 0) "
+                "ON CONFLICT(key) DO UPDATE SET bytes = excluded.bytes, "
+                "last_access = MAX(last_access, excluded.last_access)",
+                [(key, self._key_bytes(key), at, at) for key, at in writes.items()],
+            )
+        if hits:
+            self._conn.executemany(
+                "UPDATE entries SET last_access = MAX(last_access, ?), hits = hits + ? "
+                "WHERE key = ?",
+                [(at, count, key) for key, (at, count) in hits.items()],
+            )
+        self._conn.commit()
+
+    def _flush_and_refresh(
+        self, writes: dict[str, float], hits: dict[str, tuple[float, int]]
+    ) -> None:
+        self._flush(writes, hits)
+        self._refresh_totals()
+
+    def _flush_and_evict(
+        self, writes: dict[str, float], hits: dict[str, tuple[float, int]]
+    ) -> list[str]:
+        self._flush_and_refresh(writes, hits)
+        evicted: list[str] = []
+        while self.entries > self.max_entries or self.bytes > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, bytes FROM entries ORDER BY last_access ASC LIMIT 256"
+            ).fetchall()
+            if not rows:
+                break
+            batch: list[str] = []
+            for key, size in rows:
+                if self.entries <= self.max_entries and self.bytes <= self.max_bytes:
+                    break
+                for suffix in CACHE_SUFFIXES:
+                    self._remove(self.cache_dir / f"{key}{suffix}")
+                batch.append(key)
+                self.entries -= 1
+                self.bytes -= size
+                self.evicted_bytes += size
+            self._conn.executemany("DELETE FROM entries WHERE key = ?", [(k,) for k in batch])
+            self._conn.commit()
+            evicted.extend(batch)
+        if evicted:
+            self.evictions += len(evicted)
+            self.last_evict_at = time.time()
+            logger.info("Evicted %s TTS cache entries", len(evicted))
+        return evicted
+
+    def _refresh_totals(self) -> None:
+        assert self._conn is not None
+        count, total = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM entries"
+        ).fetchone()
+        self.entries = count
+        self.bytes = total
+
+    def _key_bytes(self, key: str) -> int:
+        total = 0
+        for suffix in CACHE_SUFFIXES:
+            try:
+                total += (self.cache_dir / f"{key}{suffix}").stat().st_size
+            except FileNotFoundError:
+                pass
+        return total
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            logger.warning("Failed to remove TTS cache file %s: %s", path.name, exc)
@@ -0,0 +1,148 @@
+import asyncio
+import logging
+import time
+
+from .agent import ACKNOWLEDGEMENTS, FALLBACK_QUESTIONS, FINISH_MESSAGE, GREETING_MESSAGES
+from .openai_tts_service import openai_tts_service
+from .question_bank import question_bank_service
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _job_question_phrases() -> list[str]:
+    """Default questions stored on jobs, when the job database is part of this deployment."""
+    try:
+        from ..database import get_db
+        from ..models.job import Job
+    except ImportError:
+        logger.info("Job database not available; skipping job questions in TTS warm-up")
+        return []
+
+    db_gen = get_db()
+    db = next(db_gen)
+    try:
+        rows = db.query(Job.default_question).filter(Job.default_question.isnot(None)).all()
+        return [row[0] for row in rows if row[0]]
+    finally:
+        db_gen.close()
+
+
+class TTSWarmupService:
+    """Pre-synthesizes phrases that are spoken over and over into the TTS cache."""
+
+    def __init__(self) -> None:
+        self.tts = openai_tts_service
+        self._task: asyncio.Task | None = None
+        self._progress: dict = {"state": "idle"}
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def collect_phrases(self) -> list[str]:
+        phrases = [
+            FINISH_MESSAGE,
+            *GREETING_MESSAGES,
+            *FALLBACK_QUESTIONS,
+            *ACKNOWLEDGEMENTS,
+            *settings.tts_warmup_phrases,
+        ]
+        try:
+            phrases.extend(await question_bank_service.all_questions())
+        except Exception as e:
+            logger.warning("Failed to load question banks for TTS warm-up: %s", e)
+        try:
+            phrases.extend(await asyncio.to_thread(_job_question_phrases))
+        except Exception as e:
+            logger.warning("Failed to load job questions for TTS warm-up: %s", e)
+        # Preserve order, drop duplicates and blanks.
+        return list(dict.fromkeys(p.strip() for p in phrases if p and p.strip()))
+
+    def start(self, phrases: list[str] | None = None) -> bool:
+        """Start a warm-up run in the background; returns False if one is already running."""
+        if self.running:
+            return False
+        self._task = asyncio.create_task(self.run(phrases), name="tts_warmup")
+        self._task.add_done_callback(self._log_task_failure)
+        return True
+
+    async def stop(self) -> None:
+        if self.running:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def run(self, phrases: list[str] | None = None) -> dict:
+        if phrases is None:
+            phrases = await self.collect_phrases()
+        concurrency = max(1, settings.tts_warmup_concurrency)
+        progress = {
+            "state": "running",
+            "total": len(phrases),
+            "completed": 0,
+            "already_cached": 0,
+            "synthesized": 0,
+            "failed": 0,
+            "concurrency": concurrency,
+            "started_at": time.time(),
+            "duration_ms": None,
+        }
+        self._progress = progress
+        logger.info("TTS warm-up started: phrases=%s concurrency=%s", len(phrases), concurrency)
+        start = time.perf_counter()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _warm(text: str) -> None:
+            async with semaphore:
+                try:
+                    if self.tts.is_cached(text):
+                        progress["already_cached"] += 1
+                    else:
+                        await self.tts.prefetch(text)
+                        progress["synthesized"] += 1
+                except Exception as e:
+                    progress["failed"] += 1
+                    logger.warning("TTS warm-up failed for %r: %s", text[:60], e)
+                finally:
+                    progress["completed"] += 1
+                    progress["duration_ms"] = round((time.perf_counter() - start) * 1000)
+                    if progress["completed"] % 10 == 0 or progress["completed"] == len(phrases):
+                        logger.info(
+                            "TTS warm-up progress %s/%s (failed=%s)",
+                            progress["completed"],
+                            len(phrases),
+                            progress["failed"],
+                        )
+
+        try:
+            await asyncio.gather(*(_warm(text) for text in phrases))
+        except asyncio.CancelledError:
+            progress["state"] = "cancelled"
+            raise
+        progress["state"] = "done"
+        progress["duration_ms"] = round((time.perf_counter() - start) * 1000)
+        logger.info(
+            "TTS warm-up finished: synthesized=%s cached=%s failed=%s duration_ms=%s",
+            progress["synthesized"],
+            progress["already_cached"],
+            progress["failed"],
+            progress["duration_ms"],
+        )
+        return progress
+
+    def status(self) -> dict:
+        return dict(self._progress)
+
+    @staticmethod
+    def _log_task_failure(task: asyncio.Task) -> None:
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc:
+            logger.exception("TTS warm-up task failed", exc_info=exc)
+
+
+tts_warmup_service = TTSWarmupService()
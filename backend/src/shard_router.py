@@ -0,0 +1,389 @@
+import asyncio
+import json
+import logging
+import os
+import re
+import subprocess
+import sys
+import zlib
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request, Response, WebSocket
+from fastapi.responses import JSONResponse
+from websockets.asyncio.client import connect as ws_connect
+from websockets.exceptions import ConnectionClosed
+
+from .config.settings import settings
+from .services.session_store import FORWARDED_HEADER
+
+logger = logging.getLogger(__name__)
+
+_ROOM_PATH = re.compile(r"^/api/rooms/(?P<room>[^/]+)")
+_ROOM_BODY_PATHS = ("/api/rooms/create", "/api/say")
+# Hop-by-hop and length headers that must not be copied between the two connections.
+_SKIP_HEADERS = {"host", "connection", "keep-alive", "transfer-encoding", "content-length"}
+_SKIP_RESPONSE_HEADERS = _SKIP_HEADERS | {"content-encoding"}
+# Per-process endpoints with no room: sent to every worker and the answers combined.
+# TTS warm-up fills the shared cache, so like other room-less requests it goes to worker 0.
+_FANOUT_PATHS = frozenset({"/api/health", "/api/capacity", "/api/admin/drain"})
+_RESTART_BACKOFF_MIN_S = 1.0
+_RESTART_BACKOFF_MAX_S = 60.0
+# A worker that stayed up this long restarts with the minimum backoff again.
+_RESTART_BACKOFF_RESET_S = 60.0
+
+
+def shard_for(room_name: str, shards: int) -> int:
+    """Stable across processes, unlike ``hash()``."""
+    return zlib.crc32(room_name.encode("utf-8")) % shards
+
+
+def merge_worker_payloads(values: list, key: str = ""):
+    """Combine one JSON value per worker into a fleet-wide one.
+
+    Numbers add up (``*_ms`` timings take the max), flags must hold on every worker,
+    objects merge key by key, and other values are kept once if all workers agree or
+    as a per-worker list if they do not.
+    """
+    if all(isinstance(value, bool) for value in values):
+        return all(values)
+    if all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in values):
+        return max(values) if key.endswith("_ms") else sum(values)
+    if all(isinstance(value, dict) for value in values):
+        keys = dict.fromkeys(name for value in values for name in value)
+        return {
+            name: merge_worker_payloads([value[name] for value in values if name in value], name)
+            for name in keys
+        }
+    if all(value == values[0] for value in values):
+        return values[0]
+    return values
+
+
+class WorkerSupervisor:
+    """Runs the API worker processes and restarts any that exit.
+
+    Restarts back off exponentially per worker (1 s doubling up to 60 s) so a worker
+    that crashes on startup does not spin; the backoff resets once a worker has stayed
+    up for a minute.
+    """
+
+    def __init__(self, count: int) -> None:
+        self.count = count
+        self.urls = [
+            f"http://{settings.worker_host}:{settings.worker_base_port + index}"
+            for index in range(count)
+        ]
+        self._processes: list[subprocess.Popen | None] = [None] * count
+        self._started_at = [0.0] * count
+        self._backoff_s = [0.0] * count
+        self._restart_at: list[float | None] = [None] * count
+        self._task: asyncio.Task | None = None
+        self.restarts = 0
+
+    def _spawn(self, index: int) -> subprocess.Popen:
+        port = settings.worker_base_port + index
+        env = {
+            **os.environ,
+            "WORKERS": "1",
+            "HOST": settings.worker_host,
+            "PORT": str(port),
+            "WORKER_URL": self.urls[index],
+            # Workers share the TTS cache; only worker 0 evicts from it and warms it up.
+            "TTS_CACHE_EVICT_ENABLED": str(index == 0 and settings.tts_cache_evict_enabled),
+            "TTS_WARMUP_ON_STARTUP": str(index == 0 and settings.tts_warmup_on_startup),
+        }
+        logger.info("Starting API worker %s on port %s", index, port)
+        return subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "uvicorn",
+                "src.main:app",
+                "--host",
+                settings.worker_host,
+                "--port",
+                str(port),
+            ],
+            cwd=Path(__file__).resolve().parents[1],
+            env=env,
+        )
+
+    async def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        for index in range(self.count):
+            self._processes[index] = self._spawn(index)
+            self._started_at[index] = loop.time()
+        self._task = asyncio.create_task(self._watch(), name="worker_supervisor")
+
+    async def _watch(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(0.5)
+            now = loop.time()
+            for index, process in enumerate(self._processes):
+                if process is None or process.poll() is None:
+                    continue
+                if self._restart_at[index] is None:
+                    if now - self._started_at[index] >= _RESTART_BACKOFF_RESET_S:
+                        self._backoff_s[index] = _RESTART_BACKOFF_MIN_S
+                    else:
+                        self._backoff_s[index] = min(
+                            _RESTART_BACKOFF_MAX_S,
+                            max(_RESTART_BACKOFF_MIN_S, self._backoff_s[index] * 2),
+                        )
+                    self._restart_at[index] = now + self._backoff_s[index]
+                    logger.error(
+                        "API worker %s exited with code %s; restarting in %.0fs",
+                        index,
+                        process.returncode,
+                        self._backoff_s[index],
+                    )
+                if now >= self._restart_at[index]:
+                    self.restarts += 1
+                    self._restart_at[index] = None
+                    self._processes[index] = self._spawn(index)
+                    self._started_at[index] = now
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        # SIGTERM lets each worker run its shutdown handler (session teardown).
+        for process in self._processes:
+            if process is not None and process.poll() is None:
+                process.terminate()
+        for index, process in enumerate(self._processes):
+            if process is None:
+                continue
+            try:
+                await asyncio.to_thread(process.wait, settings.worker_shutdown_timeout_s)
+            except subprocess.TimeoutExpired:
+                logger.warning("API worker %s did not stop in time; killing it", index)
+                process.kill()
+
+    def status(self) -> list[dict]:
+        return [
+            {
+                "index": index,
+                "url": self.urls[index],
+                "pid": process.pid if process else None,
+                "alive": process is not None and process.poll() is None,
+                "restart_backoff_s": self._backoff_s[index],
+            }
+            for index, process in enumerate(self._processes)
+        ]
+
+
+class ShardRouter:
+    """Thin HTTP/WebSocket proxy that keeps each room on its owning worker.
+
+    Every request for a room (``/api/rooms/*``, ``/api/say``, ``/api/ws/{room_name}``)
+    goes to worker ``crc32(room_name) % WORKERS``, so the room's publisher, TTS pacing
+    loop and session state stay on one process and one core. Health, capacity and drain
+    go to every worker and answer with the combined result plus each worker's own; other
+    requests, TTS warm-up included, go to worker 0.
+    """
+
+    def __init__(self, supervisor: WorkerSupervisor) -> None:
+        self.supervisor = supervisor
+        self._http: httpx.AsyncClient | None = None
+        self.requests_by_worker = [0] * supervisor.count
+
+    async def start(self) -> None:
+        self._http = httpx.AsyncClient(
+            timeout=settings.session_forward_timeout_s,
+            limits=httpx.Limits(max_keepalive_connections=64),
+        )
+
+    async def stop(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    def worker_for(self, path: str, body: bytes) -> int:
+        room_name = None
+        if path in _ROOM_BODY_PATHS and body:
+            try:
+                room_name = json.loads(body).get("room_name")
+            except (ValueError, AttributeError):
+                room_name = None
+        else:
+            match = _ROOM_PATH.match(path)
+            if match:
+                room_name = match.group("room")
+        if not room_name:
+            return 0
+        return shard_for(str(room_name), self.supervisor.count)
+
+    @staticmethod
+    def _upstream(request: Request) -> tuple[str, dict[str, str]]:
+        path = request.url.path
+        if request.url.query:
+            path += "?" + request.url.query
+        headers = {
+            key: value
+            for key, value in request.headers.items()
+            if key.lower() not in _SKIP_HEADERS
+        }
+        # Workers must not re-forward what the router already placed.
+        headers[FORWARDED_HEADER] = "router"
+        return path, headers
+
+    async def proxy(self, request: Request) -> Response:
+        body = await request.body()
+        if request.url.path in _FANOUT_PATHS:
+            return await self.fan_out(request, body)
+        index = self.worker_for(request.url.path, body)
+        self.requests_by_worker[index] += 1
+        path, headers = self._upstream(request)
+        url = self.supervisor.urls[index] + path
+        try:
+            upstream = await self._http.request(
+                request.method, url, content=body, headers=headers
+            )
+        except httpx.HTTPError as e:
+            logger.error("Worker %s unreachable for %s: %s", index, request.url.path, e)
+            return Response(status_code=502, content=f"Worker {index} unavailable")
+        return Response(
+            content=upstream.content,
+            status_code=upstream.status_code,
+            headers={
+                key: value
+                for key, value in upstream.headers.items()
+                if key.lower() not in _SKIP_RESPONSE_HEADERS
+            },
+        )
+
+    async def fan_out(self, request: Request, body: bytes) -> Response:
+        path, headers = self._upstream(request)
+        # A drain waits out running turns and then the teardowns.
+        timeout = (
+            settings.session_forward_timeout_s
+            + settings.drain_turn_deadline_s
+            + settings.drain_teardown_deadline_s
+        )
+
+        async def _call(index: int) -> dict:
+            self.requests_by_worker[index] += 1
+            try:
+                upstream = await self._http.request(
+                    request.method,
+                    self.supervisor.urls[index] + path,
+                    content=body,
+                    headers=headers,
+                    timeout=timeout,
+                )
+            except httpx.HTTPError as e:
+                logger.error("Worker %s unreachable for %s: %s", index, request.url.path, e)
+                return {"worker": index, "status_code": 502, "error": str(e)}
+            try:
+                payload = upstream.json()
+            except ValueError:
+                payload = upstream.text
+            return {"worker": index, "status_code": upstream.status_code, "body": payload}
+
+        results = await asyncio.gather(*(_call(index) for index in range(self.supervisor.count)))
+        status_codes = {result["status_code"] for result in results}
+        bodies = [result["body"] for result in results if isinstance(result.get("body"), dict)]
+        merged = merge_worker_payloads(bodies) if bodies else {}
+        return JSONResponse(
+            {**merged, "workers": results},
+            status_code=max(status_codes),
+        )
+
+    async def proxy_ws(self, websocket: WebSocket, room_name: str) -> None:
+        index = shard_for(room_name, self.supervisor.count)
+        self.requests_by_worker[index] += 1
+        url = self.supervisor.urls[index].replace("http://", "ws://", 1) + websocket.url.path
+        await websocket.accept()
+        try:
+            async with ws_connect(url) as upstream:
+
+                async def _client_to_worker() -> None:
+                    while True:
+                        message = await websocket.receive()
+                        if message["type"] == "websocket.disconnect":
+                            return
+                        if message.get("text") is not None:
+                            await upstream.send(message["text"])
+                        elif message.get("bytes") is not None:
+                            await upstream.send(message["bytes"])
+
+                async def _worker_to_client() -> None:
+                    async for message in upstream:
+                        if isinstance(message, str):
+                            await websocket.send_text(message)
+                        else:
+                            await websocket.send_bytes(message)
+
+                tasks = [
+                    asyncio.create_task(_client_to_worker()),
+                    asyncio.create_task(_worker_to_client()),
+                ]
+                try:
+                    await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+        except (OSError, ConnectionClosed) as e:
+            logger.warning(
+                "WebSocket proxy to worker %s ended for room %s: %s", index, room_name, e
+            )
+        try:
+            await websocket.close()
+        except RuntimeError:
+            # Already closed by the client.
+            pass
+
+
+supervisor = WorkerSupervisor(max(1, settings.workers))
+shard_router = ShardRouter(supervisor)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    await supervisor.start()
+    await shard_router.start()
+    try:
+        yield
+    finally:
+        await shard_router.stop()
+        await supervisor.stop()
+
+
+app = FastAPI(title="LibaAI - Digital Human API router", lifespan=lifespan)
+
+
+@app.get("/router/shards")
+async def shard_status():
+    """Worker processes, their liveness and how many requests each was sent"""
+    return {
+        "workers": supervisor.status(),
+        "restarts": supervisor.restarts,
+        "requests_by_worker": shard_router.requests_by_worker,
+    }
+
+
+@app.websocket("/api/ws/{room_name}")
+async def websocket_proxy(websocket: WebSocket, room_name: str):
+    await shard_router.proxy_ws(websocket, room_name)
+
+
+@app.api_route(
+    "/{path:path}", methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "HEAD"]
+)
+async def http_proxy(request: Request, path: str):
+    return await shard_router.proxy(request)
+
+
+def run() -> None:
+    """Start the workers and serve the router on HOST:PORT (never with auto-reload)."""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    logger.info("Starting %s API workers behind the shard router", supervisor.count)
+    uvicorn.run(app, host=settings.host, port=settings.port, reload=False)
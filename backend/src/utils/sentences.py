@@ -0,0 +1,85 @@
+"""Incremental sentence segmentation for streaming LLM output."""
+import re
+from typing import AsyncIterator
+
+# A sentence ends on terminal punctuation followed by whitespace (so "3.5" or "e.g." in the
+# middle of a token stream is not cut early). CJK terminators need no trailing space.
+_SENTENCE_END = re.compile(r"[.!?]+[\"')\]]*(?=\s)|[。！？…]+")
+_CLAUSE_END = re.compile(r"[,;:]+(?=\s)|[，；：、]")
+
+
+class SentenceSegmenter:
+    """Buffer text deltas and emit speakable fragments as soon as they are complete.
+
+    The first fragment may be cut at a clause boundary so speech can start early; later
+    fragments are cut at sentence boundaries. Anything longer than ``max_chars`` without a
+    boundary is cut at the last clause break or whitespace.
+    """
+
+    def __init__(self, min_chars: int = 24, max_chars: int = 160) -> None:
+        self.min_chars = max(1, min_chars)
+        self.max_chars = max(self.min_chars, max_chars)
+        self._buffer = ""
+        self._emitted = 0
+
+    def feed(self, delta: str) -> list[str]:
+        self._buffer += delta
+        fragments: list[str] = []
+        while True:
+            cut = self._find_cut()
+            if cut is None:
+                break
+            fragment = self._buffer[:cut].strip()
+            self._buffer = self._buffer[cut:].lstrip()
+            if fragment:
+                fragments.append(fragment)
+                self._emitted += 1
+        return fragments
+
+    def flush(self) -> str | None:
+        fragment = self._buffer.strip()
+        self._buffer = ""
+        if not fragment:
+            return None
+        self._emitted += 1
+        return fragment
+
+    def _find_cut(self) -> int | None:
+        buffer = self._buffer
+        for match in _SENTENCE_END.finditer(buffer):
+            if len(buffer[: match.end()].strip()) >= self.min_chars:
+                return match.end()
+
+        if self._emitted == 0:
+            for match in _CLAUSE_END.finditer(buffer):
+                if len(buffer[: match.end()].strip()) >= self.min_chars:
+                    return match.end()
+
+        if len(buffer) < self.max_chars:
+            return None
+
+        window = buffer[: self.max_chars]
+        clauses = list(_CLAUSE_END.finditer(window))
+        if clauses and clauses[-1].end() >= self.min_chars:
+            return clauses[-1].end()
+        space = window.rfind(" ")
+        if space >= self.min_chars:
+            return space
+        return self.max_chars
+
+
+async def iter_sentences(
+    deltas: AsyncIterator[str],
+    min_chars: int = 24,
+    max_chars: int = 160,
+) -> AsyncIterator[str]:
+    """Turn an async stream of text deltas into an async stream of speakable fragments."""
+    segmenter = SentenceSegmenter(min_chars=min_chars, max_chars=max_chars)
+    async for delta in deltas:
+        if not delta:
+            continue
+        for fragment in segmenter.feed(delta):
+            yield fragment
+    tail = segmenter.flush()
+    if tail:
+        yield tail
@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routes import router
+from src.config.settings import settings
+from src.services import admission as admission_module
+from src.services.admission import AdmissionController, AdmissionRejected, admission_controller
+
+
+@pytest.fixture
+def load(monkeypatch) -> dict:
+    """Decoder and LLM usage reported to the controller, and the limits it checks."""
+    usage = {"decodes": 0, "llm_calls": 0}
+    monkeypatch.setattr(
+        admission_module.openai_tts_service,
+        "decoder_stats",
+        lambda: {"active": usage["decodes"], "queued": 0},
+    )
+    monkeypatch.setattr(
+        admission_module.llm_client,
+        "stats",
+        lambda: {"in_flight": usage["llm_calls"], "queued": 0},
+    )
+    monkeypatch.setattr(settings, "admission_max_sessions", 2)
+    monkeypatch.setattr(settings, "admission_max_decodes", 4)
+    monkeypatch.setattr(settings, "admission_max_llm_calls", 4)
+    monkeypatch.setattr(settings, "admission_retry_after_s", 2.5)
+    monkeypatch.setattr(settings, "admission_queue_max", 0)
+    monkeypatch.setattr(settings, "admission_queue_poll_s", 0.01)
+    monkeypatch.setattr(admission_controller.agent, "active_sessions", {})
+    return usage
+
+
+def _controller(active_rooms: list[str]) -> AdmissionController:
+    controller = AdmissionController()
+    controller.agent = type("Agent", (), {"active_sessions": dict.fromkeys(active_rooms)})()
+    return controller
+
+
+@pytest.mark.asyncio
+async def test_session_limit_answers_429(load):
+    controller = _controller(["room-a"])
+    async with controller.admit_session("room-b"):
+        # The room being created counts once, even after it shows up as a session.
+        controller.agent.active_sessions["room-b"] = None
+        assert controller.headroom()["sessions"]["used"] == 2
+        with pytest.raises(AdmissionRejected) as excinfo:
+            async with controller.admit_session("room-c"):
+                pass
+    assert (excinfo.value.status_code, excinfo.value.reason) == (429, "sessions")
+    assert excinfo.value.retry_after_s == 2.5
+    assert controller.rejected == {"sessions": 1}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("resource", ["decodes", "llm_calls"])
+async def test_saturated_pipeline_answers_503(load, resource):
+    load[resource] = 4
+    with pytest.raises(AdmissionRejected) as excinfo:
+        async with _controller([]).admit_session("room"):
+            pass
+    assert excinfo.value.status_code == 503
+    assert excinfo.value.reason == {"decodes": "tts_decodes", "llm_calls": "llm_calls"}[resource]
+
+
+@pytest.mark.asyncio
+async def test_queued_session_is_admitted_when_capacity_frees(load, monkeypatch):
+    monkeypatch.setattr(settings, "admission_queue_max", 1)
+    monkeypatch.setattr(settings, "admission_queue_timeout_s", 1.0)
+    controller = _controller(["room-a", "room-b"])
+    asyncio.get_running_loop().call_later(0.05, controller.agent.active_sessions.pop, "room-a")
+
+    async with controller.admit_session("room-c"):
+        pass
+    assert (controller.queued, controller.admitted, controller.queue_timeouts) == (1, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_queue_wait_times_out_with_its_position(load, monkeypatch):
+    monkeypatch.setattr(settings, "admission_queue_max", 1)
+    monkeypatch.setattr(settings, "admission_queue_timeout_s", 0.05)
+    controller = _controller(["room-a", "room-b"])
+
+    with pytest.raises(AdmissionRejected) as excinfo:
+        async with controller.admit_session("room-c"):
+            pass
+    assert (excinfo.value.status_code, excinfo.value.queue_position) == (429, 1)
+    assert controller.queue_timeouts == 1
+
+
+@pytest.mark.parametrize(
+    ("rooms", "decodes", "status_code", "reason"),
+    [(["room-a", "room-b"], 0, 429, "sessions"), ([], 4, 503, "tts_decodes")],
+)
+def test_create_room_answers_with_retry_after(
+    load, monkeypatch, rooms, decodes, status_code, reason
+):
+    monkeypatch.setattr(admission_controller.agent, "active_sessions", dict.fromkeys(rooms))
+    load["decodes"] = decodes
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+
+    response = TestClient(app).post("/api/rooms/create", json={"room_name": "room-c"})
+
+    assert response.status_code == status_code
+    assert response.headers["Retry-After"] == "3"
+    assert response.json()["detail"]["reason"] == reason
@@ -0,0 +1,85 @@
+import pytest
+
+from src.config.settings import settings
+from src.services import agent as agent_module
+from src.services.agent import AgentService
+from src.services.conversation_memory import ConversationMemory
+from src.services.interview_session import InterviewSession, SessionState
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(settings, "use_tavus", False)
+    monkeypatch.setattr(settings, "llm_streaming", False)
+    monkeypatch.setattr(settings, "speculative_prefetch_enabled", False)
+    service = AgentService()
+    spoken: list = []
+    monkeypatch.setattr(
+        service, "_start_tts_task", lambda room_name, text, **kwargs: spoken.append(text)
+    )
+    service.spoken = spoken
+    return service
+
+
+def _questioning_session(service: AgentService, question_bank: list[str] | None = None):
+    session = InterviewSession(
+        "room",
+        "candidate",
+        ConversationMemory(token_budget=1000, keep_recent_turns=2),
+        question_bank=question_bank,
+    )
+    session.transition(SessionState.GREETING)
+    session.transition(SessionState.QUESTIONING)
+    service.active_sessions["room"] = session
+    return session
+
+
+@pytest.mark.asyncio
+async def test_spoken_turn_is_recorded(service, monkeypatch):
+    session = _questioning_session(service)
+
+    async def _reply(**kwargs):
+        return "What did you build last?"
+
+    monkeypatch.setattr(service, "_generate_response", _reply)
+    assert await service._run_turn(session, "I am a developer", None) == "What did you build last?"
+    assert service.spoken == ["What did you build last?"]
+    assert session.question_count == 1
+    assert session.memory.turns == [("I am a developer", "What did you build last?")]
+
+
+@pytest.mark.asyncio
+async def test_turn_interrupted_before_speaking_is_not_recorded(service, monkeypatch):
+    session = _questioning_session(service)
+
+    async def _reply(**kwargs):
+        session.turn_interrupt.set()
+        return "What did you build last?"
+
+    monkeypatch.setattr(service, "_generate_response", _reply)
+    assert await service._run_turn(session, "I am a developer", None) == ""
+    assert service.spoken == []
+    assert session.question_count == 0
+    assert session.memory.turns == []
+
+
+@pytest.mark.asyncio
+async def test_interrupted_bank_question_stays_next(service, monkeypatch):
+    session = _questioning_session(service, ["Why this job?", "Why us?"])
+    monkeypatch.setattr(settings, "question_bank_llm_ack", True)
+    monkeypatch.setattr(settings, "anthropic_model", "model")
+
+    async def _acknowledge(room_name, request, fallback):
+        session.turn_interrupt.set()
+        return "Thanks."
+
+    monkeypatch.setattr(agent_module.llm_budget, "create", _acknowledge)
+    assert await service._run_turn(session, "I like backend work", None) == ""
+    assert session.bank_index == 0
+    assert session.question_count == 0
+
+    monkeypatch.setattr(settings, "question_bank_llm_ack", False)
+    response = await service._run_turn(session, "I like backend work", None)
+    assert response.endswith("Why this job?")
+    assert session.bank_index == 1
+    assert session.question_count == 1
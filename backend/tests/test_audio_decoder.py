@@ -0,0 +1,71 @@
+import array
+import subprocess
+
+import pytest
+
+from src.services.audio_decoder import FfmpegDecoderPool, PyAVDecoder, av
+
+imageio_ffmpeg = pytest.importorskip("imageio_ffmpeg")
+pytestmark = pytest.mark.skipif(av is None, reason="PyAV is not installed")
+
+
+@pytest.fixture(scope="module", params=[True, False], ids=["lame-tag", "no-info-frame"])
+def mp3(request, tmp_path_factory) -> bytes:
+    """One second of tone encoded the way a file-backed encoder writes it (Info frame)."""
+    path = tmp_path_factory.mktemp("mp3") / "tone.mp3"
+    subprocess.run(
+        [
+            imageio_ffmpeg.get_ffmpeg_exe(),
+            "-loglevel",
+            "error",
+            "-f",
+            "lavfi",
+            "-i",
+            "sine=frequency=440:sample_rate=24000:duration=1",
+            "-ac",
+            "1",
+            "-write_xing",
+            str(int(request.param)),
+            "-y",
+            str(path),
+        ],
+        check=True,
+    )
+    return path.read_bytes()
+
+
+async def _decode(decoder, mp3: bytes) -> bytes:
+    async def _source():
+        for start in range(0, len(mp3), 1000):
+            yield mp3[start : start + 1000]
+
+    return b"".join([chunk async for chunk in decoder.decode(_source())])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sample_rate", [24000, 16000])
+async def test_backends_decode_to_the_same_length(mp3, sample_rate):
+    pyav = await _decode(PyAVDecoder(sample_rate, 1, max_workers=1, job_timeout_s=10), mp3)
+    ffmpeg = await _decode(
+        FfmpegDecoderPool(
+            imageio_ffmpeg.get_ffmpeg_exe(),
+            sample_rate,
+            1,
+            max_workers=1,
+            prewarm=0,
+            job_timeout_s=10,
+            chunk_bytes=4096,
+        ),
+        mp3,
+    )
+
+    # ffmpeg trims before resampling and PyAV after, so allow a millisecond of rounding.
+    tolerance = sample_rate // 1000
+    assert len(ffmpeg) >= sample_rate * 2
+    assert abs(len(pyav) - len(ffmpeg)) // 2 <= tolerance
+    # The encoder delay is skipped, so the tone starts at the same time in both.
+    assert abs(_onset(pyav) - _onset(ffmpeg)) <= tolerance
+
+
+def _onset(pcm: bytes) -> int:
+    return next(i for i, sample in enumerate(array.array("h", pcm)) if abs(sample) > 1000)
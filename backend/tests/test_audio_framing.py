@@ -0,0 +1,66 @@
+import pytest
+
+from src.services.audio_framing import PcmFramer, fade_out
+
+PCM = bytes(range(256)) * 10
+
+
+async def _chunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def _frames(framer: PcmFramer, data: bytes, chunk_size: int) -> list[bytes]:
+    # Copy each view: it is only valid until the next push.
+    return [bytes(frame) async for frame in framer.iter_frames(_chunks(data, chunk_size))]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 7, 40, 333, len(PCM)])
+async def test_frames_do_not_depend_on_chunk_boundaries(chunk_size):
+    frames = await _frames(PcmFramer(frame_bytes=40, capacity_frames=2), PCM, chunk_size)
+
+    assert all(len(frame) == 40 for frame in frames)
+    assert b"".join(frames) == PCM
+
+
+@pytest.mark.asyncio
+async def test_tail_is_flushed_sample_aligned():
+    frames = await _frames(PcmFramer(frame_bytes=40), PCM[:87], chunk_size=30)
+
+    assert [len(frame) for frame in frames] == [40, 40, 6]
+    assert b"".join(frames) == PCM[:86]
+
+
+def test_frames_never_straddle_the_ring_wrap():
+    framer = PcmFramer(frame_bytes=4, capacity_frames=2)
+    framer.push(b"abcdef")
+    assert bytes(framer.pop()) == b"abcd"
+    # The write wraps around the 8-byte ring; the next frames still come out whole.
+    framer.push(b"ghij")
+    assert bytes(framer.pop()) == b"efgh"
+    assert framer.pop() is None
+    assert framer.buffered == 2
+    assert bytes(framer.flush()) == b"ij"
+
+
+def test_ring_grows_when_a_chunk_outruns_it():
+    framer = PcmFramer(frame_bytes=4, capacity_frames=2)
+    framer.push(b"ab")
+    framer.push(PCM[:30])
+    frames = []
+    while (frame := framer.pop()) is not None:
+        frames.append(bytes(frame))
+    assert b"".join(frames) == (b"ab" + PCM[:30])[:32]
+
+
+def test_frame_size_must_hold_whole_samples():
+    with pytest.raises(ValueError):
+        PcmFramer(frame_bytes=41)
+
+
+def test_fade_out_ramps_to_silence():
+    pcm = (1000).to_bytes(2, "little", signed=True) * 4
+    faded = fade_out(pcm, num_channels=1)
+    samples = [int.from_bytes(faded[i : i + 2], "little", signed=True) for i in range(0, 8, 2)]
+    assert samples == [1000, 750, 500, 250]
@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from src.services.audio_pacing import AudioPacer, PacingMetrics, PacingStats
+
+SAMPLE_RATE = 48000
+FRAME_SAMPLES = 480  # 10 ms
+
+
+@pytest.mark.asyncio
+async def test_lead_stays_bounded_while_frames_arrive_early():
+    pacer = AudioPacer(SAMPLE_RATE, lead_ms=40)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    max_buffered = 0.0
+    for _ in range(30):
+        await pacer.pace(FRAME_SAMPLES)
+        max_buffered = max(max_buffered, pacer.buffered_s)
+    elapsed = loop.time() - start
+
+    # 300 ms of audio is handed over in real time, minus the lead kept in the sink.
+    assert 0.03 <= max_buffered <= 0.06
+    assert 0.24 <= elapsed <= 0.4
+    assert pacer.stats.late_frames == 0
+    assert pacer.stats.frames == 30
+    assert pacer.stats.audio_ms == pytest.approx(300)
+
+
+@pytest.mark.asyncio
+async def test_stall_longer_than_the_lead_is_one_underrun_without_a_burst():
+    stats = PacingStats()
+    pacer = AudioPacer(SAMPLE_RATE, lead_ms=20, stats=stats)
+    for _ in range(5):
+        await pacer.pace(FRAME_SAMPLES)
+    await asyncio.sleep(0.1)
+    await pacer.pace(FRAME_SAMPLES)
+    # Re-anchored: the late frame starts a fresh lead instead of owing the stall.
+    assert pacer.buffered_s <= 0.011
+
+    for _ in range(5):
+        await pacer.pace(FRAME_SAMPLES)
+    assert stats.underruns == 1
+    assert stats.late_frames == 1
+    assert stats.max_lateness_ms >= 60
+
+
+def test_metrics_are_kept_per_room():
+    metrics = PacingMetrics()
+    metrics.for_room("room").late_frames += 2
+    assert metrics.for_room("room") is metrics.for_room("room")
+    assert metrics.snapshot("room")["late_frames"] == 2
+    metrics.drop("room")
+    assert metrics.snapshot("room") is None
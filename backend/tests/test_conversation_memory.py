@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+
+from src.services import conversation_memory as memory_module
+from src.services.conversation_memory import NO_ANSWER, ConversationMemory, estimate_tokens
+
+ANSWER = "I built the billing service in Go and ran it on Kubernetes."
+QUESTION = "What was the hardest part of that?"
+
+
+@pytest.fixture
+def summaries(monkeypatch) -> list[dict]:
+    requests: list[dict] = []
+
+    async def _create_text(**request) -> str:
+        requests.append(request)
+        await asyncio.sleep(0)
+        return "Asked about billing; candidate used Go."
+
+    monkeypatch.setattr(memory_module.llm_client, "create_text", _create_text)
+    return requests
+
+
+def test_turns_without_a_reply_are_not_stored():
+    memory = ConversationMemory(token_budget=1000, keep_recent_turns=2)
+    memory.add_turn("Hello", "   ")
+    memory.add_turn("  ", QUESTION)
+    assert memory.turns == [(NO_ANSWER, QUESTION)]
+
+
+def test_messages_leave_out_the_oldest_turns_over_budget():
+    memory = ConversationMemory(token_budget=1000, keep_recent_turns=10)
+    for index in range(3):
+        memory.add_turn(f"{ANSWER} {index}", QUESTION)
+    turn_tokens = estimate_tokens(f"{ANSWER} 0") + estimate_tokens(QUESTION)
+    # Room for the new message and two turns, but not three.
+    memory.token_budget = 2 * turn_tokens + 10
+
+    messages = memory.messages("Next answer")
+
+    assert [message["content"] for message in messages] == [
+        f"{ANSWER} 1",
+        QUESTION,
+        f"{ANSWER} 2",
+        QUESTION,
+        "Next answer",
+    ]
+    assert [message["role"] for message in messages] == ["user", "assistant"] * 2 + ["user"]
+
+
+@pytest.mark.asyncio
+async def test_old_turns_are_folded_into_a_summary(summaries):
+    memory = ConversationMemory(token_budget=60, keep_recent_turns=1)
+    for index in range(3):
+        memory.add_turn(f"{ANSWER} {index}", QUESTION)
+    await memory._summary_task
+
+    assert len(summaries) == 1
+    assert f"{ANSWER} 0" in summaries[0]["messages"][0]["content"]
+    assert memory.turns == [(f"{ANSWER} 2", QUESTION)]
+    assert memory.summary == "Asked about billing; candidate used Go."
+    assert "Notes from earlier" in memory.system_notes()
+    assert memory.stats()["summaries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_summary_keeps_the_transcript(monkeypatch):
+    async def _fail(**request) -> str:
+        raise RuntimeError("overloaded")
+
+    monkeypatch.setattr(memory_module.llm_client, "create_text", _fail)
+    memory = ConversationMemory(token_budget=60, keep_recent_turns=1)
+    for index in range(3):
+        memory.add_turn(f"{ANSWER} {index}", QUESTION)
+    await memory._summary_task
+
+    assert len(memory.turns) == 3
+    assert memory.system_notes() == ""
+    # The prompt still stays within the budget by leaving out the oldest turns.
+    assert len(memory.messages("Next")) < 7
@@ -0,0 +1,87 @@
+import asyncio
+import types
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routes import router
+from src.config.settings import settings
+from src.services.admission import AdmissionRejected, admission_controller
+from src.services.drain import DrainController, drain_controller
+from src.services.session_store import FORWARDED_HEADER
+
+
+class _FakeAgent:
+    def __init__(self, rooms: list[str]) -> None:
+        self.active_sessions = {
+            room: types.SimpleNamespace(turn_lock=asyncio.Lock(), tts_task=None) for room in rooms
+        }
+        self.ended: list[str] = []
+
+    async def end_session(self, room_name: str) -> bool:
+        self.ended.append(room_name)
+        self.active_sessions.pop(room_name)
+        return True
+
+
+@pytest.fixture
+def controller(monkeypatch) -> DrainController:
+    monkeypatch.setattr(admission_controller, "closed_reason", None)
+    monkeypatch.setattr(settings, "drain_turn_deadline_s", 1.0)
+    monkeypatch.setattr(settings, "drain_teardown_deadline_s", 1.0)
+    controller = DrainController()
+    controller.agent = _FakeAgent(["room-a", "room-b"])
+    return controller
+
+
+@pytest.mark.asyncio
+async def test_drain_waits_for_running_turns_then_ends_every_room(controller):
+    session = controller.agent.active_sessions["room-a"]
+    await session.turn_lock.acquire()
+    asyncio.get_running_loop().call_later(0.1, session.turn_lock.release)
+
+    report = await controller.drain()
+
+    assert controller.state == "drained"
+    assert admission_controller.closed_reason == "draining"
+    assert sorted(controller.agent.ended) == ["room-a", "room-b"]
+    assert (report["rooms"], report["ended"], report["turns_cut_off"]) == (2, 2, 0)
+    assert report["phases"]["turns_ms"] >= 100
+
+
+@pytest.mark.asyncio
+async def test_drain_cuts_off_turns_past_the_deadline(controller, monkeypatch):
+    monkeypatch.setattr(settings, "drain_turn_deadline_s", 0.05)
+    await controller.agent.active_sessions["room-a"].turn_lock.acquire()
+
+    report = await controller.drain()
+
+    assert report["turns_cut_off"] == 1
+    assert report["ended"] == 2
+
+
+def test_new_turns_are_refused_once_draining(controller):
+    controller.check_turn()
+    controller.state = "draining"
+    with pytest.raises(AdmissionRejected) as excinfo:
+        controller.check_turn()
+    assert (excinfo.value.status_code, excinfo.value.reason) == (503, "draining")
+    assert controller.turns_rejected == 1
+
+
+def test_say_answers_503_with_retry_after_while_draining(monkeypatch):
+    monkeypatch.setattr(drain_controller, "state", "draining")
+    monkeypatch.setattr(settings, "admission_retry_after_s", 2.5)
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+
+    response = TestClient(app).post(
+        "/api/say",
+        json={"room_name": "room-a", "text": "hello"},
+        headers={FORWARDED_HEADER: "router"},
+    )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "3"
+    assert response.json()["detail"]["reason"] == "draining"
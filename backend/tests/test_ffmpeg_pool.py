@@ -0,0 +1,87 @@
+import asyncio
+import subprocess
+
+import pytest
+
+from src.services.audio_decoder import FfmpegDecoderPool
+
+imageio_ffmpeg = pytest.importorskip("imageio_ffmpeg")
+
+
+@pytest.fixture(scope="module")
+def mp3() -> bytes:
+    return subprocess.run(
+        [
+            imageio_ffmpeg.get_ffmpeg_exe(),
+            "-loglevel",
+            "error",
+            "-f",
+            "lavfi",
+            "-i",
+            "sine=frequency=440:sample_rate=24000:duration=0.5",
+            "-ac",
+            "1",
+            "-f",
+            "mp3",
+            "pipe:1",
+        ],
+        capture_output=True,
+        check=True,
+    ).stdout
+
+
+def _pool(max_workers: int, prewarm: int) -> FfmpegDecoderPool:
+    return FfmpegDecoderPool(
+        imageio_ffmpeg.get_ffmpeg_exe(),
+        sample_rate=24000,
+        num_channels=1,
+        max_workers=max_workers,
+        prewarm=prewarm,
+        job_timeout_s=10,
+        chunk_bytes=4096,
+    )
+
+
+async def _decode(pool: FfmpegDecoderPool, mp3: bytes, gate: asyncio.Event | None = None) -> int:
+    async def _source():
+        if gate is not None:
+            await gate.wait()
+        yield mp3
+
+    return sum([len(chunk) async for chunk in pool.decode(_source())])
+
+
+@pytest.mark.asyncio
+async def test_jobs_beyond_max_workers_queue(mp3):
+    pool = _pool(max_workers=1, prewarm=0)
+    await pool.start()
+    gate = asyncio.Event()
+    first = asyncio.create_task(_decode(pool, mp3, gate))
+    second = asyncio.create_task(_decode(pool, mp3))
+    await asyncio.sleep(0.1)
+
+    assert (pool.active, pool.queued) == (1, 1)
+    gate.set()
+    lengths = await asyncio.gather(first, second)
+    await pool.close()
+
+    assert lengths[0] == lengths[1] >= 24000
+    stats = pool.stats()
+    assert (stats["active"], stats["queued"], stats["max_queued"]) == (0, 0, 1)
+    assert stats["jobs"] == 2 and stats["failures"] == 0
+    assert stats["queue_wait_max_ms"] > 0
+
+
+@pytest.mark.asyncio
+async def test_prewarmed_process_serves_the_first_job(mp3):
+    pool = _pool(max_workers=2, prewarm=1)
+    await pool.start()
+    assert pool.stats()["idle"] == 1
+
+    assert await _decode(pool, mp3) >= 24000
+    await asyncio.sleep(0.1)
+    await pool.close()
+
+    assert pool.warm_starts == 1
+    # The used process is replaced in the background, off the request path.
+    assert pool.spawned == 2
@@ -0,0 +1,55 @@
+import asyncio
+import types
+
+import pytest
+
+from src.config.settings import settings
+from src.services.agent import AgentService
+from src.services.filler_audio import filler_audio
+from src.services.jitter_buffer import jitter_buffers
+
+FRAME_BYTES = 960  # 20 ms of 24 kHz mono s16le
+FILLER = b"\x10\x00" * 2400  # 100 ms
+REPLY = b"\x20\x00" * 2400  # 100 ms
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(settings, "filler_enabled", True)
+    monkeypatch.setattr(settings, "filler_delay_ms", 10)
+    monkeypatch.setattr(settings, "jitter_policy", "low_latency")
+    monkeypatch.setattr(settings, "jitter_min_ms", 40)
+    monkeypatch.setattr(filler_audio, "_clips", [FILLER])
+    published: list[bytes] = []
+
+    async def _ensure_publisher(room_name, participant_name):
+        return object()
+
+    async def _publish(room_name, pcm_data, **kwargs):
+        published.append(bytes(pcm_data))
+
+    async def _slow_reply(text):
+        await asyncio.sleep(0.2)
+        yield REPLY
+
+    service = AgentService()
+    service.livekit = types.SimpleNamespace(
+        ensure_publisher=_ensure_publisher, publish_audio_frame=_publish
+    )
+    service.tts = types.SimpleNamespace(iter_pcm_bytes=_slow_reply)
+    service.published = published
+    yield service
+    jitter_buffers.drop("room")
+
+
+@pytest.mark.asyncio
+async def test_filler_bypasses_the_prebuffer(service):
+    await service._stream_tts_to_livekit("room", "Tell me more.")
+
+    # The whole clip plays while the reply is pending, then the reply follows intact.
+    assert b"".join(service.published[:5]) == FILLER
+    assert b"".join(service.published[5:]) == REPLY
+    prebuffer = jitter_buffers.for_room("room")
+    # Only the reply counts toward the upstream measurement: 100 ms delivered at once.
+    assert prebuffer.duration_ms == pytest.approx(100)
+    assert prebuffer.rate == 2.0
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from src.config.settings import settings
+from src.services.jitter_buffer import AdaptivePrebuffer, JitterBuffers
+
+FRAME_BYTES = 960  # 10 ms of 48 kHz mono s16le
+
+
+async def _hold(prebuffer: AdaptivePrebuffer, count: int, delay_s: float = 0.0):
+    """Run ``count`` frames through ``hold``; returns them and how many were produced
+    by the time the first one was released."""
+    produced: list[int] = []
+
+    async def _frames():
+        for index in range(count):
+            if delay_s:
+                await asyncio.sleep(delay_s)
+            produced.append(index)
+            yield bytes([index]) * FRAME_BYTES
+
+    released: list[bytes] = []
+    produced_at_first = None
+    async for frame in prebuffer.hold(_frames(), FRAME_BYTES, frame_ms=10):
+        if produced_at_first is None:
+            produced_at_first = len(produced)
+        released.append(bytes(frame))
+    return released, produced_at_first
+
+
+@pytest.mark.asyncio
+async def test_hold_releases_once_the_depth_is_buffered():
+    prebuffer = AdaptivePrebuffer("low_latency", min_ms=30, max_ms=200, step_ms=40)
+    released, produced_at_first = await _hold(prebuffer, 6)
+
+    assert produced_at_first == 3
+    assert released == [bytes([index]) * FRAME_BYTES for index in range(6)]
+
+
+@pytest.mark.asyncio
+async def test_short_utterance_is_released_at_its_end():
+    prebuffer = AdaptivePrebuffer("low_latency", min_ms=50, max_ms=200, step_ms=40)
+    released, produced_at_first = await _hold(prebuffer, 2)
+    assert produced_at_first == 2
+    assert len(released) == 2
+
+
+@pytest.mark.asyncio
+async def test_low_latency_grows_after_underruns_and_decays_when_clean():
+    prebuffer = AdaptivePrebuffer("low_latency", min_ms=20, max_ms=100, step_ms=40)
+    await _hold(prebuffer, 5)
+    prebuffer.observe(underruns=2)
+    assert prebuffer.depth_ms == 60
+
+    await _hold(prebuffer, 5)
+    prebuffer.observe(underruns=1)
+    await _hold(prebuffer, 5)
+    prebuffer.observe(underruns=1)
+    assert prebuffer.depth_ms == 100
+
+    await _hold(prebuffer, 5)
+    prebuffer.observe(underruns=0)
+    assert prebuffer.depth_ms == 60
+    assert (prebuffer.utterances, prebuffer.underrun_utterances) == (4, 3)
+
+
+@pytest.mark.asyncio
+async def test_smooth_covers_a_slow_upstream():
+    prebuffer = AdaptivePrebuffer("smooth", min_ms=20, max_ms=500, step_ms=40)
+    # 100 ms of audio delivered over ~200 ms: half real time.
+    await _hold(prebuffer, 10, delay_s=0.02)
+    prebuffer.observe(underruns=0)
+
+    assert prebuffer.rate == pytest.approx(0.5, abs=0.15)
+    # duration * (1 - rate) * 1.25 is about 60 ms.
+    assert 40 <= prebuffer.depth_ms <= 90
+
+
+def test_observe_without_audio_changes_nothing():
+    prebuffer = AdaptivePrebuffer("smooth", min_ms=20, max_ms=500, step_ms=40)
+    prebuffer.observe(underruns=3)
+    assert (prebuffer.depth_ms, prebuffer.utterances) == (60, 0)
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError):
+        AdaptivePrebuffer("fast", min_ms=20, max_ms=100, step_ms=40)
+
+
+def test_registry_falls_back_to_low_latency(monkeypatch):
+    monkeypatch.setattr(settings, "jitter_policy", "fast")
+    buffers = JitterBuffers()
+    assert buffers.for_room("room").policy == "low_latency"
+    assert buffers.for_room("room") is buffers.for_room("room")
+    buffers.drop("room")
+    assert buffers.snapshot("room") is None
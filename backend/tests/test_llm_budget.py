@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+
+from src.config.settings import settings
+from src.services import llm_budget as llm_budget_module
+from src.services.agent import FALLBACK_QUESTIONS, AgentService
+from src.services.conversation_memory import ConversationMemory
+from src.services.interview_session import InterviewSession, SessionState
+from src.services.llm_budget import LatencyBudget
+
+REQUEST = {"model": "primary", "messages": [], "max_tokens": 10}
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    """llm_client stand-in answering after a per-model delay."""
+    delays = {"primary": 1.0, "hedge": 0.0}
+    calls: list[str] = []
+
+    async def _create_text(*, model: str, **kwargs) -> str:
+        calls.append(model)
+        await asyncio.sleep(delays[model])
+        return f"reply from {model}"
+
+    monkeypatch.setattr(llm_budget_module.llm_client, "create_text", _create_text)
+    monkeypatch.setattr(settings, "llm_turn_budget_ms", 50)
+    monkeypatch.setattr(settings, "llm_hedge_budget_ms", 50)
+    monkeypatch.setattr(settings, "llm_create_budget_ms", 50)
+    monkeypatch.setattr(settings, "anthropic_hedge_model", "hedge")
+    return delays, calls
+
+
+@pytest.mark.asyncio
+async def test_fast_reply_is_used_as_is(fake_llm, monkeypatch):
+    delays, _ = fake_llm
+    delays["primary"] = 0.0
+    monkeypatch.setattr(settings, "llm_budget_action", "hedge")
+    budget = LatencyBudget()
+
+    assert await budget.create("room", REQUEST, fallback=lambda: "fallback") == "reply from primary"
+    assert budget.counters["budget_misses"] == 0
+
+
+@pytest.mark.asyncio
+async def test_complete_reply_gets_the_whole_reply_budget(fake_llm, monkeypatch):
+    delays, calls = fake_llm
+    delays["primary"] = 0.1
+    monkeypatch.setattr(settings, "llm_budget_action", "hedge")
+    monkeypatch.setattr(settings, "llm_create_budget_ms", 500)
+    budget = LatencyBudget()
+
+    # Slower than the first-token budget, but a non-streaming reply is only timed as a whole.
+    assert await budget.create("room", REQUEST, fallback=lambda: "fallback") == "reply from primary"
+    assert calls == ["primary"]
+    assert budget.counters["budget_misses"] == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_reply_is_hedged_to_the_faster_model(fake_llm, monkeypatch):
+    _, calls = fake_llm
+    monkeypatch.setattr(settings, "llm_budget_action", "hedge")
+    budget = LatencyBudget()
+
+    assert await budget.create("room", REQUEST, fallback=lambda: "fallback") == "reply from hedge"
+    assert calls == ["primary", "hedge"]
+    assert budget.counters["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_budget_miss_falls_back_on_timeout(fake_llm, monkeypatch):
+    monkeypatch.setattr(settings, "llm_budget_action", "fallback")
+    budget = LatencyBudget()
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    assert await budget.create("room", REQUEST, fallback=lambda: "fallback") == "fallback"
+    assert loop.time() - start < 0.5
+    assert budget.counters["budget_misses"] == 1
+    assert budget.counters["fallbacks"] == 1
+
+
+def _session(service: AgentService, question_bank: list[str]) -> InterviewSession:
+    session = InterviewSession(
+        "room",
+        "candidate",
+        ConversationMemory(token_budget=1000, keep_recent_turns=2),
+        question_bank=question_bank,
+    )
+    session.transition(SessionState.GREETING)
+    session.transition(SessionState.QUESTIONING)
+    service.active_sessions["room"] = session
+    return session
+
+
+@pytest.mark.asyncio
+async def test_fallback_asks_the_jobs_next_bank_question():
+    service = AgentService()
+    session = _session(service, ["Why Go?", "Why us?"])
+    session.bank_index = 1
+    assert service._fallback_reply("room", True, session.memory) == "Why us?"
+
+    session.bank_index = 2
+    assert service._fallback_reply("room", True, session.memory) in FALLBACK_QUESTIONS
+
+
+@pytest.mark.asyncio
+async def test_bank_fallback_is_spoken_once(monkeypatch):
+    monkeypatch.setattr(settings, "use_tavus", False)
+    monkeypatch.setattr(settings, "llm_streaming", False)
+    monkeypatch.setattr(settings, "speculative_prefetch_enabled", False)
+    service = AgentService()
+    monkeypatch.setattr(service, "_start_tts_task", lambda *args, **kwargs: None)
+    session = _session(service, ["Why Go?", "Why us?"])
+
+    async def _budget_miss(room_name, request, fallback):
+        return fallback()
+
+    monkeypatch.setattr(llm_budget_module.llm_budget, "create", _budget_miss)
+    # A candidate question goes to the LLM, which misses its budget.
+    assert await service._run_turn(session, "What does the team do?", None) == "Why Go?"
+    assert session.bank_index == 1
+    assert await service._run_turn(session, "Is it remote?", None) == "Why us?"
+    assert session.bank_index == 2
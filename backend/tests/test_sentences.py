@@ -0,0 +1,63 @@
+import pytest
+
+from src.utils.sentences import SentenceSegmenter, iter_sentences
+
+
+async def _deltas(text: str, size: int):
+    for start in range(0, len(text), size):
+        yield text[start : start + size]
+
+
+async def _fragments(text: str, size: int, **kwargs) -> list[str]:
+    return [fragment async for fragment in iter_sentences(_deltas(text, size), **kwargs)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [1, 3, 1000])
+async def test_fragments_do_not_depend_on_delta_boundaries(size):
+    text = (
+        "Thanks for walking me through that project. "
+        "What was the hardest bug you fixed there? "
+        "Take your time."
+    )
+    assert await _fragments(text, size, min_chars=10) == [
+        "Thanks for walking me through that project.",
+        "What was the hardest bug you fixed there?",
+        "Take your time.",
+    ]
+
+
+def test_first_fragment_may_end_at_a_clause():
+    segmenter = SentenceSegmenter(min_chars=10)
+    assert segmenter.feed("Great, that sounds like a solid design, ") == [
+        "Great, that sounds like a solid design,"
+    ]
+    # Later fragments wait for a sentence end.
+    assert segmenter.feed("but how did it scale, ") == []
+    assert segmenter.feed("and what broke first? ") == [
+        "but how did it scale, and what broke first?"
+    ]
+
+
+def test_a_period_inside_a_token_is_not_a_sentence_end():
+    segmenter = SentenceSegmenter(min_chars=5)
+    assert segmenter.feed("You used Python 3.11 for that") == []
+    assert segmenter.flush() == "You used Python 3.11 for that"
+    assert segmenter.flush() is None
+
+
+def test_short_sentences_are_merged_up_to_min_chars():
+    segmenter = SentenceSegmenter(min_chars=20)
+    assert segmenter.feed("Okay. I see. Tell me more. ") == ["Okay. I see. Tell me more."]
+
+
+def test_cjk_terminators_need_no_trailing_space():
+    segmenter = SentenceSegmenter(min_chars=2)
+    assert segmenter.feed("你好。请介绍一下你自己") == ["你好。"]
+
+
+def test_long_run_without_a_boundary_is_cut_at_whitespace():
+    segmenter = SentenceSegmenter(min_chars=5, max_chars=30)
+    fragments = segmenter.feed("one two three four five six seven eight nine ten")
+    assert fragments == ["one two three four five six"]
+    assert all(len(fragment) <= 30 for fragment in fragments)
@@ -0,0 +1,87 @@
+import asyncio
+import types
+
+import pytest
+
+from src.config.settings import settings
+from src.services.session_reaper import SessionReaper
+
+
+class _FakeAgent:
+    def __init__(self) -> None:
+        self.active_sessions: dict = {}
+        self.ended: list[str] = []
+        self.fail: set[str] = set()
+        self.slow: set[str] = set()
+
+    def add(self, room_name: str, idle_s: float, **state):
+        loop = asyncio.get_running_loop()
+        session = types.SimpleNamespace(
+            room_name=room_name,
+            participant_name="candidate",
+            turn_lock=asyncio.Lock(),
+            last_activity=loop.time() - idle_s,
+            **{"client_ws": None, **state},
+        )
+        session.touch = lambda: setattr(session, "last_activity", loop.time())
+        session.idle_s = lambda: loop.time() - session.last_activity
+        self.active_sessions[room_name] = session
+        return session
+
+    async def end_session(self, room_name: str) -> bool:
+        if room_name in self.slow:
+            await asyncio.sleep(0.3)
+        if room_name in self.fail:
+            raise RuntimeError("LiveKit unavailable")
+        self.ended.append(room_name)
+        return True
+
+
+@pytest.fixture
+def reaper(monkeypatch) -> SessionReaper:
+    monkeypatch.setattr(settings, "session_idle_ttl_s", 60)
+    monkeypatch.setattr(settings, "session_reaper_deadline_s", 0.1)
+    reaper = SessionReaper()
+    reaper.agent = _FakeAgent()
+    present: set[str] = set()
+    reaper.livekit = types.SimpleNamespace(
+        participant_present=lambda room_name, identity: room_name in present
+    )
+    reaper.present = present
+    return reaper
+
+
+@pytest.mark.asyncio
+async def test_only_idle_sessions_are_reaped(reaper):
+    agent = reaper.agent
+    agent.add("idle", idle_s=120)
+    agent.add("recent", idle_s=5)
+    agent.add("websocket", idle_s=120, client_ws=object())
+    agent.add("in-room", idle_s=120)
+    reaper.present.add("in-room")
+    running = agent.add("turn", idle_s=120)
+    await running.turn_lock.acquire()
+
+    assert await reaper.sweep() == ["idle"]
+    assert agent.ended == ["idle"]
+    # Active sessions are touched, so they age from now on.
+    assert agent.active_sessions["in-room"].idle_s() < 1
+    assert reaper.stats()["reclaimed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_and_slow_teardowns_do_not_fail_the_sweep(reaper):
+    agent = reaper.agent
+    for room_name in ("ok", "broken", "slow"):
+        agent.add(room_name, idle_s=120)
+    agent.fail.add("broken")
+    agent.slow.add("slow")
+
+    assert await reaper.sweep() == ["ok"]
+    assert reaper.overran_deadline == 1
+    assert reaper.stats()["in_progress"] == 1
+
+    await asyncio.sleep(0.3)
+    stats = reaper.stats()
+    assert (stats["reclaimed"], stats["failures"], stats["in_progress"]) == (2, 1, 0)
+    assert sorted(agent.ended) == ["ok", "slow"]
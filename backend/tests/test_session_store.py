@@ -0,0 +1,162 @@
+import asyncio
+import json
+import types
+
+import fakeredis
+import httpx
+import pytest
+
+from src.config.settings import settings
+from src.services import session_store
+from src.services.session_store import (
+    FORWARDED_HEADER,
+    MemorySessionStore,
+    RedisSessionStore,
+    RoomLeases,
+    RoomOwnedError,
+)
+
+
+@pytest.fixture(params=["memory", "redis"])
+def store(request, monkeypatch):
+    if request.param == "memory":
+        return MemorySessionStore()
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(
+        session_store,
+        "aioredis",
+        types.SimpleNamespace(
+            from_url=lambda url, **kwargs: fakeredis.aioredis.FakeRedis(server=server, **kwargs)
+        ),
+    )
+    return RedisSessionStore("redis://fake", "test")
+
+
+@pytest.fixture
+def leases(monkeypatch):
+    monkeypatch.setattr(settings, "session_lease_ttl_s", 0.3)
+    created: list[RoomLeases] = []
+
+    def _make(store, owner_id: str) -> RoomLeases:
+        room_leases = RoomLeases()
+        room_leases.store = store
+        room_leases.owner_id = owner_id
+        created.append(room_leases)
+        return room_leases
+
+    yield _make
+    for room_leases in created:
+        if room_leases._task is not None:
+            room_leases._task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_acquire_is_exclusive_until_released(store):
+    assert await store.acquire_lease("room", "a", 5)
+    assert await store.acquire_lease("room", "a", 5)
+    assert not await store.acquire_lease("room", "b", 5)
+    assert await store.lease_owner("room") == "a"
+
+    await store.release_lease("room", "b")
+    assert await store.lease_owner("room") == "a"
+    await store.release_lease("room", "a")
+    assert await store.acquire_lease("room", "b", 5)
+
+
+@pytest.mark.asyncio
+async def test_renew_extends_only_the_owners_lease(store):
+    assert await store.acquire_lease("room", "a", 0.2)
+    assert not await store.renew_lease("room", "b", 5)
+    assert await store.renew_lease("room", "a", 5)
+    await asyncio.sleep(0.3)
+    assert await store.lease_owner("room") == "a"
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_can_be_taken_over(store):
+    assert await store.acquire_lease("room", "a", 0.1)
+    await asyncio.sleep(0.2)
+    assert await store.lease_owner("room") is None
+    assert not await store.renew_lease("room", "a", 5)
+    assert await store.acquire_lease("room", "b", 5)
+
+
+@pytest.mark.asyncio
+async def test_session_records_round_trip(store):
+    await store.put_session("room", {"room_name": "room", "turn_count": 2})
+    assert await store.get_session("room") == {"room_name": "room", "turn_count": 2}
+    assert await store.list_sessions() == ["room"]
+    await store.delete_session("room")
+    assert await store.get_session("room") is None
+    assert await store.list_sessions() == []
+
+
+@pytest.mark.asyncio
+async def test_claim_of_a_room_served_elsewhere_raises(store, leases):
+    first = leases(store, "http://worker-a")
+    second = leases(store, "http://worker-b")
+    await first.claim("room", {"room_name": "room"})
+
+    with pytest.raises(RoomOwnedError) as excinfo:
+        await second.claim("room", {"room_name": "room"})
+    assert excinfo.value.owner == "http://worker-a"
+    assert await second.remote_owner("room") == "http://worker-a"
+    assert await first.remote_owner("room") is None
+
+
+@pytest.mark.asyncio
+async def test_renewal_keeps_the_lease_alive(store, leases):
+    owner = leases(store, "http://worker-a")
+    owner._task = asyncio.create_task(owner._renew_loop())
+    await owner.claim("room", {"room_name": "room"})
+    await asyncio.sleep(0.6)
+    assert await store.lease_owner("room") == "http://worker-a"
+    assert owner.leases_lost == 0
+
+
+@pytest.mark.asyncio
+async def test_lost_lease_stops_serving_the_room(store, leases):
+    lost: list[str] = []
+
+    async def _on_lost(room_name: str) -> None:
+        lost.append(room_name)
+
+    first = leases(store, "http://worker-a")
+    first.on_lost = _on_lost
+    first._task = asyncio.create_task(first._renew_loop())
+    await first.claim("room", {"room_name": "room"})
+
+    # Another worker takes the room over once the lease is gone.
+    await store.release_lease("room", "http://worker-a")
+    second = leases(store, "http://worker-b")
+    await second.claim("room", {"room_name": "room"})
+    await asyncio.sleep(0.25)
+
+    assert lost == ["room"]
+    assert first.leases_lost == 1
+    # Releasing after the loss must not drop the new owner's lease or record.
+    await first.release("room")
+    assert await store.lease_owner("room") == "http://worker-b"
+    assert (await store.get_session("room"))["owner"] == "http://worker-b"
+
+
+@pytest.mark.asyncio
+async def test_forward_marks_the_request_as_forwarded(leases):
+    seen: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"response": "ok"})
+
+    room_leases = leases(MemorySessionStore(), "http://worker-a")
+    room_leases._http = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    response = await room_leases.forward(
+        "http://worker-b/", "POST", "/api/say", {"room_name": "room", "text": "hi"}
+    )
+    await room_leases._http.aclose()
+
+    assert response.json() == {"response": "ok"}
+    assert str(seen[0].url) == "http://worker-b/api/say"
+    assert seen[0].headers[FORWARDED_HEADER] == "http://worker-a"
+    assert json.loads(seen[0].content) == {"room_name": "room", "text": "hi"}
+    assert room_leases.forwarded == 1
@@ -0,0 +1,49 @@
+import pytest
+
+from src import shard_router
+from src.config.settings import settings
+from src.shard_router import ShardRouter, WorkerSupervisor, merge_worker_payloads
+
+
+@pytest.fixture
+def spawned_envs(monkeypatch) -> list[dict]:
+    envs: list[dict] = []
+    monkeypatch.setattr(
+        shard_router.subprocess, "Popen", lambda args, cwd, env: envs.append(env)
+    )
+    return envs
+
+
+def test_only_the_first_worker_warms_up_and_evicts(spawned_envs, monkeypatch):
+    monkeypatch.setattr(settings, "tts_warmup_on_startup", True)
+    monkeypatch.setattr(settings, "tts_cache_evict_enabled", True)
+    supervisor = WorkerSupervisor(3)
+    for index in range(3):
+        supervisor._spawn(index)
+
+    assert [env["TTS_WARMUP_ON_STARTUP"] for env in spawned_envs] == ["True", "False", "False"]
+    assert [env["TTS_CACHE_EVICT_ENABLED"] for env in spawned_envs] == ["True", "False", "False"]
+
+
+def test_disabled_warm_up_stays_off_on_the_first_worker(spawned_envs, monkeypatch):
+    monkeypatch.setattr(settings, "tts_warmup_on_startup", False)
+    WorkerSupervisor(2)._spawn(0)
+    assert spawned_envs[0]["TTS_WARMUP_ON_STARTUP"] == "False"
+
+
+def test_warm_up_requests_go_to_the_first_worker_only():
+    router = ShardRouter(WorkerSupervisor(4))
+    assert "/api/admin/tts/warmup" not in shard_router._FANOUT_PATHS
+    assert router.worker_for("/api/admin/tts/warmup", b"") == 0
+    room_worker = shard_router.shard_for("room-7", 4)
+    assert router.worker_for("/api/say", b'{"room_name": "room-7"}') == room_worker
+
+
+def test_worker_payloads_merge():
+    merged = merge_worker_payloads(
+        [
+            {"active": 2, "ok": True, "wait_ms": 10, "state": "serving"},
+            {"active": 3, "ok": False, "wait_ms": 30, "state": "draining"},
+        ]
+    )
+    assert merged == {"active": 5, "ok": False, "wait_ms": 30, "state": ["serving", "draining"]}
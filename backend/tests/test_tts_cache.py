@@ -0,0 +1,74 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from src.services.tts_cache import STALE_TMP_AGE_S, PcmMemoryCache, TTSDiskCache
+
+
+def test_memory_cache_evicts_least_recently_used_by_bytes():
+    cache = PcmMemoryCache(max_bytes=300, max_entry_bytes=200)
+    cache.put("a", b"a" * 100)
+    cache.put("b", b"b" * 100)
+    cache.put("c", b"c" * 100)
+    assert cache.get("a") is not None
+
+    cache.put("d", b"d" * 100)
+    assert not cache.contains("b")
+    assert all(cache.contains(key) for key in "acd")
+    assert cache.stats()["bytes"] == 300
+    assert cache.evictions == 1
+
+    assert not cache.put("e", b"e" * 201)
+    assert not cache.contains("e")
+
+
+def _disk_cache(tmp_path, **limits) -> TTSDiskCache:
+    return TTSDiskCache(
+        cache_dir=tmp_path,
+        index_path=tmp_path / "index.sqlite3",
+        max_bytes=limits.get("max_bytes", 1 << 20),
+        max_entries=limits.get("max_entries", 100),
+        evict_interval_s=3600,
+        on_evict=limits.get("on_evict"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_evicts_least_recently_used_by_bytes(tmp_path):
+    evicted: list[list[str]] = []
+    cache = _disk_cache(tmp_path, max_bytes=250, on_evict=evicted.append)
+    await cache.start()
+    for key in ("a", "b", "c"):
+        (tmp_path / f"{key}.mp3").write_bytes(b"\0" * 60)
+        (tmp_path / f"{key}.pcm").write_bytes(b"\0" * 40)
+        cache.record_write(key)
+        await asyncio.sleep(0.001)
+    cache.record_hit("a")
+    await cache.maintain()
+    await cache.stop()
+
+    assert evicted == [["b"]]
+    assert not (tmp_path / "b.mp3").exists() and not (tmp_path / "b.pcm").exists()
+    assert (tmp_path / "a.mp3").exists() and (tmp_path / "c.pcm").exists()
+    assert (cache.entries, cache.bytes) == (2, 200)
+
+
+@pytest.mark.asyncio
+async def test_startup_scan_keeps_temp_files_other_workers_are_writing(tmp_path):
+    (tmp_path / "a.mp3").write_bytes(b"\0" * 10)
+    in_progress = tmp_path / "b.mp3.0123.tmp"
+    stale = tmp_path / "c.mp3.4567.tmp"
+    in_progress.write_bytes(b"\0")
+    stale.write_bytes(b"\0")
+    old = time.time() - STALE_TMP_AGE_S - 60
+    os.utime(stale, (old, old))
+
+    cache = _disk_cache(tmp_path)
+    await cache.start()
+    await cache.stop()
+
+    assert in_progress.exists()
+    assert not stale.exists()
+    assert (cache.entries, cache.bytes) == (1, 10)
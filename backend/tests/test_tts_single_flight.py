@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from src.services.openai_tts_service import openai_tts_service
+from src.services.tts_cache import PcmMemoryCache
+
+
+@pytest.fixture
+def tts(monkeypatch):
+    """The TTS service with a fake upstream that counts syntheses."""
+    monkeypatch.setattr(openai_tts_service, "_memory_cache", PcmMemoryCache(1 << 20, 1 << 20))
+    monkeypatch.setattr(openai_tts_service, "_pcm_files", None)
+    monkeypatch.setattr(openai_tts_service, "_inflight", {})
+    calls: list[str] = []
+    gate = asyncio.Event()
+
+    async def _upstream(text: str):
+        calls.append(text)
+        yield b"\x01\x00" * 4
+        await gate.wait()
+        yield b"\x02\x00" * 4
+
+    monkeypatch.setattr(openai_tts_service, "_iter_uncached_pcm", _upstream)
+    openai_tts_service.calls = calls
+    openai_tts_service.gate = gate
+    yield openai_tts_service
+    del openai_tts_service.calls, openai_tts_service.gate
+
+
+async def _read(tts, text: str) -> bytes:
+    return b"".join([bytes(chunk) async for chunk in tts.iter_pcm_bytes(text)])
+
+
+@pytest.mark.asyncio
+async def test_concurrent_readers_share_one_upstream_call(tts):
+    readers = [asyncio.create_task(_read(tts, "Tell me about yourself.")) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    tts.gate.set()
+    results = await asyncio.gather(*readers)
+
+    assert tts.calls == ["Tell me about yourself."]
+    assert results == [b"\x01\x00" * 4 + b"\x02\x00" * 4] * 3
+    # The finished synthesis is served from the memory cache afterwards.
+    assert await _read(tts, "Tell me about yourself.") == results[0]
+    assert tts.calls == ["Tell me about yourself."]
+
+
+@pytest.mark.asyncio
+async def test_reader_after_an_abandoned_flight_starts_a_new_one(tts):
+    first = asyncio.create_task(_read(tts, "Why this job?"))
+    await asyncio.sleep(0.01)
+    # Barge-in: the only reader goes away, which cancels the producer, and the same
+    # phrase is asked for again in the very next step, before that cancellation has run.
+    first.cancel()
+    second = asyncio.create_task(_read(tts, "Why this job?"))
+    await asyncio.gather(first, return_exceptions=True)
+    await asyncio.sleep(0.01)
+    tts.gate.set()
+
+    assert await second == b"\x01\x00" * 4 + b"\x02\x00" * 4
+    assert tts.calls == ["Why this job?", "Why this job?"]
+
+
+@pytest.mark.asyncio
+async def test_readers_get_an_error_not_the_producers_cancellation(tts):
+    reader = asyncio.create_task(_read(tts, "Describe a hard bug."))
+    await asyncio.sleep(0.01)
+    flight = tts._inflight[tts._build_cache_key("Describe a hard bug.")]
+    flight.task.cancel()
+
+    with pytest.raises(RuntimeError, match="cancelled"):
+        await reader
+    assert not reader.cancelled()